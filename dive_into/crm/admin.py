@@ -1,6 +1,9 @@
-# -*- coding: <utf-8> -*-
+# -*- coding: utf-8 -*-
 from django.contrib import admin
-from .models import Client,Contact,Activity
+from django.shortcuts import render
+from .models import Client,Contact,Activity,OutboxMessage
+from .forms import ReassignOwnerForm
+from . import ownership
 
 
 class ContactsInline(admin.TabularInline):
@@ -11,19 +14,48 @@ class ContactsInline(admin.TabularInline):
 
 class ClientAdmin(admin.ModelAdmin):
     inlines = [ContactsInline]
-    list_display = ('name', 'loyal', 'last_activity', 'owner')
+    list_display = ('name', 'loyal', 'activity_count', 'sent_count', 'contact_count', 'last_activity', 'owner')
+    list_filter = ('loyal',)
+    actions = ['reassign_owner']
 
     def save_model(self, request, obj, form, change):
         obj.save()
-        contacts = obj.contact_set.all()
-        for i in contacts:
-                i.owner = obj.owner
-                i.save()
+        if change and 'owner' in form.changed_data:
+            ownership.reassign_clients(Client.objects.filter(pk=obj.pk), obj.owner)
 
-        activities = obj.activity_set.all()
-        for i in activities:
-                i.owner = obj.owner
-                i.save()
+    def save_formset(self, request, form, formset, change):
+        """
+        Новые контакты из inline получают владельца клиента
+        """
+        contacts = formset.save(commit=False)
+        for contact in contacts:
+            contact.owner = form.instance.owner
+            contact.save()
+        for contact in formset.deleted_objects:
+            contact.delete()
+
+    def reassign_owner(self, request, queryset):
+        """
+        Передает выбранных клиентов или все объекты их менеджеров
+        другому пользователю
+        """
+        form = ReassignOwnerForm(request.POST if 'apply' in request.POST else None)
+        if form.is_valid():
+            new_owner = form.cleaned_data['owner']
+            if form.cleaned_data['scope'] == ReassignOwnerForm.MANAGERS:
+                old_owners = set(queryset.exclude(owner=None).values_list('owner', flat=True))
+                count = ownership.reassign_owner(old_owners, new_owner)
+            else:
+                count = ownership.reassign_clients(queryset, new_owner)
+            self.message_user(request, '{} clients were reassigned to {}'.format(count, new_owner))
+            return None
+
+        return render(request, 'admin/crm/client/reassign_owner.html',
+                      {'form': form,
+                       'queryset': queryset,
+                       'opts': self.model._meta,
+                       'action_checkbox_name': admin.helpers.ACTION_CHECKBOX_NAME})
+    reassign_owner.short_description = 'Reassign owner of selected clients'
 
 
 class ContactAdmin(admin.ModelAdmin):
@@ -34,11 +66,22 @@ class ContactAdmin(admin.ModelAdmin):
 class ActivityAdmin(admin.ModelAdmin):
     list_display = ('title', 'client', 'contact', 'send_date', 'owner')
     exclude = ('owner',)
+    actions = ['send_selected']
 
+    def send_selected(self, request, queryset):
+        count = queryset.send()
+        self.message_user(request, '{} activities were sent'.format(count))
+    send_selected.short_description = 'Send selected activities'
 
-admin.site.register(Client, ClientAdmin)
-admin.site.register(Contact, ContactAdmin)
-admin.site.register(Activity, ActivityAdmin)
 
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ('activity', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'last_error')
+    list_filter = ('status',)
+    list_select_related = ('activity__client',)
+    raw_id_fields = ('activity',)
 
 
+admin.site.register(Client, ClientAdmin)
+admin.site.register(Contact, ContactAdmin)
+admin.site.register(Activity, ActivityAdmin)
+admin.site.register(OutboxMessage, OutboxMessageAdmin)
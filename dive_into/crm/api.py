@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+JSON API (версия 1) для клиентов, контактов и активностей, адреса -
+/crm/api/v1/<kind>/, где kind - clients, contacts или activities.
+
+    GET    <kind>/?cursor=&limit=    список объектов пользователя по id,
+                                     next - cursor следующей страницы
+    POST   <kind>/                   создание объекта
+    GET    <kind>/<id>/              объект
+    PUT, PATCH <kind>/<id>/          изменение (не переданные поля не меняются)
+    DELETE <kind>/<id>/              удаление
+    POST   <kind>/batch/             {"create": [...], "update": [...], "delete": [id, ...]}
+                                     в одной транзакции
+    POST   activities/<id>/send/     отправка активности
+    POST   activities/send/          {"ids": [...]} или {"all": true} - массовая отправка
+
+Объекты проверяются теми же формами, что и страницы crm (forms.py), доступны
+только объекты текущего пользователя. Авторизация - сессией, как у страниц,
+POST/PUT/PATCH/DELETE требуют заголовок X-CSRFToken. Ошибки возвращаются
+в виде {"error": "...", "errors": {...}} с кодом 400, 401, 404 или 409.
+"""
+import json
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import ProtectedError
+from django.forms.models import model_to_dict
+from django.http import JsonResponse
+from django.utils.encoding import force_text
+from django.views import generic
+
+from .models import Client, Contact, Activity, StaleObjectError
+from .forms import STALE_MESSAGE, ClientCreation, ContactCreation, ActivityCreation
+from . import search, stats, cache, importer
+
+PAGE_SIZE = getattr(settings, 'CRM_API_PAGE_SIZE', 100)
+MAX_PAGE_SIZE = getattr(settings, 'CRM_API_MAX_PAGE_SIZE', 1000)
+MAX_BATCH_SIZE = getattr(settings, 'CRM_API_MAX_BATCH_SIZE', 1000)
+
+# Модель, форма и поля ответа (имя, поле модели)
+KINDS = {
+    'clients': (Client, ClientCreation,
+                (('id', 'pk'), ('name', 'name'), ('loyal', 'loyal'), ('activity_count', 'activity_count'),
+                 ('contact_count', 'contact_count'), ('sent_count', 'sent_count'),
+                 ('last_sent_at', 'last_sent_at'), ('revision', 'revision'))),
+    'contacts': (Contact, ContactCreation,
+                 (('id', 'pk'), ('first_name', 'first_name'), ('last_name', 'last_name'), ('email', 'email'),
+                  ('phone', 'phone'), ('active', 'active'), ('client', 'client_id'), ('revision', 'revision'))),
+    'activities': (Activity, ActivityCreation,
+                   (('id', 'pk'), ('title', 'title'), ('text', 'text'), ('client', 'client_id'),
+                    ('contact', 'contact_id'), ('send_date', 'send_date'), ('revision', 'revision'))),
+}
+
+# Формы, которым нужен пользователь для списка доступных клиентов/контактов
+USER_FORMS = (ContactCreation, ActivityCreation)
+
+
+class ApiError(Exception):
+    """
+    Ошибка запроса к API, возвращается клиенту с кодом status
+    """
+    def __init__(self, message, status=400, errors=None):
+        super(ApiError, self).__init__(message)
+        self.message = message
+        self.status = status
+        self.errors = errors
+
+
+def serialize(kind, obj):
+    fields = KINDS[kind][2]
+    return dict((name, getattr(obj, field)) for name, field in fields)
+
+
+def make_form(kind, user, data, instance=None):
+    """
+    Форма kind для данных data: к данным добавляются текущие значения
+    полей объекта instance (или значения по умолчанию для нового объекта)
+    """
+    model, form_class = KINDS[kind][:2]
+    if not isinstance(data, dict):
+        raise ApiError('Object must be a JSON object')
+    values = model_to_dict(instance if instance is not None else model(), fields=form_class._meta.fields)
+    values.update(data)
+    kwargs = {'data': values, 'instance': instance}
+    if form_class in USER_FORMS:
+        kwargs['user'] = user
+    return form_class(**kwargs)
+
+
+def form_errors(form):
+    return dict((field, [force_text(message) for message in messages]) for field, messages in form.errors.items())
+
+
+def _errors(forms):
+    return dict((i, form_errors(form)) for i, form in enumerate(forms) if not form.is_valid())
+
+
+def _ids(values):
+    if not isinstance(values, list) or not all(isinstance(i, int) for i in values):
+        raise ApiError('Expected a list of ids')
+    return values
+
+
+def batch(kind, user, create=(), update=(), delete=()):
+    """
+    Создает, изменяет и удаляет объекты kind пользователя user в одной
+    транзакции. Все объекты сначала проверяются формами, при ошибках
+    ничего не записывается. Новые объекты создаются одним bulk_create
+    (индекс поиска и статистика клиентов обновляются отдельными запросами
+    на всю пачку), удаление - одним DELETE, изменение - условным UPDATE
+    каждого объекта по ревизии (см. TrackedModel)
+    """
+    model = KINDS[kind][0]
+    if not all(isinstance(values, list) for values in (create, update, delete)):
+        raise ApiError('create, update and delete must be lists')
+    if len(create) + len(update) + len(delete) > MAX_BATCH_SIZE:
+        raise ApiError('Batch is limited to {} objects'.format(MAX_BATCH_SIZE))
+    delete = _ids(delete)
+
+    update_ids = _ids([values.get('id') if isinstance(values, dict) else None for values in update])
+    objects = model.objects.for_user(user).in_bulk(update_ids)
+    missing = [i for i in update_ids if i not in objects]
+    if missing:
+        raise ApiError('Objects not found', 404, {'update': missing})
+
+    create_forms = [make_form(kind, user, values) for values in create]
+    update_forms = [make_form(kind, user, values, objects[values['id']]) for values in update]
+    errors = dict((name, errors) for name, errors in (('create', _errors(create_forms)),
+                                                      ('update', _errors(update_forms))) if errors)
+    if errors:
+        raise ApiError('Validation failed', 400, errors)
+
+    try:
+        with transaction.atomic():
+            deleted = 0
+            if delete:
+                deleted = model.objects.for_user(user).filter(pk__in=delete).delete()[1].get(
+                    model._meta.label, 0)
+            updated = [form.save() for form in update_forms]
+
+            created = []
+            if create_forms:
+                new_objects = []
+                for form in create_forms:
+                    obj = form.save(commit=False)
+                    obj.owner = user
+                    new_objects.append(obj)
+                model.objects.bulk_create(new_objects)
+                created_objects = importer.created(model, user, new_objects)
+                created = list(created_objects.order_by('pk'))
+                search.index_queryset(created_objects)
+                if model is not Client:
+                    stats.recompute(set(obj.client_id for obj in new_objects))
+                cache.bump(user.pk)
+    except ProtectedError:
+        raise ApiError('Objects are referenced by other objects and cannot be deleted', 409)
+    except StaleObjectError:
+        raise ApiError(STALE_MESSAGE, 409)
+    except IntegrityError as error:
+        raise ApiError(force_text(error), 409)
+
+    return {'created': [serialize(kind, obj) for obj in created],
+            'updated': [serialize(kind, obj) for obj in updated],
+            'deleted': deleted}
+
+
+class ApiView(generic.View):
+    """
+    Базовое представление API: проверка авторизации, разбор тела запроса
+    и перевод ApiError в json ответ
+    """
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated():
+            return JsonResponse({'error': 'Authentication required'}, status=401)
+        try:
+            return super(ApiView, self).dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            content = {'error': error.message}
+            if error.errors is not None:
+                content['errors'] = error.errors
+            return JsonResponse(content, status=error.status)
+
+    def body(self):
+        try:
+            return json.loads(self.request.body.decode('utf-8') or '{}')
+        except ValueError:
+            raise ApiError('Request body is not valid JSON')
+
+    def queryset(self, kind):
+        return KINDS[kind][0].objects.for_user(self.request.user)
+
+
+class ObjectList(ApiView):
+    def get(self, request, kind):
+        fields = KINDS[kind][2]
+        try:
+            limit = min(int(request.GET.get('limit', PAGE_SIZE)), MAX_PAGE_SIZE)
+            cursor = int(request.GET.get('cursor', 0))
+        except ValueError:
+            raise ApiError('cursor and limit must be integers')
+        if limit <= 0:
+            raise ApiError('limit must be positive')
+
+        # Страница выбирается по id > cursor, без OFFSET, как в exporter.py
+        values = self.queryset(kind).filter(pk__gt=cursor).order_by('pk').values_list(
+            *[field for name, field in fields])
+        rows = list(values[:limit + 1])
+        results = [dict(zip([name for name, field in fields], row)) for row in rows[:limit]]
+        return JsonResponse({'results': results,
+                             'next': results[-1]['id'] if len(rows) > limit else None})
+
+    def post(self, request, kind):
+        form = make_form(kind, request.user, self.body())
+        if not form.is_valid():
+            raise ApiError('Validation failed', 400, form_errors(form))
+        obj = form.save(commit=False)
+        obj.owner = request.user
+        obj.save()
+        return JsonResponse(serialize(kind, obj), status=201)
+
+
+class ObjectDetail(ApiView):
+    http_method_names = ['get', 'put', 'patch', 'delete']
+
+    def get_object(self, kind, pk):
+        obj = self.queryset(kind).filter(pk=pk).first()
+        if obj is None:
+            raise ApiError('Object not found', 404)
+        return obj
+
+    def get(self, request, kind, pk):
+        return JsonResponse(serialize(kind, self.get_object(kind, pk)))
+
+    def put(self, request, kind, pk):
+        form = make_form(kind, request.user, self.body(), self.get_object(kind, pk))
+        if not form.is_valid():
+            raise ApiError('Validation failed', 400, form_errors(form))
+        try:
+            obj = form.save()
+        except StaleObjectError:
+            raise ApiError(STALE_MESSAGE, 409)
+        return JsonResponse(serialize(kind, obj))
+
+    patch = put
+
+    def delete(self, request, kind, pk):
+        try:
+            self.get_object(kind, pk).delete()
+        except ProtectedError:
+            raise ApiError('Object is referenced by other objects and cannot be deleted', 409)
+        return JsonResponse({'deleted': 1})
+
+
+class Batch(ApiView):
+    http_method_names = ['post']
+
+    def post(self, request, kind):
+        data = self.body()
+        if not isinstance(data, dict):
+            raise ApiError('Request body must be a JSON object')
+        return JsonResponse(batch(kind, request.user, data.get('create', []),
+                                  data.get('update', []), data.get('delete', [])))
+
+
+class SendActivity(ApiView):
+    http_method_names = ['post']
+
+    def post(self, request, pk):
+        activities = self.queryset('activities').filter(pk=pk)
+        if not activities.send() and not activities.exists():
+            raise ApiError('Object not found', 404)
+        return JsonResponse(serialize('activities', activities.get()))
+
+
+class SendActivities(ApiView):
+    http_method_names = ['post']
+
+    def post(self, request):
+        data = self.body()
+        if not isinstance(data, dict):
+            raise ApiError('Request body must be a JSON object')
+        activities = self.queryset('activities')
+        if data.get('all'):
+            return JsonResponse({'sent': activities.send()})
+        return JsonResponse({'sent': activities.send_selected(_ids(data.get('ids', [])))})
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class CrmConfig(AppConfig):
+    name = 'crm'
+
+    def ready(self):
+        # Подключаем обработчики сигналов моделей
+        from . import signals
+        # PRAGMA для каждого нового соединения SQLite
+        from . import sqlite
+        connection_created.connect(sqlite.configure, dispatch_uid='crm.sqlite.configure')
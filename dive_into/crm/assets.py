@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Сборка статических файлов crm в два бандла: crm/dist/crm.css и crm/dist/crm.js.
+
+В бандлы входят библиотеки из crm/static/crm/vendor (jQuery, Bootstrap,
+DataTables) и собственные style.css и java_code.js. Файлы читаются через
+staticfiles finders, относительные url() в CSS пересчитываются от каталога
+бандла, комментарии sourceMappingURL удаляются. Собственные файлы
+минифицируются rcssmin/rjsmin (библиотеки уже минифицированы), без них
+бандл собирается без минификации.
+
+Бандлы собираются командой build_assets и хранятся в репозитории, хэши
+в именах и сжатые копии добавляет при collectstatic хранилище
+crm.storage.CompressedManifestStaticFilesStorage.
+"""
+import os
+import posixpath
+import re
+
+from django.apps import apps
+from django.contrib.staticfiles import finders
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+# Имя бандла -> исходные файлы (пути staticfiles) в порядке подключения
+BUNDLES = (
+    ('crm/dist/crm.css', (
+        'crm/vendor/bootstrap/css/bootstrap.min.css',
+        'crm/vendor/bootstrap/css/bootstrap-theme.min.css',
+        'crm/vendor/datatables/css/jquery.dataTables.min.css',
+        'crm/style.css',
+    )),
+    ('crm/dist/crm.js', (
+        'crm/vendor/jquery/jquery.min.js',
+        'crm/vendor/bootstrap/js/bootstrap.min.js',
+        'crm/vendor/datatables/js/jquery.dataTables.min.js',
+        'crm/vendor/datatables/js/dataTables.bootstrap.min.js',
+        'crm/java_code.js',
+    )),
+)
+
+URL_RE = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+SOURCE_MAP_RE = re.compile(r'/[*/]# sourceMappingURL=\S+(?: \*/)?')
+
+
+def output_root():
+    return os.path.join(apps.get_app_config('crm').path, 'static')
+
+
+def _read(path):
+    found = finders.find(path)
+    if not found:
+        raise IOError('Static file {} was not found'.format(path))
+    with open(found, 'rb') as source:
+        return source.read().decode('utf-8')
+
+
+def _rebase_urls(content, source, bundle):
+    """
+    Пересчитывает относительные url() файла source для бандла bundle
+    """
+    source_dir, bundle_dir = posixpath.dirname(source), posixpath.dirname(bundle)
+
+    def rebase(match):
+        quote, url = match.groups()
+        if re.match(r'^(data:|[a-z]+://|//|/|#)', url):
+            return match.group(0)
+        target = posixpath.normpath(posixpath.join(source_dir, url))
+        return u'url({0}{1}{0})'.format(quote, posixpath.relpath(target, bundle_dir))
+    return URL_RE.sub(rebase, content)
+
+
+def _minify(content, path):
+    if path.endswith('.min.css') or path.endswith('.min.js'):
+        return content
+    if path.endswith('.css') and rcssmin:
+        return rcssmin.cssmin(content)
+    if path.endswith('.js') and rjsmin:
+        return rjsmin.jsmin(content)
+    return content
+
+
+def build_bundle(name, sources):
+    """
+    Содержимое бандла name из файлов sources
+    """
+    parts = []
+    for path in sources:
+        content = SOURCE_MAP_RE.sub(u'', _read(path))
+        if name.endswith('.css'):
+            content = _rebase_urls(content, path, name)
+        parts.append(_minify(content, path).strip())
+    # ";" между скриптами - на случай файла без завершающей точки с запятой
+    separator = u'\n' if name.endswith('.css') else u'\n;\n'
+    return separator.join(parts) + u'\n'
+
+
+def build(check=False):
+    """
+    Собирает все бандлы в crm/static, возвращает список пар (имя, размер).
+    check=True - только сравнивает с существующими файлами, возвращает
+    список устаревших бандлов
+    """
+    result = []
+    for name, sources in BUNDLES:
+        content = build_bundle(name, sources).encode('utf-8')
+        path = os.path.join(output_root(), *name.split('/'))
+        if check:
+            current = open(path, 'rb').read() if os.path.exists(path) else None
+            if current != content:
+                result.append((name, len(content)))
+            continue
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as output:
+            output.write(content)
+        result.append((name, len(content)))
+    return result
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Измерение страниц crm на синтетических данных разного объема
+(команда run_benchmark).
+
+Для каждого масштаба (количество клиентов пользователя) во временной
+тестовой базе создаются данные (seed.py) и каждый адрес ENDPOINTS
+запрашивается repeat раз через тестовый клиент Django от имени владельца
+данных. Для адреса записываются перцентили времени ответа, количество
+запросов к базе и их время (querycount.py) и пиковый размер памяти
+процесса, рядом - бюджет запросов страницы (settings.CRM_QUERY_BUDGETS).
+По умолчанию кэш страниц сбрасывается перед каждым запросом, чтобы
+измерялась работа с базой, а не попадания в кэш; ответ 200 без запросов
+к базе в этом режиме означает, что запросы не были учтены, и прогон
+прерывается MeasurementError.
+"""
+import datetime
+import math
+import platform
+import resource
+import time
+
+import django
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test import Client as TestClient
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from .models import Client, Contact, Activity
+from . import seed, querycount, cache
+
+# Имя, адрес url (с kwargs), параметры GET; {client}, {contact},
+# {activity} - id первого объекта пользователя
+ENDPOINTS = (
+    ('main', 'crm:main', {}, {}),
+    ('search', 'crm:main', {}, {'search': 'alpha bravo'}),
+    ('clients', 'crm:clients', {}, {}),
+    ('clients data', 'crm:clients_data', {}, {'start': 0, 'length': 10, 'order[0][column]': 0}),
+    ('contacts', 'crm:contacts', {}, {}),
+    ('contacts data', 'crm:contacts_data', {}, {'start': 0, 'length': 10, 'search[value]': 'alpha'}),
+    ('activities', 'crm:activities', {}, {}),
+    ('activities data', 'crm:activities_data', {}, {'start': 0, 'length': 10, 'order[0][column]': 3}),
+    ('client', 'crm:client', {'pk': '{client}'}, {}),
+    ('contact', 'crm:contact', {'pk': '{contact}'}, {}),
+    ('activity', 'crm:activity', {'pk': '{activity}'}, {}),
+    ('new client', 'crm:new_client', {}, {}),
+    ('new contact', 'crm:new_contact', {}, {}),
+    ('new activity', 'crm:new_activity', {}, {}),
+    ('lookup clients', 'crm:lookup_clients', {}, {'q': 'seed'}),
+    ('lookup contacts', 'crm:lookup_contacts', {}, {'client': '{client}'}),
+    ('api clients', 'crm:api_list', {'kind': 'clients'}, {}),
+    ('api activities', 'crm:api_list', {'kind': 'activities'}, {}),
+    ('export clients', 'crm:export', {'kind': 'clients'}, {}),
+)
+
+
+class MeasurementError(Exception):
+    """
+    Результат измерения недостоверен (например, не учтены запросы к базе)
+    """
+    pass
+
+
+def percentile(values, percent):
+    """
+    Перцентиль percent (0-100) списка values методом ближайшего ранга
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = int(math.ceil(percent / 100.0 * len(values)))
+    return values[max(rank, 1) - 1]
+
+
+def peak_memory_kb():
+    """
+    Пиковый размер памяти процесса (ru_maxrss, на Linux - в килобайтах)
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _format(value, ids):
+    return value.format(**ids) if isinstance(value, str) else value
+
+
+def measure(client, name, url, data, repeat, cold=True, budget=None):
+    """
+    Запрашивает url repeat раз, возвращает словарь с результатами
+    """
+    timings, queries, query_time, statuses = [], [], [], set()
+    for i in range(repeat):
+        if cold:
+            cache.invalidate_all()
+        with querycount.report() as report:
+            start = time.time()
+            response = client.get(url, data)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            timings.append((time.time() - start) * 1000)
+        if cold and response.status_code == 200 and not report.count:
+            raise MeasurementError('{} ({}): no queries recorded for a response built '
+                                   'without the page cache'.format(name, url))
+        queries.append(report.count)
+        query_time.append(report.time * 1000)
+        statuses.add(response.status_code)
+
+    return {
+        'name': name,
+        'url': url,
+        'requests': repeat,
+        'status': sorted(statuses),
+        'ms': {
+            'min': round(min(timings), 3),
+            'mean': round(sum(timings) / len(timings), 3),
+            'p50': round(percentile(timings, 50), 3),
+            'p95': round(percentile(timings, 95), 3),
+            'p99': round(percentile(timings, 99), 3),
+            'max': round(max(timings), 3),
+        },
+        'queries': max(queries),
+        'query_budget': budget,
+        'query_ms': round(sum(query_time) / len(query_time), 3),
+        'peak_memory_kb': peak_memory_kb(),
+    }
+
+
+def run_scale(clients, contacts, activities, repeat, sent_ratio=0.5, cold=True, on_result=None):
+    """
+    Создает пользователя с clients клиентов и измеряет все ENDPOINTS
+    """
+    started = time.time()
+    prefix = 'bench{}x'.format(clients)
+    result = seed.seed(1, clients, contacts, activities, sent_ratio, prefix=prefix)
+    seed_seconds = time.time() - started
+    owner = seed.get_users(1, prefix)[0][0]
+
+    ids = {}
+    for key, model in (('client', Client), ('contact', Contact), ('activity', Activity)):
+        ids[key] = model.objects.for_user(owner).order_by('pk').values_list('pk', flat=True).first()
+
+    client = TestClient()
+    client.force_login(owner)
+    endpoints = []
+    for name, url_name, kwargs, data in ENDPOINTS:
+        url = reverse(url_name, kwargs=dict((key, _format(value, ids)) for key, value in kwargs.items()))
+        data = dict((key, _format(value, ids)) for key, value in data.items())
+        endpoint = measure(client, name, url, data, repeat, cold, querycount.budget(url_name))
+        endpoints.append(endpoint)
+        if on_result:
+            on_result(endpoint)
+
+    return {
+        'clients': clients,
+        'contacts_per_client': contacts,
+        'activities_per_contact': activities,
+        'objects': result.as_dict(),
+        'seed_seconds': round(seed_seconds, 3),
+        'endpoints': endpoints,
+    }
+
+
+def run(scales, contacts, activities, repeat, sent_ratio=0.5, cold=True, on_result=None, keepdb=False):
+    """
+    Прогон всех масштабов scales во временной тестовой базе, результат -
+    словарь для сохранения в json
+    """
+    setup_test_environment()
+    runner = DiscoverRunner(verbosity=0, interactive=False, keepdb=keepdb)
+    old_config = runner.setup_databases()
+    try:
+        results = [run_scale(clients, contacts, activities, repeat, sent_ratio, cold, on_result)
+                   for clients in scales]
+    finally:
+        runner.teardown_databases(old_config)
+        teardown_test_environment()
+
+    return {
+        'created_at': datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'repeat': repeat,
+        'cold_cache': cold,
+        'scales': results,
+    }
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Кэш страниц crm по владельцу данных.
+
+Для каждого владельца в кэше хранится счетчик поколения, он входит в ключ
+всех закэшированных страниц владельца. Любое изменение клиентов, контактов
+и активностей владельца увеличивает счетчик (сигналы - см. signals.py,
+массовые изменения вызывают bump/bump_queryset явно), после чего старые
+записи больше не используются и вытесняются самим кэшем.
+
+Бэкенд задается псевдонимом CRM_CACHE из settings.CACHES (locmem, файлы,
+memcached). Количество попаданий и промахов хранится в том же кэше.
+Счетчики поколений должны быть общими для всех процессов сервера: в locmem
+у каждого процесса свои, и изменение сбрасывает кэш только процесса,
+который его выполнил (см. is_shared, settings.CRM_PAGE_CACHE).
+
+Кроме того, страницы отвечают на условные GET запросы браузера
+(ConditionalPage): ETag и Last-Modified строятся по количеству объектов
+владельца и MAX(updated_at), неизменившаяся страница отдается ответом 304.
+
+В ETag и ключи страниц входит версия развертывания (release): после
+обновления шаблонов или статических файлов браузер и кэш не должны
+отдавать старый html со ссылками на бандлы, которых уже нет.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+ALIAS = getattr(settings, 'CRM_CACHE', 'default')
+PREFIX = 'crm'
+HITS = PREFIX + ':hits'
+MISSES = PREFIX + ':misses'
+
+
+def backend():
+    return caches[ALIAS]
+
+
+def is_shared():
+    """
+    Видят ли все процессы одни и те же поколения (не locmem)
+    """
+    return not isinstance(backend(), LocMemCache)
+
+
+def _generation_key(owner_id=None):
+    return '{}:gen:{}'.format(PREFIX, 'all' if owner_id is None else owner_id)
+
+
+def generation(owner_id=None):
+    """
+    Текущее поколение данных владельца (owner_id=None - общее поколение)
+    """
+    key = _generation_key(owner_id)
+    value = backend().get(key)
+    if value is None:
+        # Начальное значение от времени: после вытеснения счетчика из кэша
+        # старые ключи не совпадут с новыми
+        value = int(time.time() * 1000)
+        if not backend().add(key, value, None):
+            value = backend().get(key, value)
+    return value
+
+
+def _incr(key, initial):
+    try:
+        return backend().incr(key)
+    except ValueError:
+        backend().add(key, initial, None)
+        return initial
+
+
+def _bump(owner_ids):
+    for owner_id in owner_ids:
+        _incr(_generation_key(owner_id), int(time.time() * 1000))
+
+
+def bump(*owner_ids):
+    """
+    Увеличивает поколение владельцев owner_ids, их закэшированные страницы
+    больше не используются. Внутри транзакции поколение увеличивается еще раз
+    после ее фиксации: до фиксации параллельный запрос видит старые данные,
+    и страница, построенная по ним под новым поколением, осталась бы в кэше.
+    Первое увеличение нужно запросам той же транзакции, которые уже видят
+    изменения
+    """
+    owner_ids = set(owner_id for owner_id in owner_ids if owner_id is not None)
+    if owner_ids:
+        _bump(owner_ids)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: _bump(owner_ids))
+
+
+def bump_queryset(queryset):
+    """
+    Увеличивает поколение всех владельцев объектов queryset,
+    вызывается перед массовыми изменениями (update), не вызывающими сигналы.
+    Владельцы выбираются сразу, до изменения (см. bump)
+    """
+    bump(*queryset.order_by().values_list('owner', flat=True).distinct())
+
+
+def invalidate_all():
+    """
+    Сбрасывает кэш страниц всех владельцев
+    """
+    _incr(_generation_key(), int(time.time() * 1000))
+
+
+def counters():
+    """
+    Количество попаданий и промахов кэша страниц
+    """
+    values = backend().get_many([HITS, MISSES])
+    return {'hits': values.get(HITS, 0), 'misses': values.get(MISSES, 0)}
+
+
+def reset_counters():
+    backend().delete_many([HITS, MISSES])
+
+
+def _digest(*parts):
+    return hashlib.md5(u'\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def release():
+    """
+    Версия развертывания: settings.CRM_RELEASE (задается при развертывании,
+    например ревизия кода) и манифест статических файлов (у хранилища
+    с хэшами в именах он меняется вместе с адресами бандлов)
+    """
+    manifest = getattr(staticfiles_storage, 'hashed_files', None) or {}
+    return _digest(getattr(settings, 'CRM_RELEASE', ''),
+                   *[u'{}={}'.format(name, manifest[name]) for name in sorted(manifest)])
+
+
+def page_keys(request):
+    """
+    Ключи страницы: владелец, поколения и путь с параметрами; второй ключ -
+    для страниц с формами, в него входит и CSRF cookie (в странице записан
+    токен этой cookie)
+    """
+    owner_id = request.user.pk
+    base = '{}:page:{}:{}:{}:{}'.format(PREFIX, owner_id, generation(), generation(owner_id), release())
+    path = request.get_full_path()
+    csrf = request.COOKIES.get(settings.CSRF_COOKIE_NAME, '')
+    return ['{}:{}'.format(base, _digest(path)), '{}:{}'.format(base, _digest(path, csrf))]
+
+
+def cached_response(request, render):
+    """
+    Отдает страницу request из кэша или строит ее функцией render и
+    сохраняет в кэш, если это успешный не потоковый ответ
+    """
+    keys = page_keys(request)
+    cached = backend().get_many(keys)
+    for key in keys:
+        if key in cached:
+            _incr(HITS, 1)
+            content, content_type = cached[key]
+            return HttpResponse(content, content_type=content_type)
+
+    _incr(MISSES, 1)
+    response = render()
+    if response.status_code != 200 or response.streaming:
+        return response
+    if hasattr(response, 'render'):
+        response.render()
+    if request.META.get('CSRF_COOKIE_USED'):
+        if settings.CSRF_COOKIE_NAME not in request.COOKIES:
+            # Токен выдан вместе с новой cookie, такую страницу кэшировать нельзя
+            return response
+        key = keys[1]
+    else:
+        key = keys[0]
+    backend().set(key, (response.content, response['Content-Type']))
+    return response
+
+
+class CachedPage(object):
+    """
+    Примесь к представлениям: GET запросы авторизованного пользователя
+    отдаются из кэша до изменения его данных. cache_session_keys - ключи
+    сессии с одноразовыми сообщениями, при их наличии кэш не используется.
+    settings.CRM_PAGE_CACHE=False отключает кэш всех страниц
+    """
+    cache_enabled = True
+    cache_session_keys = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        parent = super(CachedPage, self).dispatch
+        if not self.cache_enabled or not getattr(settings, 'CRM_PAGE_CACHE', True) \
+                or request.method != 'GET' or not request.user.is_authenticated() \
+                or any(request.session.get(key) not in (None, '') for key in self.cache_session_keys):
+            return parent(request, *args, **kwargs)
+        return cached_response(request, lambda: parent(request, *args, **kwargs))
+
+
+def data_state(user, models):
+    """
+    Количество объектов пользователя и MAX(updated_at) по каждой модели
+    models, один запрос по индексу (owner, updated_at) на модель
+    """
+    return [model.objects.for_user(user).aggregate(count=Count('pk'), updated=Max('updated_at'))
+            for model in models]
+
+
+class ConditionalPage(object):
+    """
+    Примесь к представлениям: условные GET запросы (If-None-Match,
+    If-Modified-Since) авторизованного пользователя. ETag и Last-Modified
+    вычисляются по data_state моделей conditional_models, при совпадении
+    отдается 304 без выборки строк и построения шаблона. Браузеру
+    предлагается проверять страницу при каждом обращении (no-cache).
+
+    Удаление объекта меняет количество, а значит ETag, но не Last-Modified,
+    если удален не последний измененный объект. Так и задумано: браузеры
+    отправляют If-None-Match вместе с If-Modified-Since, и Django проверяет
+    ETag первым; клиент, отправляющий только If-Modified-Since, получит 304
+    до следующего изменения
+    """
+    conditional_enabled = True
+    conditional_models = ()
+    cache_session_keys = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        parent = super(ConditionalPage, self).dispatch
+        if not self.conditional_enabled or request.method not in ('GET', 'HEAD') \
+                or not request.user.is_authenticated() \
+                or any(request.session.get(key) not in (None, '') for key in self.cache_session_keys):
+            return parent(request, *args, **kwargs)
+
+        state = data_state(request.user, self.conditional_models)
+        updated = [values['updated'] for values in state if values['updated']]
+        last_modified = max(updated) if updated else None
+        # В страницу с формой записан токен CSRF cookie, поэтому cookie входит в ETag
+        etag = _digest(str(request.user.pk), request.get_full_path(), release(),
+                       request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+                       *[u'{}:{}'.format(values['count'], values['updated']) for values in state])
+
+        response = condition(etag_func=lambda *a, **k: etag,
+                             last_modified_func=lambda *a, **k: last_modified)(parent)(request, *args, **kwargs)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Потоковая выгрузка клиентов, контактов и активностей владельца в CSV или
+JSON Lines.
+
+Объекты читаются пачками по CHUNK_SIZE с условием id > последний
+выгруженный id (без OFFSET), поля связанных клиента и контакта выбираются
+тем же запросом, поэтому выгрузка начинается сразу и занимает
+ограниченную память при любом количестве объектов.
+"""
+import csv
+import json
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import six, timezone
+
+from .models import Client, Contact, Activity
+
+CHUNK_SIZE = getattr(settings, 'CRM_EXPORT_CHUNK_SIZE', 2000)
+FORMATS = {'csv': 'text/csv; charset=utf-8', 'jsonl': 'application/x-ndjson; charset=utf-8'}
+
+# Модель, выгружаемые поля (заголовок, поле queryset) и поле для фильтра по датам
+KINDS = {
+    'clients': (Client, (('id', 'pk'), ('name', 'name'), ('loyal', 'loyal'),
+                         ('activity_count', 'activity_count'), ('contact_count', 'contact_count'),
+                         ('last_sent_at', 'last_sent_at')), 'last_sent_at'),
+    'contacts': (Contact, (('id', 'pk'), ('first_name', 'first_name'), ('last_name', 'last_name'),
+                           ('email', 'email'), ('phone', 'phone'), ('active', 'active'),
+                           ('client', 'client__name')), None),
+    'activities': (Activity, (('id', 'pk'), ('title', 'title'), ('text', 'text'), ('send_date', 'send_date'),
+                              ('client', 'client__name'), ('contact', 'contact__email')), 'send_date'),
+}
+
+
+def queryset(kind, owner, date_from=None, date_to=None):
+    """
+    Объекты владельца owner, для клиентов и активностей - с датой
+    (last_sent_at/send_date) в интервале [date_from, date_to] включительно
+    """
+    model, fields, date_field = KINDS[kind]
+    objects = model.objects.for_user(owner)
+    if date_field and date_from:
+        start = timezone.make_aware(datetime.combine(date_from, time.min))
+        objects = objects.filter(**{date_field + '__gte': start})
+    if date_field and date_to:
+        end = timezone.make_aware(datetime.combine(date_to + timedelta(days=1), time.min))
+        objects = objects.filter(**{date_field + '__lt': end})
+    return objects
+
+
+def rows(objects, fields, chunk_size=CHUNK_SIZE):
+    """
+    Кортежи значений fields для всех объектов queryset, пачками по chunk_size
+    """
+    values = objects.order_by('pk').values_list(*fields)
+    last = None
+    while True:
+        chunk = values.filter(pk__gt=last) if last is not None else values
+        chunk = list(chunk[:chunk_size])
+        for row in chunk:
+            yield row
+        if len(chunk) < chunk_size:
+            break
+        last = chunk[-1][0]
+
+
+def _value(value):
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat() if timezone.is_aware(value) else value.isoformat()
+    return value
+
+
+class Echo(object):
+    """
+    Файл для csv.writer, возвращающий записанную строку
+    """
+    def write(self, value):
+        return value
+
+
+def _csv_lines(header, values):
+    writer = csv.writer(Echo())
+    yield writer.writerow(header)
+    if six.PY3:
+        for row in values:
+            yield writer.writerow(['' if value is None else _value(value) for value in row])
+    else:
+        for row in values:
+            yield writer.writerow([u'' if value is None else six.text_type(_value(value)).encode('utf-8')
+                                   for value in row])
+
+
+def _jsonl_lines(header, values):
+    for row in values:
+        yield json.dumps(dict(zip(header, map(_value, row))), cls=DjangoJSONEncoder, ensure_ascii=False) + u'\n'
+
+
+def export(kind, owner, fmt='csv', date_from=None, date_to=None, chunk_size=CHUNK_SIZE):
+    """
+    Генератор строк выгрузки kind ('clients', 'contacts', 'activities')
+    владельца owner в формате fmt ('csv', 'jsonl')
+    """
+    model, fields, date_field = KINDS[kind]
+    header = [name for name, field in fields]
+    values = rows(queryset(kind, owner, date_from, date_to), [field for name, field in fields], chunk_size)
+    lines = _csv_lines(header, values) if fmt == 'csv' else _jsonl_lines(header, values)
+    for line in lines:
+        yield line.encode('utf-8') if isinstance(line, six.text_type) else line
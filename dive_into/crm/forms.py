@@ -1,12 +1,70 @@
 # coding=utf-8
 from django import forms
+from django.contrib.auth.models import User
+from django.core.urlresolvers import reverse
+from django.utils.encoding import force_text
 from .models import Client, Contact, Activity
 
+STALE_MESSAGE = "This object was changed by someone else, reload the page and try again"
 
-class ContactCreation(forms.ModelForm):
+
+class LookupSelect(forms.Select):
+    """
+    Select для ModelChoiceField, в котором выводится только выбранный
+    вариант, остальные java_code.js загружает по адресу lookup (json):
+    постранично по введенному тексту или, если задан depends_on,
+    по значению поля формы depends_on
+    """
+    def __init__(self, lookup, depends_on=None, attrs=None):
+        super(LookupSelect, self).__init__(attrs)
+        self.lookup = lookup
+        self.depends_on = depends_on
+
+    def render(self, name, value, attrs=None):
+        attrs = dict(attrs or {}, **{'data-lookup': reverse(self.lookup)})
+        if self.depends_on:
+            attrs['data-depends-on'] = self.depends_on
+        return super(LookupSelect, self).render(name, value, attrs)
+
+    def render_options(self, selected_choices):
+        selected_choices = set(force_text(v) for v in selected_choices)
+        field = self.choices.field
+        output = [self.render_option(selected_choices, '', field.empty_label)]
+        ids = [v for v in selected_choices if v.isdigit()]
+        if ids:
+            for obj in self.choices.queryset.filter(pk__in=ids):
+                output.append(self.render_option(selected_choices, *self.choices.choice(obj)))
+        return u'\n'.join(output)
+
+
+class RevisionForm(forms.ModelForm):
+    """
+    Форма редактирования с проверкой ревизии: revision объекта передается
+    скрытым полем, сохранение устаревших данных не выполняется
+    (см. TrackedModel). Без поля revision проверяется ревизия на момент
+    загрузки объекта
+    """
+    revision = forms.IntegerField(widget=forms.HiddenInput, required=False)
+
+    def __init__(self, *args, **kwargs):
+        super(RevisionForm, self).__init__(*args, **kwargs)
+        self.initial['revision'] = self.instance.revision
+
+    def clean(self):
+        cleaned_data = super(RevisionForm, self).clean()
+        revision = cleaned_data.get('revision')
+        if self.instance.pk and revision is not None:
+            if revision != self.instance.revision:
+                raise forms.ValidationError(STALE_MESSAGE)
+        return cleaned_data
+
+
+class ContactCreation(RevisionForm):
     def __init__(self, user=None, *args, **kwargs):
         super(ContactCreation, self).__init__(*args, **kwargs)
-        self.fields['client'].queryset = Client.objects.filter(owner=user)
+        # Наследник может исключить поле client (см. ContactImport)
+        if 'client' in self.fields:
+            self.fields['client'].queryset = Client.objects.for_user(user)
 
     class Meta:
         model = Contact
@@ -18,27 +76,32 @@ class ContactCreation(forms.ModelForm):
                   'client',
                   'active')
 
+        widgets = {
+            'client': LookupSelect('crm:lookup_clients'),
+        }
+
 
-class ClientCreation(forms.ModelForm):
+class ClientCreation(RevisionForm):
 
     class Meta:
         model = Client
         fields = ('name', 'loyal')
 
 
-class ActivityCreation(forms.ModelForm):
+class ActivityCreation(RevisionForm):
     def __init__(self, user=None, *args, **kwargs):
         super(ActivityCreation, self).__init__(*args, **kwargs)
         self.user = user
-        user_clients = Client.objects.filter(owner=self.user)
-        self.fields['client'].queryset = user_clients
-        self.fields['contact'].queryset = Contact.objects.filter(client__in=user_clients)
+        # Выбранные id проверяются одним запросом по владельцу, список
+        # вариантов в форму не выводится (см. LookupSelect)
+        self.fields['client'].queryset = Client.objects.for_user(self.user)
+        self.fields['contact'].queryset = Contact.objects.for_user(self.user)
 
     def clean(self):
         super(ActivityCreation, self).clean()
         form_data = self.cleaned_data
         if all((form_data.get('client', ''), form_data.get('contact', ''))) \
-                and form_data['client'] != form_data['contact'].client:
+                and form_data['client'].pk != form_data['contact'].client_id:
 
             del form_data['contact']
             del form_data['client']
@@ -56,5 +119,54 @@ class ActivityCreation(forms.ModelForm):
 
         widgets = {
             'text': forms.Textarea(),
+            'client': LookupSelect('crm:lookup_clients'),
+            'contact': LookupSelect('crm:lookup_contacts', depends_on='client'),
         }
 
+
+
+class ReassignOwnerForm(forms.Form):
+    """
+    Форма действия администратора "Reassign owner"
+    """
+    SELECTED = 'selected'
+    MANAGERS = 'managers'
+
+    owner = forms.ModelChoiceField(queryset=User.objects.all(), label='New owner')
+    scope = forms.ChoiceField(choices=((SELECTED, 'Selected clients with their contacts and activities'),
+                                       (MANAGERS, 'Everything owned by the managers of selected clients')),
+                              initial=SELECTED, widget=forms.RadioSelect)
+
+
+class ClientImport(ClientCreation):
+    """
+    Проверка клиента из строки импорта. Уникальность имени проверяет сам
+    импорт по словарю имен клиентов, без запроса к базе на каждую строку
+    """
+    def validate_unique(self):
+        pass
+
+
+class ContactImport(ContactCreation):
+    """
+    Проверка контакта из строки импорта, клиент определяется импортом
+    по имени, поэтому поле client в форме не используется
+    """
+    class Meta(ContactCreation.Meta):
+        fields = tuple(field for field in ContactCreation.Meta.fields if field != 'client')
+
+
+class ImportForm(forms.Form):
+    """
+    Форма загрузки CSV файла с клиентами и контактами
+    """
+    file = forms.FileField(label='CSV file')
+
+
+class ExportForm(forms.Form):
+    """
+    Параметры выгрузки: формат и интервал дат отправки
+    """
+    format = forms.ChoiceField(choices=(('csv', 'CSV'), ('jsonl', 'JSON Lines')), required=False)
+    date_from = forms.DateField(required=False)
+    date_to = forms.DateField(required=False)
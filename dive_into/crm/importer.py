@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Потоковый импорт клиентов и контактов из CSV.
+
+Первая строка файла - заголовок со столбцами COLUMNS (client обязателен,
+остальные столбцы можно опустить). Строка без данных контакта создает
+только клиента, строка с данными контакта - контакт у клиента client,
+клиент создается, если его еще нет.
+
+Файл читается построчно, каждая строка проверяется правилами форм
+ClientImport/ContactImport, клиенты определяются по уникальному имени через
+словарь в памяти. Объекты записываются bulk_create пачками по batch_size,
+каждая пачка - в своей транзакции вместе с обновлением поискового индекса
+и статистики клиентов, поэтому память не зависит от размера файла
+(кроме словаря имен клиентов).
+"""
+import csv
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import six
+
+from .models import Client, Contact
+from .forms import ClientImport, ContactImport
+from . import search, stats, cache
+
+COLUMNS = ('client', 'loyal', 'first_name', 'last_name', 'email', 'phone', 'active')
+CONTACT_COLUMNS = ('first_name', 'last_name', 'email', 'phone')
+TRUE_VALUES = ('1', 'true', 'yes', 'y', 'on')
+
+BATCH_SIZE = getattr(settings, 'CRM_IMPORT_BATCH_SIZE', 500)
+MAX_ERRORS = getattr(settings, 'CRM_IMPORT_MAX_ERRORS', 100)
+
+
+class CsvImportError(ValueError):
+    """
+    Файл не может быть импортирован целиком (например, нет заголовка)
+    """
+    pass
+
+
+def read_rows(fileobj):
+    """
+    Построчно читает CSV из файла (байты в UTF-8 или текст), возвращает
+    пары (номер строки, список значений), вместо значений строки не в UTF-8
+    возвращается None
+    """
+    if six.PY3:
+        lines = (line.decode('utf-8-sig') if isinstance(line, bytes) else line for line in fileobj)
+        reader = csv.reader(lines)
+        for row in reader:
+            yield reader.line_num, row
+    else:
+        lines = (line.encode('utf-8') if isinstance(line, six.text_type) else line for line in fileobj)
+        reader = csv.reader(lines)
+        for row in reader:
+            try:
+                yield reader.line_num, [value.decode('utf-8') for value in row]
+            except UnicodeDecodeError:
+                yield reader.line_num, None
+
+
+def _bool(value, default):
+    value = value.strip().lower()
+    if not value:
+        return 'on' if default else ''
+    return 'on' if value in TRUE_VALUES else ''
+
+
+class Result(object):
+    """
+    Итог импорта: количество строк и созданных объектов, ошибки по строкам
+    (в errors сохраняются только первые MAX_ERRORS)
+    """
+    def __init__(self):
+        self.rows = 0
+        self.clients = 0
+        self.contacts = 0
+        self.error_count = 0
+        self.errors = []
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((line, message))
+
+
+class Importer(object):
+    """
+    Импорт от имени владельца owner. on_error(line, message) вызывается
+    для каждой строки с ошибкой
+    """
+    def __init__(self, owner, batch_size=BATCH_SIZE, on_error=None):
+        self.owner = owner
+        self.batch_size = batch_size
+        self.on_error = on_error
+        self.result = Result()
+        # имя клиента -> (id, id владельца) для всех клиентов в базе
+        self.clients = {}
+        self.new_clients = {}
+        self.new_contacts = []
+        # номера строк текущей пачки
+        self.lines = []
+
+    def load_clients(self):
+        self.clients = dict((name, (pk, owner_id)) for name, pk, owner_id
+                            in Client.objects.values_list('name', 'pk', 'owner_id').iterator())
+
+    def error(self, line, errors):
+        if isinstance(errors, dict):
+            message = '; '.join(u'{}: {}'.format(field, ' '.join(messages))
+                                for field, messages in sorted(errors.items()))
+        else:
+            message = errors
+        self.result.add_error(line, message)
+        if self.on_error:
+            self.on_error(line, message)
+
+    def run(self, fileobj):
+        try:
+            return self._run(read_rows(fileobj))
+        except UnicodeDecodeError:
+            raise CsvImportError('File is not valid UTF-8')
+
+    def _run(self, rows):
+        line, header = next(rows, (0, None))
+        if header is None:
+            raise CsvImportError('File is empty or its header is not valid UTF-8')
+        header = [name.strip().lstrip(u'\ufeff').lower() for name in header]
+        if 'client' not in header:
+            raise CsvImportError('Header must contain a "client" column')
+        unknown = set(header) - set(COLUMNS)
+        if unknown:
+            raise CsvImportError('Unknown columns: {}'.format(', '.join(sorted(unknown))))
+
+        self.load_clients()
+        for line, values in rows:
+            if values is None:
+                self.error(line, 'Row is not valid UTF-8')
+                continue
+            if not any(value.strip() for value in values):
+                continue
+            self.result.rows += 1
+            self.add_row(line, dict(zip(header, values)))
+            if len(self.new_clients) + len(self.new_contacts) >= self.batch_size:
+                self.flush()
+        self.flush()
+        return self.result
+
+    def add_row(self, line, row):
+        """
+        Проверяет строку и добавляет ее клиента и контакт в пачку,
+        строка с ошибкой не создает ни клиента, ни контакта
+        """
+        name = row.get('client', '').strip()
+        client = None
+        if name in self.clients:
+            if self.clients[name][1] != self.owner.pk:
+                return self.error(line, u'Client "{}" belongs to another user'.format(name))
+        elif name not in self.new_clients:
+            form = ClientImport(data={'name': name, 'loyal': _bool(row.get('loyal', ''), False)})
+            if not form.is_valid():
+                return self.error(line, form.errors)
+            client = form.save(commit=False)
+            client.owner = self.owner
+
+        contact = None
+        if any(row.get(column, '').strip() for column in CONTACT_COLUMNS):
+            data = dict((column, row.get(column, '').strip()) for column in CONTACT_COLUMNS)
+            data['active'] = _bool(row.get('active', ''), True)
+            form = ContactImport(data=data)
+            if not form.is_valid():
+                return self.error(line, form.errors)
+            contact = form.save(commit=False)
+            contact.owner = self.owner
+            self.new_contacts.append((name, contact))
+        if client:
+            self.new_clients[name] = client
+        if client or contact:
+            self.lines.append(line)
+
+    def flush(self):
+        """
+        Записывает накопленную пачку клиентов и контактов в одной транзакции.
+        Если пачка нарушает ограничения базы (например, клиента с тем же
+        именем создал параллельный запрос после load_clients), она
+        отменяется целиком, а ее строки записываются в ошибки
+        """
+        if not self.new_clients and not self.new_contacts:
+            return
+        try:
+            with transaction.atomic():
+                if self.new_clients:
+                    Client.objects.bulk_create(self.new_clients.values())
+                    created = Client.objects.filter(name__in=list(self.new_clients))
+                    for name, pk in created.values_list('name', 'pk'):
+                        self.clients[name] = (pk, self.owner.pk)
+                    search.index_queryset(created)
+
+                if self.new_contacts:
+                    contacts = []
+                    for name, contact in self.new_contacts:
+                        contact.client_id = self.clients[name][0]
+                        contacts.append(contact)
+                    Contact.objects.bulk_create(contacts)
+                    search.index_queryset(self.created(Contact, contacts))
+                    stats.recompute(set(contact.client_id for contact in contacts))
+        except IntegrityError as error:
+            # Словарь клиентов мог получить id отмененных записей
+            self.load_clients()
+            for line in self.lines:
+                self.error(line, u'Row was not imported: {}'.format(error))
+        else:
+            self.result.clients += len(self.new_clients)
+            self.result.contacts += len(self.new_contacts)
+            cache.bump(self.owner.pk)
+        self.new_clients = {}
+        self.new_contacts = []
+        self.lines = []
+
+    def created(self, model, objects):
+        return created(model, self.owner, objects)
+
+
+def created(model, owner, objects):
+    """
+    Queryset объектов владельца owner, только что созданных bulk_create.
+    SQLite не возвращает id созданных записей, но внутри транзакции записи
+    пачки получают последние id владельца
+    """
+    ids = [obj.pk for obj in objects if obj.pk]
+    if ids:
+        return model.objects.filter(pk__in=ids)
+    last = model.objects.for_user(owner).order_by('-pk').values('pk')[:len(objects)]
+    return model.objects.filter(pk__in=last)
+
+
+def import_csv(fileobj, owner, batch_size=BATCH_SIZE, on_error=None):
+    """
+    Импортирует клиентов и контакты из CSV файла fileobj от имени owner
+    """
+    return Importer(owner, batch_size, on_error).run(fileobj)
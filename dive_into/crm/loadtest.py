@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Нагрузочный тест crm: много одновременных пользователей против одного
+сервера и базы settings.DATABASES (команда load_test).
+
+serve запускает WSGI приложение проекта в многопоточном сервере wsgiref,
+при processes > 1 - в нескольких процессах на одном сокете. Каждый
+SimulatedUser - поток со своей сессией: входит под пользователем,
+созданным seed_data, загружает id своих объектов через JSON API и до
+истечения времени выполняет действия WORKLOAD (списки, поиск, карточка
+клиента, создание и отправка активностей) в случайном порядке с заданными
+весами.
+
+По ответам считаются запросы в секунду, перцентили времени ответа и доля
+ошибок "database is locked": сервер из serve отмечает такие ответы
+заголовком LOCKED_HEADER (см. LockReportingApplication), для внешнего
+сервера (--url) учитываются только коды ответов.
+
+Тест пишет в настроенную базу данных, запускать его нужно на копии.
+"""
+import json
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler
+
+from django.conf import settings
+from django.core.signals import got_request_exception
+from django.core.urlresolvers import reverse
+from django.db import OperationalError, connections
+from django.utils.six.moves import http_cookiejar, socketserver
+from django.utils.six.moves.urllib.error import HTTPError, URLError
+from django.utils.six.moves.urllib.parse import urlencode, urljoin
+from django.utils.six.moves.urllib.request import (HTTPCookieProcessor, HTTPRedirectHandler, Request,
+                                                   build_opener)
+
+from .benchmark import percentile
+from .seed import WORDS
+
+LOCKED_HEADER = 'X-CRM-Database-Locked'
+TIMEOUT = 30
+
+# Действие -> вес
+WORKLOAD = (
+    ('clients', 20),
+    ('contacts', 10),
+    ('activities', 15),
+    ('client', 10),
+    ('search', 15),
+    ('create activity', 15),
+    ('send activity', 10),
+    ('send all', 1),
+    ('edit client', 4),
+)
+
+_state = threading.local()
+
+
+def _request_exception(sender, request=None, **kwargs):
+    error = sys.exc_info()[1]
+    if isinstance(error, OperationalError) and 'locked' in str(error):
+        _state.locked = True
+
+
+class LockReportingApplication(object):
+    """
+    WSGI обертка, добавляющая LOCKED_HEADER к ответу, при построении
+    которого база вернула "database is locked" (ответ 500 не содержит
+    текста исключения)
+    """
+    def __init__(self, application):
+        self.application = application
+        got_request_exception.connect(_request_exception)
+
+    def __call__(self, environ, start_response):
+        _state.locked = False
+
+        def start(status, headers, exc_info=None):
+            if getattr(_state, 'locked', False):
+                headers = list(headers) + [(LOCKED_HEADER, '1')]
+            return start_response(status, headers, exc_info)
+        return self.application(environ, start)
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def serve(host, port, processes=1, threads=True):
+    """
+    Запускает сервер в processes дочерних процессах, возвращает их pid
+    (остановка - stop)
+    """
+    from django.core.wsgi import get_wsgi_application
+
+    server_class = ThreadingWSGIServer if threads else WSGIServer
+    server = server_class((host, port), QuietHandler)
+    server.set_app(LockReportingApplication(get_wsgi_application()))
+    # Соединения с базой не должны переходить в дочерние процессы
+    connections.close_all()
+
+    pids = []
+    for i in range(processes):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                server.serve_forever()
+            finally:
+                os._exit(0)
+        pids.append(pid)
+    server.server_close()
+    return pids
+
+
+def stop(pids):
+    for pid in pids:
+        os.kill(pid, signal.SIGTERM)
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+
+class NoRedirect(HTTPRedirectHandler):
+    """
+    Перенаправления не выполняются: ответ 302 на POST и есть результат
+    """
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class SimulatedUser(threading.Thread):
+    """
+    Пользователь username: вход и действия WORKLOAD до момента deadline,
+    результаты - в samples: (действие, мс, код ответа, locked)
+    """
+    def __init__(self, base_url, username, password, deadline, think=0, seed=None):
+        super(SimulatedUser, self).__init__()
+        self.daemon = True
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.deadline = deadline
+        self.think = think
+        self.random = random.Random(seed)
+        self.cookies = http_cookiejar.CookieJar()
+        self.opener = build_opener(HTTPCookieProcessor(self.cookies), NoRedirect)
+        self.samples = []
+        self.contacts = []
+        self.clients = []
+        self.unsent = []
+        self.error = None
+
+    def csrf_token(self):
+        for cookie in self.cookies:
+            if cookie.name == settings.CSRF_COOKIE_NAME:
+                return cookie.value
+        return ''
+
+    def request(self, action, path, data=None, params=None):
+        """
+        Выполняет запрос, записывает результат, если задано action,
+        возвращает (код, заголовки, тело)
+        """
+        url = urljoin(self.base_url, path)
+        if params:
+            url += '?' + urlencode(params)
+        body = None
+        if data is not None:
+            data = dict(data, csrfmiddlewaretoken=self.csrf_token())
+            body = urlencode(data).encode('utf-8')
+        start = time.time()
+        try:
+            response = self.opener.open(Request(url, body), timeout=TIMEOUT)
+            status, headers, content = response.getcode(), response.info(), response.read()
+        except HTTPError as error:
+            status, headers, content = error.code, error.info(), error.read()
+        except (URLError, IOError):
+            status, headers, content = 0, {}, b''
+        elapsed = (time.time() - start) * 1000
+        if action:
+            self.samples.append((action, elapsed, status, bool(headers.get(LOCKED_HEADER))))
+        return status, headers, content
+
+    def login(self):
+        path = reverse('login')
+        self.request(None, path)
+        status, headers, content = self.request(None, path, {'username': self.username,
+                                                             'password': self.password})
+        if status != 302:
+            raise RuntimeError('Login as {} failed with status {}'.format(self.username, status))
+
+    def load_ids(self):
+        status, headers, content = self.request(None, reverse('crm:api_list', kwargs={'kind': 'contacts'}),
+                                                params={'limit': 1000})
+        contacts = json.loads(content.decode('utf-8'))['results']
+        self.contacts = [(contact['client'], contact['id']) for contact in contacts
+                         if contact['active'] and contact['client']]
+        self.clients = sorted(set(client for client, contact in self.contacts))
+        status, headers, content = self.request(None, reverse('crm:api_list', kwargs={'kind': 'activities'}),
+                                                params={'limit': 1000})
+        activities = json.loads(content.decode('utf-8'))['results']
+        self.unsent = [activity['id'] for activity in activities if not activity['send_date']]
+
+    def choose(self):
+        total = sum(weight for action, weight in WORKLOAD)
+        point = self.random.uniform(0, total)
+        for action, weight in WORKLOAD:
+            point -= weight
+            if point <= 0:
+                return action
+        return WORKLOAD[-1][0]
+
+    def act(self, action):
+        if action in ('clients', 'contacts', 'activities'):
+            self.request(action, reverse('crm:' + action))
+        elif action == 'search':
+            self.request(action, reverse('crm:main'), params={'search': self.random.choice(WORDS)})
+        elif action == 'client' and self.clients:
+            self.request(action, reverse('crm:client', kwargs={'pk': self.random.choice(self.clients)}))
+        elif action == 'create activity' and self.contacts:
+            client, contact = self.random.choice(self.contacts)
+            status, headers, content = self.request(action, reverse('crm:new_activity'), {
+                'title': ' '.join(self.random.choice(WORDS) for i in range(2)),
+                'text': ' '.join(self.random.choice(WORDS) for i in range(20)),
+                'client': client, 'contact': contact})
+            location = headers.get('Location', '') if status == 302 else ''
+            pk = location.rstrip('/').rsplit('/', 1)[-1]
+            if pk.isdigit():
+                self.unsent.append(int(pk))
+        elif action == 'send activity' and self.unsent:
+            pk = self.unsent.pop(self.random.randrange(len(self.unsent)))
+            self.request(action, reverse('crm:activity', kwargs={'pk': pk}), {'action': 'Send'})
+        elif action == 'send all' and self.unsent:
+            self.request(action, reverse('crm:send_activities'), {'all': '1'})
+            self.unsent = []
+        elif action == 'edit client' and self.clients:
+            pk = self.random.choice(self.clients)
+            self.request(action, reverse('crm:client', kwargs={'pk': pk}), {
+                'name': u'{} {} {}'.format(self.username, self.random.choice(WORDS), pk), 'loyal': 'on'})
+        else:
+            self.request('clients', reverse('crm:clients'))
+
+    def run(self):
+        try:
+            self.login()
+            self.load_ids()
+            while time.time() < self.deadline:
+                self.act(self.choose())
+                if self.think:
+                    time.sleep(self.random.uniform(0, 2 * self.think))
+        except Exception as error:
+            self.error = error
+
+
+def _summary(samples, seconds):
+    timings = [elapsed for action, elapsed, status, locked in samples]
+    errors = sum(1 for action, elapsed, status, locked in samples if status == 0 or status >= 500)
+    locked = sum(1 for action, elapsed, status, locked in samples if locked)
+    return {
+        'requests': len(samples),
+        'rps': round(len(samples) / seconds, 2) if seconds else 0,
+        'p50_ms': round(percentile(timings, 50) or 0, 3),
+        'p95_ms': round(percentile(timings, 95) or 0, 3),
+        'p99_ms': round(percentile(timings, 99) or 0, 3),
+        'errors': errors,
+        'locked': locked,
+        'locked_rate': round(float(locked) / len(samples), 4) if samples else 0,
+    }
+
+
+def summarize(samples, seconds):
+    """
+    Итог по всем запросам и по каждому действию
+    """
+    actions = sorted(set(sample[0] for sample in samples))
+    return {
+        'seconds': round(seconds, 3),
+        'total': _summary(samples, seconds),
+        'actions': dict((action, _summary([sample for sample in samples if sample[0] == action], seconds))
+                        for action in actions),
+    }
+
+
+def run(base_url, usernames, password, duration, think=0, seed=0):
+    """
+    Запускает по SimulatedUser на каждого пользователя usernames на duration
+    секунд, возвращает (summarize, ошибки пользователей)
+    """
+    deadline = time.time() + duration
+    users = [SimulatedUser(base_url, username, password, deadline, think, seed + i)
+             for i, username in enumerate(usernames)]
+    start = time.time()
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+    seconds = time.time() - start
+    samples = [sample for user in users for sample in user.samples]
+    errors = [(user.username, str(user.error)) for user in users if user.error]
+    return summarize(samples, seconds), errors
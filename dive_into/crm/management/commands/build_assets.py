@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand, CommandError
+
+from crm import assets
+
+
+class Command(BaseCommand):
+    help = 'Builds the crm/dist CSS and JS bundles from vendored libraries and crm static files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true',
+                            help='Only check that the bundles in the repository are up to date')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            stale = assets.build(check=True)
+            for name, size in stale:
+                self.stderr.write('{} is out of date'.format(name))
+            if stale:
+                raise CommandError('Run build_assets to rebuild {} bundles'.format(len(stale)))
+            self.stdout.write('All bundles are up to date')
+            return
+        for name, size in assets.build():
+            self.stdout.write('{}: {} bytes'.format(name, size))
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand
+
+from crm import cache
+
+
+class Command(BaseCommand):
+    help = 'Shows hit/miss counters of the page cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters')
+        parser.add_argument('--clear', action='store_true', help='Invalidate cached pages of all owners')
+
+    def handle(self, *args, **options):
+        counters = cache.counters()
+        total = counters['hits'] + counters['misses']
+        ratio = 100.0 * counters['hits'] / total if total else 0
+        self.stdout.write('Backend: {}, hits: {}, misses: {}, hit ratio: {:.1f}%'.format(
+            cache.ALIAS, counters['hits'], counters['misses'], ratio))
+        if options['reset']:
+            cache.reset_counters()
+        if options['clear']:
+            cache.invalidate_all()
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from crm import queryplan
+
+
+class Command(BaseCommand):
+    help = 'Runs EXPLAIN QUERY PLAN for the main view querysets and fails on full table scans'
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('Query plan checks are only supported on SQLite')
+
+        # План не зависит от данных пользователя, достаточно несохраненного объекта
+        user = User(pk=0, username='query_plan_check')
+        problems = queryplan.check(user)
+        for name, scans in problems:
+            self.stderr.write('{}: {}'.format(name, '; '.join(scans)))
+        if problems:
+            raise CommandError('{} queries fall back to a full table scan'.format(len(problems)))
+        self.stdout.write('All queries use indexes')
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import io
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from crm import exporter
+
+
+class Command(BaseCommand):
+    help = 'Streams clients, contacts or activities of a user as CSV or JSON Lines'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(exporter.KINDS))
+        parser.add_argument('--owner', required=True, help='Username of the owner of exported data')
+        parser.add_argument('--format', choices=sorted(exporter.FORMATS), default='csv')
+        parser.add_argument('--from', dest='date_from', help='First send date, YYYY-MM-DD')
+        parser.add_argument('--to', dest='date_to', help='Last send date, YYYY-MM-DD')
+        parser.add_argument('--output', help='File to write to (stdout by default)')
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options['owner'])
+        except User.DoesNotExist:
+            raise CommandError('User "{}" does not exist'.format(options['owner']))
+        dates = []
+        for name in ('date_from', 'date_to'):
+            try:
+                dates.append(parse_date(options[name]) if options[name] else None)
+            except ValueError:
+                dates.append(None)
+            if options[name] and not dates[-1]:
+                raise CommandError('Invalid date: {}'.format(options[name]))
+
+        lines = exporter.export(options['kind'], owner, options['format'], *dates)
+        if options['output']:
+            with io.open(options['output'], 'wb') as output:
+                for line in lines:
+                    output.write(line)
+        else:
+            for line in lines:
+                self.stdout.write(line.decode('utf-8'), ending='')
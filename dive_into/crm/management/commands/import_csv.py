@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import io
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from crm import importer
+
+
+class Command(BaseCommand):
+    help = 'Imports clients and contacts from a CSV file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV file in UTF-8 with a header row')
+        parser.add_argument('--owner', required=True, help='Username of the owner of imported data')
+        parser.add_argument('--batch-size', type=int, default=importer.BATCH_SIZE,
+                            help='Objects written in one transaction')
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options['owner'])
+        except User.DoesNotExist:
+            raise CommandError('User "{}" does not exist'.format(options['owner']))
+
+        def on_error(line, message):
+            self.stderr.write(u'Line {}: {}'.format(line, message))
+
+        with io.open(options['path'], 'rb') as csv_file:
+            try:
+                result = importer.import_csv(csv_file, owner, options['batch_size'], on_error)
+            except importer.CsvImportError as error:
+                raise CommandError(str(error))
+        self.stdout.write('Imported {} clients and {} contacts from {} rows, {} rows skipped'.format(
+            result.clients, result.contacts, result.rows, result.error_count))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from crm import cache, loadtest, seed
+
+
+class Command(BaseCommand):
+    help = ('Runs concurrent simulated users against the crm pages and reports requests per second, '
+            'latency percentiles and "database is locked" errors. Writes to the configured database')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10, help='Concurrent simulated users')
+        parser.add_argument('--duration', type=float, default=30, help='Seconds of load')
+        parser.add_argument('--think', type=float, default=0, help='Mean pause between actions of a user, s')
+        parser.add_argument('--prefix', default='seed', help='Users <prefix>1..<prefix>N created by seed_data')
+        parser.add_argument('--password', default='seed', help='Password of the users')
+        parser.add_argument('--seed-clients', type=int, default=0,
+                            help='Seed this many clients per user before the run')
+        parser.add_argument('--url', help='Base url of an already running server instead of the built-in one')
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--processes', type=int, default=1, help='Server processes')
+        parser.add_argument('--no-threads', action='store_true', help='One request at a time per server process')
+        parser.add_argument('--output', help='Write the result as JSON to this file')
+
+    def handle(self, *args, **options):
+        if options['users'] <= 0 or options['duration'] <= 0:
+            raise CommandError('Nothing to run')
+        if options['processes'] > 1 and not options['url'] and not cache.is_shared():
+            raise CommandError('Several server processes need a shared page cache, '
+                               'set CRM_CACHE_BACKEND=file or memcached')
+        if options['seed_clients']:
+            seed.seed(options['users'], options['seed_clients'], 3, 2, prefix=options['prefix'],
+                      password=options['password'])
+        usernames = ['{}{}'.format(options['prefix'], i) for i in range(1, options['users'] + 1)]
+
+        pids = []
+        base_url = options['url']
+        if not base_url:
+            pids = loadtest.serve(options['host'], options['port'], options['processes'],
+                                  not options['no_threads'])
+            base_url = 'http://{}:{}/'.format(options['host'], options['port'])
+        try:
+            result, errors = loadtest.run(base_url, usernames, options['password'], options['duration'],
+                                          options['think'])
+        finally:
+            loadtest.stop(pids)
+
+        for username, error in errors:
+            self.stderr.write('{}: {}'.format(username, error))
+        line = '{:<16} {:>7} req {:>8.1f} rps  p50 {:>8.1f}  p95 {:>8.1f}  p99 {:>8.1f} ms  {:>5} errors  ' \
+               '{:>5} locked ({:.2%})'
+        for name, summary in sorted(result['actions'].items()) + [('total', result['total'])]:
+            self.stdout.write(line.format(name, summary['requests'], summary['rps'], summary['p50_ms'],
+                                          summary['p95_ms'], summary['p99_ms'], summary['errors'],
+                                          summary['locked'], summary['locked_rate']))
+        if options['output']:
+            result['users'] = options['users']
+            result['server'] = {'url': base_url, 'processes': options['processes'],
+                                'threads': not options['no_threads']} if pids else {'url': base_url}
+            with open(options['output'], 'w') as output:
+                json.dump(result, output, indent=2, sort_keys=True)
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand
+
+from crm import search, cache
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search index for clients, contacts and activities'
+
+    def handle(self, *args, **options):
+        if not search.is_available():
+            self.stderr.write('Full-text index is only supported on SQLite, nothing to rebuild')
+            return
+        search.rebuild()
+        cache.invalidate_all()
+        self.stdout.write('Search index rebuilt')
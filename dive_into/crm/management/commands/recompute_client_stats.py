@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from crm import stats, cache
+
+
+class Command(BaseCommand):
+    help = 'Recomputes activity/contact counters and last send date of clients'
+
+    def add_arguments(self, parser):
+        parser.add_argument('client_ids', nargs='*', type=int,
+                            help='Recompute only these clients (all clients by default)')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = stats.recompute(options['client_ids'] or None)
+        cache.invalidate_all()
+        self.stdout.write('Statistics recomputed for {} clients'.format(updated))
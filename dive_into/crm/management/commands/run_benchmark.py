@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from crm import benchmark
+
+
+class Command(BaseCommand):
+    help = ('Measures every crm page on synthetic data of several sizes in a temporary test database '
+            'and writes latency percentiles, query counts and peak memory as JSON')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scales', default='100,1000,10000',
+                            help='Comma separated numbers of clients of the measured user')
+        parser.add_argument('--contacts', type=int, default=3, help='Contacts per client')
+        parser.add_argument('--activities', type=int, default=2, help='Activities per contact')
+        parser.add_argument('--sent-ratio', type=float, default=0.5, help='Share of sent activities')
+        parser.add_argument('--repeat', type=int, default=20, help='Requests per page')
+        parser.add_argument('--warm', action='store_true', help='Keep the page cache between requests')
+        parser.add_argument('--keepdb', action='store_true', help='Keep the test database between runs')
+        parser.add_argument('--output', default='benchmark.json', help='Result file, "-" for stdout')
+
+    def handle(self, *args, **options):
+        try:
+            scales = [int(value) for value in options['scales'].split(',') if value.strip()]
+        except ValueError:
+            raise CommandError('--scales must be a comma separated list of integers')
+        if not scales or options['repeat'] <= 0:
+            raise CommandError('Nothing to measure')
+
+        def on_result(endpoint):
+            self.stderr.write('{:<16} p50 {:>9.2f} ms  p95 {:>9.2f} ms  {:>3} queries'.format(
+                endpoint['name'], endpoint['ms']['p50'], endpoint['ms']['p95'], endpoint['queries']))
+
+        try:
+            result = benchmark.run(scales, options['contacts'], options['activities'], options['repeat'],
+                                   options['sent_ratio'], not options['warm'], on_result, options['keepdb'])
+        except benchmark.MeasurementError as error:
+            raise CommandError(str(error))
+        content = json.dumps(result, indent=2, sort_keys=True)
+        if options['output'] == '-':
+            self.stdout.write(content)
+        else:
+            with open(options['output'], 'w') as output:
+                output.write(content + '\n')
+            self.stdout.write('Results for {} scales written to {}'.format(len(scales), options['output']))
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+
+from crm import outbox
+
+
+class Command(BaseCommand):
+    help = 'Delivers sent activities from the outbox by email'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=outbox.BATCH_SIZE,
+                            help='Messages claimed and sent over one SMTP connection')
+        parser.add_argument('--sleep', type=float, default=5,
+                            help='Seconds to wait when the outbox is empty')
+        parser.add_argument('--once', action='store_true',
+                            help='Process the outbox until it is empty and exit')
+
+    def handle(self, *args, **options):
+        worker = uuid.uuid4().hex
+        while True:
+            started = time.time()
+            claimed, sent = outbox.process_batch(options['batch_size'], worker)
+            if claimed:
+                self.stdout.write('Sent {} of {} messages in {:.2f}s'.format(sent, claimed, time.time() - started))
+            elif options['once']:
+                break
+            else:
+                time.sleep(options['sleep'])
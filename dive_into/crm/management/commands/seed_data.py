@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.core.management.base import BaseCommand
+
+from crm import seed
+
+
+class Command(BaseCommand):
+    help = 'Creates synthetic users, clients, contacts and activities with bulk inserts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1, help='Number of users')
+        parser.add_argument('--clients', type=int, default=100, help='Clients per user')
+        parser.add_argument('--contacts', type=int, default=3, help='Contacts per client')
+        parser.add_argument('--activities', type=int, default=2, help='Activities per contact')
+        parser.add_argument('--sent-ratio', type=float, default=0.5, help='Share of sent activities')
+        parser.add_argument('--batch-size', type=int, default=seed.BATCH_SIZE,
+                            help='Clients (with contacts and activities) written in one transaction')
+        parser.add_argument('--prefix', default='seed', help='Usernames are <prefix>1, <prefix>2, ...')
+        parser.add_argument('--password', default='seed', help='Password of created users')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed')
+
+    def handle(self, *args, **options):
+        started = time.time()
+        result = seed.seed(options['users'], options['clients'], options['contacts'], options['activities'],
+                           options['sent_ratio'], options['batch_size'], options['prefix'],
+                           options['password'], options['seed'])
+        self.stdout.write('Created {users} users, {clients} clients, {contacts} contacts and '
+                          '{activities} activities ({sent} sent)'.format(**result.as_dict()) +
+                          ' in {:.1f} s'.format(time.time() - started))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from crm import sqlite
+
+
+class Command(BaseCommand):
+    help = ('Runs ANALYZE, incremental VACUUM and a WAL checkpoint on the SQLite database, '
+            'once or every --every seconds')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias')
+        parser.add_argument('--no-analyze', action='store_true', help='Skip ANALYZE')
+        parser.add_argument('--vacuum-pages', type=int, default=0,
+                            help='Free pages returned to the file, 0 - all of them')
+        parser.add_argument('--no-vacuum', action='store_true', help='Skip incremental VACUUM')
+        parser.add_argument('--checkpoint', default='TRUNCATE', choices=('PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'),
+                            help='WAL checkpoint mode')
+        parser.add_argument('--enable-incremental-vacuum', action='store_true',
+                            help='Switch the database to auto_vacuum=INCREMENTAL with a full VACUUM first')
+        parser.add_argument('--every', type=float, help='Repeat every this many seconds')
+
+    def handle(self, *args, **options):
+        if connections[options['database']].vendor != 'sqlite':
+            raise CommandError('Maintenance is only supported on SQLite')
+        if options['enable_incremental_vacuum']:
+            started = time.time()
+            if sqlite.enable_incremental_vacuum(options['database']):
+                self.stdout.write('Enabled incremental vacuum in {:.1f}s'.format(time.time() - started))
+
+        while True:
+            started = time.time()
+            result = sqlite.maintenance(not options['no_analyze'],
+                                        None if options['no_vacuum'] else options['vacuum_pages'],
+                                        options['checkpoint'], options['database'])
+            self.report(result, time.time() - started)
+            if not options['every']:
+                break
+            # Соединение не должно оставаться открытым между запусками
+            connections[options['database']].close()
+            time.sleep(options['every'])
+
+    def report(self, result, seconds):
+        parts = []
+        if result.get('analyzed'):
+            parts.append('analyzed')
+        if 'freed_pages' in result:
+            if result['freed_pages'] is None:
+                parts.append('incremental vacuum is disabled (see --enable-incremental-vacuum)')
+            else:
+                parts.append('freed {} pages'.format(result['freed_pages']))
+        checkpoint = result.get('checkpoint')
+        if 'checkpoint' in result and checkpoint is None:
+            parts.append('WAL checkpoint skipped inside a transaction')
+        elif checkpoint:
+            parts.append('checkpointed {} of {} WAL pages{}'.format(
+                checkpoint['checkpointed_pages'], checkpoint['wal_pages'], ' (busy)' if checkpoint['busy'] else ''))
+        self.stdout.write('{} in {:.2f}s'.format(', '.join(parts), seconds))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.1 on 2026-10-18 18:56
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('crm', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Activity',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30)),
+                ('text', models.CharField(max_length=10000)),
+                ('send_date', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Client',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, unique=True)),
+                ('loyal', models.BooleanField(default=False)),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Contact',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_name', models.CharField(max_length=200)),
+                ('last_name', models.CharField(max_length=200)),
+                ('email', models.EmailField(max_length=254)),
+                ('phone', models.IntegerField()),
+                ('active', models.BooleanField(default=True)),
+                ('client', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='crm.Client')),
+                ('owner', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.RemoveField(
+            model_name='activities',
+            name='client',
+        ),
+        migrations.RemoveField(
+            model_name='activities',
+            name='contact_id',
+        ),
+        migrations.RemoveField(
+            model_name='contacts',
+            name='client',
+        ),
+        migrations.DeleteModel(
+            name='Activities',
+        ),
+        migrations.DeleteModel(
+            name='Clients',
+        ),
+        migrations.DeleteModel(
+            name='Contacts',
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='client',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='crm.Client'),
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='contact',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='crm.Contact'),
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='owner',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+def create_index(apps, schema_editor):
+    """
+    Виртуальная таблица FTS5 для поиска (см. crm/search.py),
+    заполняется текущими данными
+    """
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("CREATE VIRTUAL TABLE crm_search USING fts5(owner, title, body, prefix='2 3')")
+    schema_editor.execute("INSERT INTO crm_search (rowid, owner, title, body) "
+                          "SELECT id * 3, 'o' || COALESCE(owner_id, ''), name, '' FROM crm_client")
+    schema_editor.execute("INSERT INTO crm_search (rowid, owner, title, body) "
+                          "SELECT id * 3 + 1, 'o' || COALESCE(owner_id, ''), first_name || ' ' || last_name, "
+                          "email || ' ' || phone FROM crm_contact")
+    schema_editor.execute("INSERT INTO crm_search (rowid, owner, title, body) "
+                          "SELECT id * 3 + 2, 'o' || COALESCE(owner_id, ''), title, text FROM crm_activity")
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE crm_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0002_client_contact_activity'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
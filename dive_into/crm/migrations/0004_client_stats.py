@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.1 on 2026-10-18 18:58
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def fill_stats(apps, schema_editor):
+    schema_editor.execute('''
+        UPDATE crm_client SET
+            activity_count = (SELECT COUNT(*) FROM crm_activity
+                              WHERE crm_activity.client_id = crm_client.id),
+            sent_count = (SELECT COUNT(*) FROM crm_activity
+                          WHERE crm_activity.client_id = crm_client.id AND crm_activity.send_date IS NOT NULL),
+            last_sent_at = (SELECT MAX(crm_activity.send_date) FROM crm_activity
+                            WHERE crm_activity.client_id = crm_client.id),
+            contact_count = (SELECT COUNT(*) FROM crm_contact
+                             WHERE crm_contact.client_id = crm_client.id)
+    ''')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0003_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='activity_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='contact_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='last_sent_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='sent_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_stats, migrations.RunPython.noop),
+    ]
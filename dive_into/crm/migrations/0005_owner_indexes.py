@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.1 on 2026-10-18 18:59
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('crm', '0004_client_stats'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='activity',
+            index_together=set([('client', 'send_date'), ('owner', 'send_date')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='client',
+            index_together=set([('owner', 'name')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='contact',
+            index_together=set([('owner', 'client')]),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10.1 on 2026-10-18 19:12
+from __future__ import unicode_literals
+
+import crm.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0006_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activity',
+            name='version',
+            field=models.BigIntegerField(default=crm.models.initial_version, editable=False),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='version',
+            field=models.BigIntegerField(default=crm.models.initial_version, editable=False),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='version',
+            field=models.BigIntegerField(default=crm.models.initial_version, editable=False),
+        ),
+    ]
@@ -1,12 +1,127 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from django.db import models
+import time
+
+from django.db import models, transaction
+from django.db.models import F
 from django.utils import timezone
 from django.contrib.auth.models import User
 # Create your models here.
 
+SEND_CHUNK_SIZE = 900
+
+
+def initial_version():
+    """
+    Начальное значение version - время создания в микросекундах: SQLite может
+    повторно выдать id удаленной записи, и ключ строки в кэше не должен совпасть
+    """
+    return int(time.time() * 1000000)
+
+
+class StaleObjectError(Exception):
+    """
+    Объект изменен (или отправлен) другим запросом после загрузки
+    """
+    pass
+
+
+class TrackedModel(models.Model):
+    """
+    Запоминает значения полей tracked_fields на момент загрузки из базы
+    (или последнего сохранения), чтобы обработчики сигналов могли узнать,
+    что именно изменилось. Сохранение выполняется в транзакции вместе
+    с обработчиками post_save.
+
+    version увеличивается при каждом сохранении и массовом изменении
+    отображаемых полей, по нему строки таблиц находятся в кэше
+    (см. templatetags/crm_cache.py)
 
-class Client(models.Model):
+    revision увеличивается только при изменении данных пользователем
+    (сохранение, отправка активности). Сохранение существующего объекта
+    выполняется одним UPDATE ... WHERE revision = <загруженная ревизия>,
+    если объект успели изменить - выбрасывается StaleObjectError
+
+    updated_at меняется при каждом изменении, как и version (массовые
+    изменения выставляют его явно), по нему и количеству объектов
+    строятся ETag и Last-Modified страниц (см. cache.ConditionalPage)
+    """
+    version = models.BigIntegerField(default=initial_version, editable=False)
+    revision = models.PositiveIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    tracked_fields = ()
+    # Поля, которые меняются только массовыми UPDATE (например, статистика
+    # клиента в stats.py), save существующего объекта их не записывает
+    computed_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(TrackedModel, cls).from_db(db, field_names, values)
+        instance._loaded_values = instance._tracked_values()
+        return instance
+
+    def _tracked_values(self):
+        deferred = self.get_deferred_fields()
+        return dict((field, getattr(self, field)) for field in self.tracked_fields if field not in deferred)
+
+    def loaded_value(self, field, default=None):
+        """
+        Значение поля на момент загрузки, default - если оно неизвестно
+        """
+        return getattr(self, '_loaded_values', {}).get(field, default)
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            self.version += 1
+            self.revision += 1
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = list(kwargs['update_fields']) + ['version', 'revision']
+        try:
+            with transaction.atomic():
+                super(TrackedModel, self).save(*args, **kwargs)
+        except StaleObjectError:
+            self.version -= 1
+            self.revision -= 1
+            raise
+        self._loaded_values = self._tracked_values()
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        if self._state.adding:
+            return super(TrackedModel, self)._do_update(base_qs, using, pk_val, values,
+                                                        update_fields, forced_update)
+        # Иначе загруженные ранее значения затерли бы изменения, сделанные после загрузки
+        values = [value for value in values if value[0].attname not in self.computed_fields]
+        updated = super(TrackedModel, self)._do_update(base_qs.filter(revision=self.revision - 1), using,
+                                                       pk_val, values, update_fields, forced_update)
+        if not updated and base_qs.filter(pk=pk_val).exists():
+            raise StaleObjectError("{} was changed by another request".format(self._meta.object_name))
+        return updated
+
+
+class OwnedQuerySet(models.QuerySet):
+    """
+    Общий queryset моделей с владельцем (поле owner). Все выборки страниц,
+    поиска, импорта и выгрузки начинаются с for_user, поэтому объекты
+    другого пользователя не попадают в них даже при ошибке в view
+    """
+    def for_user(self, user):
+        """
+        Объекты, принадлежащие пользователю user, для анонимного
+        пользователя (или None) - пустой queryset без обращения к базе.
+        Условие по owner_id не соединяет таблицу с auth_user и использует
+        индексы (owner, ...) из Meta.index_together
+        """
+        if user is None or not user.is_authenticated():
+            return self.none()
+        return self.filter(owner_id=user.pk)
+
+
+class Client(TrackedModel):
     """
     Таблица с данными о всех клиентах, с пометкой о их лояльности
     Связь с таблицами Contact и Activity
@@ -15,11 +130,25 @@ class Client(models.Model):
     loyal = models.BooleanField(default=False)
     owner = models.ForeignKey(User, editable=True, null=True, blank=True)
 
-    def last_activity(self):
-        send_dates = [i.send_date for i in self.activity_set.all() if i.is_send()]
+    # Статистика по клиенту, поддерживается обработчиками сигналов (см. stats.py),
+    # пересчитывается командой recompute_client_stats
+    activity_count = models.PositiveIntegerField(default=0, editable=False)
+    contact_count = models.PositiveIntegerField(default=0, editable=False)
+    sent_count = models.PositiveIntegerField(default=0, editable=False)
+    last_sent_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = OwnedQuerySet.as_manager()
+
+    tracked_fields = ('owner_id',)
+    computed_fields = ('activity_count', 'contact_count', 'sent_count', 'last_sent_at')
 
-        last = max(send_dates).strftime("%Y.%m.%d %H:%M") if send_dates else None
+    def last_activity(self):
+        last = self.last_sent_at.strftime("%Y.%m.%d %H:%M") if self.last_sent_at else None
         return last
+    last_activity.admin_order_field = 'last_sent_at'
+
+    class Meta:
+        index_together = [('owner', 'name'), ('owner', 'updated_at')]
 
     def str_with_html(self):
         return u'<b>Name</b>: {}\n<b>Loyal</b>: {}\n<b>Id</b>: {}'.format(self.name,
@@ -30,7 +159,7 @@ class Client(models.Model):
         return u'Name: {}, Id: {}'.format(self.name, self.id)
 
 
-class Contact(models.Model):
+class Contact(TrackedModel):
     """
     Таблица с данными о всех контактах в системе
     """
@@ -42,6 +171,13 @@ class Contact(models.Model):
     active = models.BooleanField(default=True)
     owner = models.ForeignKey(User, editable=True, null=True)
 
+    objects = OwnedQuerySet.as_manager()
+
+    tracked_fields = ('client_id', 'owner_id')
+
+    class Meta:
+        index_together = [('owner', 'client'), ('owner', 'updated_at')]
+
     def full_name(self):
         return u'{} {}'.format(self.first_name, self.last_name)
 
@@ -54,10 +190,41 @@ class Contact(models.Model):
 
     def __unicode__(self):
         template = u'First name: {}, Email: {}, Client id: {}'
-        return template.format(self.first_name, self.email, self.client.id if self.client else '--')
+        return template.format(self.first_name, self.email, self.client_id if self.client_id else '--')
+
 
+class ActivityQuerySet(OwnedQuerySet):
+    def send(self):
+        """
+        Отправляет все еще не отправленные активности queryset одним
+        UPDATE ... WHERE send_date IS NULL, возвращает количество отправленных
+        """
+        from . import stats, outbox, cache
+
+        send_date = timezone.now()
+        with transaction.atomic():
+            count = self.filter(send_date__isnull=True).update(
+                send_date=send_date, updated_at=send_date, version=F('version') + 1, revision=F('revision') + 1)
+            if count:
+                stats.activities_sent(self, send_date)
+                cache.bump_queryset(self.filter(send_date=send_date))
+                outbox.enqueue(self.filter(send_date=send_date))
+        return count
+
+    def send_selected(self, ids):
+        """
+        Отправляет активности queryset с id из ids (см. send) пачками по
+        SEND_CHUNK_SIZE id в одной транзакции: каждый запрос send повторяет
+        условие pk IN (...), а SQLite ограничивает количество параметров
+        запроса (SQLITE_MAX_VARIABLE_NUMBER, 999 в старых версиях)
+        """
+        ids = list(ids)
+        with transaction.atomic():
+            return sum(self.filter(pk__in=ids[start:start + SEND_CHUNK_SIZE]).send()
+                       for start in range(0, len(ids), SEND_CHUNK_SIZE))
 
-class Activity(models.Model):
+
+class Activity(TrackedModel):
     """
     Таблица с данными о всех активностях в системе, в каждой активности должен быть
     указан клиент и соответствующий контакт
@@ -70,6 +237,13 @@ class Activity(models.Model):
     send_date = models.DateTimeField(null=True, blank=True)
     owner = models.ForeignKey(User, editable=True, null=True)
 
+    objects = ActivityQuerySet.as_manager()
+
+    tracked_fields = ('client_id', 'send_date', 'owner_id')
+
+    class Meta:
+        index_together = [('owner', 'send_date'), ('client', 'send_date'), ('owner', 'updated_at')]
+
     def send(self):
         self.send_date = timezone.now()
 
@@ -88,4 +262,29 @@ class Activity(models.Model):
         return u'Клиент: {}, Тема: {}, Отправлено: {}'.format(self.client.name, self.title, send_date)
 
 
+class OutboxMessage(models.Model):
+    """
+    Очередь доставки отправленных активностей по email. Запись создается
+    в той же транзакции, что и отправка активности, доставку выполняет
+    обработчик очереди (см. outbox.py, команда run_outbox_worker)
+    """
+    PENDING = 'pending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    STATUS_CHOICES = ((PENDING, 'Pending'), (SENT, 'Sent'), (FAILED, 'Failed'))
+
+    activity = models.ForeignKey(Activity, on_delete=models.CASCADE)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_by = models.CharField(max_length=40, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        index_together = [('status', 'next_attempt_at')]
 
+    def __unicode__(self):
+        return u'Activity id: {}, Status: {}, Attempts: {}'.format(self.activity_id, self.status, self.attempts)
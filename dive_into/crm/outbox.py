@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Доставка отправленных активностей по email через очередь OutboxMessage.
+
+enqueue добавляет записи в очередь (в транзакции отправки активностей),
+process_batch забирает пачку готовых к доставке записей, отправляет письма
+через одно SMTP-соединение и сохраняет результат каждой записи. Неудачные
+попытки повторяются с экспоненциально растущей задержкой, после
+CRM_OUTBOX_MAX_ATTEMPTS попыток запись помечается как failed
+"""
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.template.defaultfilters import linebreaks
+from django.utils import timezone
+from django.utils.html import escape
+
+from .models import OutboxMessage
+
+BATCH_SIZE = getattr(settings, 'CRM_OUTBOX_BATCH_SIZE', 100)
+MAX_ATTEMPTS = getattr(settings, 'CRM_OUTBOX_MAX_ATTEMPTS', 5)
+RETRY_DELAY = getattr(settings, 'CRM_OUTBOX_RETRY_DELAY', 60)
+CLAIM_TIMEOUT = getattr(settings, 'CRM_OUTBOX_CLAIM_TIMEOUT', 600)
+
+
+def enqueue(activities):
+    """
+    Добавляет в очередь все активности queryset одним INSERT ... SELECT
+    """
+    sql, params = activities.values('pk').query.sql_with_params()
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    with connection.cursor() as cursor:
+        cursor.execute('INSERT INTO {} (activity_id, status, attempts, next_attempt_at, claimed_by, '
+                       'last_error, created_at) SELECT id, %s, 0, %s, \'\', \'\', %s FROM ({})'.format(
+                           OutboxMessage._meta.db_table, sql),
+                       [OutboxMessage.PENDING, now, now] + list(params))
+
+
+def claim(batch_size=BATCH_SIZE, worker=None):
+    """
+    Помечает до batch_size готовых к доставке записей как взятые обработчиком
+    worker и возвращает их вместе с активностями. Записи, взятые давно
+    (обработчик упал), снова становятся доступны
+    """
+    worker = worker or uuid.uuid4().hex
+    now = timezone.now()
+    available = OutboxMessage.objects.filter(
+        Q(claimed_at__isnull=True) | Q(claimed_at__lt=now - timedelta(seconds=CLAIM_TIMEOUT)),
+        status=OutboxMessage.PENDING, next_attempt_at__lte=now)
+    ids = available.order_by('next_attempt_at', 'pk').values('pk')[:batch_size]
+    with transaction.atomic():
+        available.filter(pk__in=ids).update(claimed_by=worker, claimed_at=now)
+    return list(OutboxMessage.objects.filter(claimed_by=worker, status=OutboxMessage.PENDING)
+                .select_related('activity__client', 'activity__contact', 'activity__owner'))
+
+
+def build_email(activity, connection=None):
+    html = linebreaks(activity.str_with_html()) + linebreaks(escape(activity.text))
+    email = EmailMultiAlternatives(subject=activity.title,
+                                   body=activity.text,
+                                   from_email=(activity.owner.email if activity.owner and activity.owner.email
+                                               else settings.DEFAULT_FROM_EMAIL),
+                                   to=[activity.contact.email],
+                                   connection=connection)
+    email.attach_alternative(html, 'text/html')
+    return email
+
+
+def _failed(message, error):
+    message.attempts += 1
+    message.last_error = u'{}'.format(error)
+    if message.attempts >= MAX_ATTEMPTS:
+        message.status = OutboxMessage.FAILED
+    else:
+        message.next_attempt_at = timezone.now() + timedelta(seconds=RETRY_DELAY * 2 ** (message.attempts - 1))
+    message.claimed_by, message.claimed_at = '', None
+    message.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at', 'claimed_by', 'claimed_at'])
+
+
+def deliver(messages):
+    """
+    Отправляет письма для записей messages через одно SMTP-соединение,
+    возвращает количество доставленных
+    """
+    if not messages:
+        return 0
+    mail_connection = get_connection(fail_silently=False)
+    try:
+        mail_connection.open()
+    except Exception as error:
+        for message in messages:
+            _failed(message, error)
+        return 0
+
+    sent = []
+    try:
+        for message in messages:
+            try:
+                mail_connection.send_messages([build_email(message.activity, mail_connection)])
+            except Exception as error:
+                _failed(message, error)
+            else:
+                sent.append(message.pk)
+    finally:
+        mail_connection.close()
+
+    OutboxMessage.objects.filter(pk__in=sent).update(status=OutboxMessage.SENT, sent_at=timezone.now(),
+                                                     attempts=F('attempts') + 1, last_error='',
+                                                     claimed_by='', claimed_at=None)
+    return len(sent)
+
+
+def process_batch(batch_size=BATCH_SIZE, worker=None):
+    """
+    Забирает и доставляет одну пачку записей, возвращает пару
+    (количество взятых записей, количество доставленных)
+    """
+    messages = claim(batch_size, worker)
+    return len(messages), deliver(messages)
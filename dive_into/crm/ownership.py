@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Передача клиентов (вместе с их контактами и активностями) другому
+менеджеру. Все изменения выполняются несколькими UPDATE в одной
+транзакции, количество запросов не зависит от количества объектов
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Client, Contact, Activity
+from . import search, cache
+
+
+def _update_owner(queryset, new_owner):
+    cache.bump_queryset(queryset)
+    cache.bump(new_owner.pk)
+    search.set_owner(queryset, new_owner)
+    return queryset.update(owner=new_owner, updated_at=timezone.now())
+
+
+def reassign_clients(clients, new_owner):
+    """
+    Передает клиентов из queryset clients, их контакты и активности
+    пользователю new_owner, возвращает количество переданных клиентов
+    """
+    client_ids = clients.values('pk')
+    with transaction.atomic():
+        # Сначала зависимые объекты: clients может быть отфильтрован по владельцу
+        _update_owner(Contact.objects.filter(client__in=client_ids), new_owner)
+        _update_owner(Activity.objects.filter(client__in=client_ids), new_owner)
+        return _update_owner(clients, new_owner)
+
+
+def reassign_owner(old_owners, new_owner):
+    """
+    Передает все, чем владеют пользователи old_owners (клиентов, контакты
+    и активности), пользователю new_owner, возвращает количество
+    переданных клиентов
+    """
+    with transaction.atomic():
+        _update_owner(Contact.objects.filter(owner__in=old_owners), new_owner)
+        _update_owner(Activity.objects.filter(owner__in=old_owners), new_owner)
+        return _update_owner(Client.objects.filter(owner__in=old_owners), new_owner)
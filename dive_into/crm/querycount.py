@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Подсчет SQL запросов каждого запроса к сайту (QueryCountMiddleware,
+включается settings.CRM_QUERY_COUNT).
+
+Для запроса собираются количество запросов к базе, их общее время и
+повторяющиеся запросы: запросы с одинаковым текстом без учета значений
+параметров (fingerprint). Запрос, повторенный CRM_QUERY_REPEAT_LIMIT и
+более раз, - признак N+1 (запрос в цикле по объектам страницы).
+Превышение бюджета представления (CRM_QUERY_BUDGETS по имени url,
+CRM_QUERY_BUDGET для остальных) или N+1 записывается в лог предупреждением,
+при CRM_QUERY_HEADERS результаты добавляются и в заголовки ответа
+X-CRM-Queries, X-CRM-Query-Time и X-CRM-Repeated-Queries.
+
+Те же бюджеты проверяются тестами (см. QueryBudgetTest), report
+собирает статистику и вне запросов к сайту.
+"""
+import logging
+import re
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.signals import request_started
+from django.db import connections, reset_queries
+from django.utils.deprecation import MiddlewareMixin
+
+logger = logging.getLogger(__name__)
+
+STRING_RE = re.compile(r"'(?:[^']|'')*'")
+NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+IN_RE = re.compile(r'\bIN \((?:\?, )*\?\)')
+
+# Количество открытых QueryReport(across_requests=True), пока они есть,
+# request_started не очищает connection.queries_log
+_held = [0]
+_held_lock = threading.Lock()
+
+
+def budget(view_name):
+    """
+    Допустимое количество запросов представления с именем url view_name
+    """
+    budgets = getattr(settings, 'CRM_QUERY_BUDGETS', {})
+    return budgets.get(view_name, getattr(settings, 'CRM_QUERY_BUDGET', 12))
+
+
+def repeat_limit():
+    return getattr(settings, 'CRM_QUERY_REPEAT_LIMIT', 3)
+
+
+def fingerprint(sql):
+    """
+    Текст запроса без значений параметров: строки и числа заменяются на ?,
+    списки IN (...) любой длины - на IN (...)
+    """
+    sql = NUMBER_RE.sub('?', STRING_RE.sub('?', sql))
+    return IN_RE.sub('IN (...)', sql)
+
+
+def _hold_queries_log():
+    with _held_lock:
+        if not _held[0]:
+            request_started.disconnect(reset_queries)
+        _held[0] += 1
+
+
+def _release_queries_log():
+    with _held_lock:
+        _held[0] -= 1
+        if not _held[0]:
+            request_started.connect(reset_queries)
+
+
+class QueryReport(object):
+    """
+    Запросы ко всем базам, выполненные между start и stop. Запросы
+    записываются так же, как при DEBUG=True, но на время отчета
+    connection.queries_log заменяется пустым списком без ограничения длины:
+    в заполненном queries_log (не более 9000 запросов) позиция начала
+    отчета не сдвигается, и отчет оказался бы пустым. В stop запросы
+    отчета добавляются в прежний queries_log (его видят внешние отчеты
+    и CaptureQueriesContext).
+
+    В начале каждого запроса к сайту Django очищает queries_log
+    (reset_queries), поэтому отчет, охватывающий запросы к сайту
+    (across_requests, например через тестовый клиент), на это время
+    отключает очистку. Middleware начинает отчет уже после очистки
+    и отключать ее не должен: в многопоточном сервере это остановило
+    бы очистку для всех потоков
+    """
+    def __init__(self, across_requests=True):
+        self.queries = []
+        self.across_requests = across_requests
+        self._state = []
+        self._held = False
+
+    def start(self):
+        if self.across_requests:
+            _hold_queries_log()
+            self._held = True
+        for connection in connections.all():
+            self._state.append((connection, connection.force_debug_cursor, connection.queries_log))
+            connection.queries_log = deque()
+            connection.force_debug_cursor = True
+
+    def stop(self):
+        for connection, force_debug_cursor, queries_log in self._state:
+            connection.force_debug_cursor = force_debug_cursor
+            queries = list(connection.queries_log)
+            self.queries.extend(queries)
+            queries_log.extend(queries)
+            connection.queries_log = queries_log
+        if self._held:
+            _release_queries_log()
+            self._held = False
+        self._state = []
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def time(self):
+        return sum(float(query['time']) for query in self.queries)
+
+    def repeated(self, limit=None):
+        """
+        Повторяющиеся запросы: список пар (fingerprint, количество),
+        повторенных не меньше limit раз
+        """
+        limit = repeat_limit() if limit is None else limit
+        counts = Counter(fingerprint(query['sql']) for query in self.queries)
+        return [(sql, count) for sql, count in counts.most_common() if count >= limit]
+
+
+@contextmanager
+def report():
+    """
+    QueryReport запросов, выполненных внутри блока with
+    """
+    result = QueryReport()
+    result.start()
+    try:
+        yield result
+    finally:
+        result.stop()
+
+
+class QueryCountMiddleware(MiddlewareMixin):
+    """
+    Подсчет запросов к базе для каждого запроса к сайту, должен быть первым
+    в MIDDLEWARE_CLASSES, чтобы учитывались и запросы сессии и пользователя
+    """
+    def __init__(self, get_response=None):
+        if not getattr(settings, 'CRM_QUERY_COUNT', False):
+            raise MiddlewareNotUsed
+        super(QueryCountMiddleware, self).__init__(get_response)
+
+    def process_request(self, request):
+        request._crm_queries = QueryReport(across_requests=False)
+        request._crm_queries.start()
+
+    def process_response(self, request, response):
+        result = getattr(request, '_crm_queries', None)
+        if result is None:
+            return response
+        result.stop()
+
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else None
+        limit = budget(view_name)
+        repeated = result.repeated()
+        if result.count > limit:
+            logger.warning('%s %s: %d queries (budget %d), %.3f s', request.method, request.path,
+                           result.count, limit, result.time)
+        for sql, count in repeated:
+            logger.warning('%s %s: query repeated %d times (N+1?): %s', request.method, request.path,
+                           count, sql)
+
+        if getattr(settings, 'CRM_QUERY_HEADERS', False):
+            response['X-CRM-Queries'] = str(result.count)
+            response['X-CRM-Query-Time'] = '{:.3f}'.format(result.time)
+            response['X-CRM-Repeated-Queries'] = str(sum(count for sql, count in repeated))
+        return response
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Проверка планов запросов основных представлений через EXPLAIN QUERY PLAN
+(только SQLite). Используется командой check_query_plans и тестами:
+каждый запрос с ограничением по владельцу/клиенту должен идти по индексу,
+а не полным просмотром таблицы
+"""
+import re
+
+from django.db import connection
+from django.http import HttpRequest, QueryDict
+
+from .models import Client, Contact, Activity
+from . import views
+
+SCAN_RE = re.compile(r'^SCAN (?:TABLE )?(\w+)(?! VIRTUAL TABLE)')
+
+
+def explain(queryset):
+    """
+    Строки плана запроса (столбец detail EXPLAIN QUERY PLAN)
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def full_scans(queryset):
+    """
+    Строки плана с полным просмотром таблиц
+    """
+    tables = set(connection.introspection.table_names())
+    return [detail for detail in explain(queryset)
+            if SCAN_RE.match(detail) and SCAN_RE.match(detail).group(1) in tables]
+
+
+def _view_queryset(view_class, user, **params):
+    request = HttpRequest()
+    request.user = user
+    request.GET = QueryDict('', mutable=True)
+    request.GET.update(params)
+    view = view_class()
+    view.request, view.args, view.kwargs = request, (), {}
+    return view, view.get_queryset()
+
+
+def main_querysets(user):
+    """
+    Запросы основных страниц и форм для пользователя user,
+    список пар (название, queryset)
+    """
+    querysets = []
+    for name, view_class in (('clients', views.ClientsData),
+                             ('contacts', views.ContactsData),
+                             ('activities', views.ActivitiesData)):
+        view, queryset = _view_queryset(view_class, user)
+        querysets.append((name, queryset.values('pk')))
+        querysets.append((name + ' page', view.order_queryset(queryset, {})[:view.paginate_by]))
+
+    view, queryset = _view_queryset(views.ClientsData, user)
+    querysets.append(('clients by name', view.order_queryset(queryset, {'order[0][column]': '0'})[:10]))
+
+    view, queryset = _view_queryset(views.ClientLookup, user, q='a')
+    querysets.append(('form clients', queryset[:view.paginate_by]))
+    view, queryset = _view_queryset(views.ContactLookup, user, client='1')
+    querysets.append(('form contacts', queryset[:view.paginate_by]))
+
+    user_clients = Client.objects.for_user(user)
+    querysets.extend([
+        ('search clients', user_clients.filter(name__startswith='a')),
+        ('activities timeline', Activity.objects.for_user(user).order_by('-send_date')[:10]),
+        ('client contacts', Contact.objects.filter(client_id=1)),
+        ('client activities', Activity.objects.filter(client_id=1).order_by('send_date')),
+    ])
+    return querysets
+
+
+def check(user):
+    """
+    Список пар (название, строки плана с полным просмотром) для запросов
+    с полным просмотром таблиц, пустой - если все запросы идут по индексам
+    """
+    problems = []
+    for name, queryset in main_querysets(user):
+        scans = full_scans(queryset)
+        if scans:
+            problems.append((name, scans))
+    return problems
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Полнотекстовый поиск по клиентам, контактам и активностям.
+
+Индекс хранится в виртуальной таблице SQLite FTS5 crm_search (создается
+миграцией 0003_search_index), поддерживается в актуальном состоянии
+сигналами (см. signals.py) и может быть полностью перестроен командой
+rebuild_search_index.
+
+rowid записи индекса однозначно определяет объект: id * len(KINDS) + номер
+модели в KINDS. Владелец записан в столбец owner токеном вида "o<id>",
+поэтому ограничение выдачи по владельцу выполняет сам индекс.
+"""
+import re
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+
+from .models import Client, Contact, Activity
+
+TABLE = 'crm_search'
+KINDS = (Client, Contact, Activity)
+
+# Выражения для столбцов title и body индекса по каждой модели
+DOCUMENTS = {
+    Client: ("name", "''"),
+    Contact: ("first_name || ' ' || last_name", "email || ' ' || phone"),
+    Activity: ("title", "text"),
+}
+
+# Поля для поиска без индекса (не SQLite)
+FALLBACK_FIELDS = {
+    Client: ('name',),
+    Contact: ('first_name', 'last_name', 'email'),
+    Activity: ('title', 'text'),
+}
+
+MAX_WORDS = 10
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def is_available():
+    return connection.vendor == 'sqlite'
+
+
+def _select_documents(model, where=''):
+    """
+    SELECT, формирующий записи индекса прямо из таблицы модели
+    """
+    title, body = DOCUMENTS[model]
+    return ("SELECT id * {kinds} + {kind}, 'o' || COALESCE(owner_id, ''), {title}, {body} "
+            "FROM {table} {where}").format(kinds=len(KINDS), kind=KINDS.index(model),
+                                           title=title, body=body,
+                                           table=model._meta.db_table, where=where)
+
+
+def _index(model, where, params):
+    if not is_available():
+        return
+    sql = 'INSERT OR REPLACE INTO {} (rowid, owner, title, body) {}'.format(TABLE, _select_documents(model, where))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def index_object(obj):
+    """
+    Добавляет или обновляет объект в индексе
+    """
+    _index(type(obj), 'WHERE id = %s', [obj.pk])
+
+
+def index_queryset(queryset):
+    """
+    Добавляет или обновляет в индексе все объекты queryset одним запросом,
+    используется после массовых изменений (update, bulk_create), которые
+    не вызывают сигналы
+    """
+    sql, params = queryset.values('pk').query.sql_with_params()
+    _index(queryset.model, 'WHERE id IN ({})'.format(sql), params)
+
+
+def set_owner(queryset, owner):
+    """
+    Меняет владельца в индексе для всех объектов queryset одним запросом,
+    вызывается до массового изменения владельца самих объектов
+    """
+    if not is_available():
+        return
+    rowids = queryset.annotate(search_rowid=F('pk') * len(KINDS) + KINDS.index(queryset.model))
+    sql, params = rowids.values('search_rowid').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute('UPDATE {} SET owner = %s WHERE rowid IN ({})'.format(TABLE, sql),
+                       [u'o{}'.format(owner.pk if owner else '')] + list(params))
+
+
+def remove_object(obj):
+    if not is_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('DELETE FROM {} WHERE rowid = %s'.format(TABLE),
+                       [obj.pk * len(KINDS) + KINDS.index(type(obj))])
+
+
+def rebuild():
+    """
+    Полностью перестраивает индекс по данным таблиц
+    """
+    if not is_available():
+        return
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('DELETE FROM {}'.format(TABLE))
+        for model in KINDS:
+            cursor.execute('INSERT INTO {} (rowid, owner, title, body) {}'.format(TABLE, _select_documents(model)))
+        cursor.execute("INSERT INTO {0} ({0}) VALUES ('optimize')".format(TABLE))
+
+
+def build_query(user, text):
+    """
+    Выражение MATCH: все слова запроса как префиксы,
+    только в записях указанного владельца
+    """
+    words = WORD_RE.findall(text.lower())[:MAX_WORDS]
+    if not words:
+        return None
+    terms = u' '.join(u'"{}"*'.format(word) for word in words)
+    return u'owner : "o{}" AND {{title body}} : ({})'.format(user.pk, terms)
+
+
+def _fetch(model, ids, user):
+    queryset = model.objects.for_user(user)
+    if model is not Client:
+        queryset = queryset.select_related('client')
+    return queryset.in_bulk(ids)
+
+
+def search(user, text, offset=0, limit=20):
+    """
+    Ищет объекты пользователя, возвращает список объектов Client, Contact
+    и Activity в порядке релевантности
+    """
+    if not is_available():
+        return _fallback_search(user, text, offset, limit)
+
+    query = build_query(user, text)
+    if query is None:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT rowid FROM {0} WHERE {0} MATCH %s '
+                       'ORDER BY bm25({0}, 0.0, 10.0, 1.0) LIMIT %s OFFSET %s'.format(TABLE),
+                       [query, limit, offset])
+        rowids = [row[0] for row in cursor.fetchall()]
+
+    ids = dict((model, []) for model in KINDS)
+    for rowid in rowids:
+        ids[KINDS[rowid % len(KINDS)]].append(rowid // len(KINDS))
+    objects = dict((model, _fetch(model, model_ids, user)) for model, model_ids in ids.items() if model_ids)
+
+    results = []
+    for rowid in rowids:
+        model_objects = objects[KINDS[rowid % len(KINDS)]]
+        obj = model_objects.get(rowid // len(KINDS))
+        if obj is not None:
+            results.append(obj)
+    return results
+
+
+def _fallback_search(user, text, offset, limit):
+    text = text.strip()
+    if not text:
+        return []
+    results = []
+    for model in KINDS:
+        condition = Q()
+        for field in FALLBACK_FIELDS[model]:
+            condition |= Q(**{'{}__icontains'.format(field): text})
+        results.extend(model.objects.for_user(user).filter(condition).order_by('pk')[:offset + limit])
+    return results[offset:offset + limit]
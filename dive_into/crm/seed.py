@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Синтетические данные для проверки crm на объемах production: пользователи
+с заданным количеством клиентов, контактов у клиента и активностей
+у контакта, часть активностей отправлена (команда seed_data, benchmark.py).
+
+Объекты создаются bulk_create пачками по batch_size клиентов со всеми их
+контактами и активностями, каждая пачка - в своей транзакции вместе
+с поисковым индексом и статистикой клиентов, как при импорте (importer.py).
+Данные определяются параметром seed, повторный запуск для тех же
+пользователей добавляет новых клиентов.
+"""
+import datetime
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Client, Contact, Activity
+from . import importer, search, stats, cache
+
+BATCH_SIZE = 100
+WORDS = ('alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf', 'hotel', 'india', 'juliet',
+         'kilo', 'lima', 'mike', 'november', 'oscar', 'papa', 'quebec', 'romeo', 'sierra', 'tango')
+
+
+class Result(object):
+    """
+    Количество созданных объектов
+    """
+    def __init__(self):
+        self.users = 0
+        self.clients = 0
+        self.contacts = 0
+        self.activities = 0
+        self.sent = 0
+
+    def as_dict(self):
+        return dict((name, getattr(self, name)) for name in ('users', 'clients', 'contacts', 'activities', 'sent'))
+
+
+def get_users(count, prefix='seed', password='seed'):
+    """
+    Пользователи <prefix>1 ... <prefix><count>, недостающие создаются одним
+    bulk_create (пароль хэшируется один раз для всех)
+    """
+    usernames = ['{}{}'.format(prefix, i) for i in range(1, count + 1)]
+    existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+    hashed = make_password(password)
+    User.objects.bulk_create([User(username=username, password=hashed, email='{}@example.com'.format(username))
+                              for username in usernames if username not in existing])
+    users = dict((user.username, user) for user in User.objects.filter(username__in=usernames))
+    return [users[username] for username in usernames], len(usernames) - len(existing)
+
+
+class Seeder(object):
+    """
+    Создает данные пользователя owner: clients клиентов, у каждого contacts
+    контактов, у каждого контакта activities активностей, доля sent_ratio
+    активностей отправлена в течение последнего года
+    """
+    def __init__(self, clients, contacts, activities, sent_ratio=0.5, batch_size=BATCH_SIZE, seed=0):
+        self.clients = clients
+        self.contacts = contacts
+        self.activities = activities
+        self.sent_ratio = sent_ratio
+        self.batch_size = batch_size
+        self.random = random.Random(seed)
+        self.now = timezone.now()
+        self.result = Result()
+
+    def words(self, count):
+        return u' '.join(self.random.choice(WORDS) for i in range(count))
+
+    def run(self, owner):
+        offset = Client.objects.for_user(owner).count()
+        for start in range(0, self.clients, self.batch_size):
+            numbers = range(offset + start, offset + min(start + self.batch_size, self.clients))
+            with transaction.atomic():
+                self.create_batch(owner, numbers)
+        cache.bump(owner.pk)
+        return self.result
+
+    def create_batch(self, owner, numbers):
+        clients = [Client(name=u'{} {} {}'.format(owner.username, self.words(1), number),
+                          loyal=self.random.random() < 0.3, owner=owner) for number in numbers]
+        Client.objects.bulk_create(clients)
+        client_ids = list(importer.created(Client, owner, clients).order_by('pk').values_list('pk', flat=True))
+
+        contacts = []
+        for client_id in client_ids:
+            for i in range(self.contacts):
+                first_name, last_name = self.words(1).title(), self.words(1).title()
+                contacts.append(Contact(first_name=first_name, last_name=last_name,
+                                        email=u'{}.{}{}@example.com'.format(first_name, last_name, client_id).lower(),
+                                        phone=self.random.randint(1000000, 9999999), client_id=client_id,
+                                        active=self.random.random() < 0.9, owner=owner))
+        Contact.objects.bulk_create(contacts)
+        created_contacts = importer.created(Contact, owner, contacts)
+
+        activities = []
+        for contact_id, client_id in created_contacts.order_by('pk').values_list('pk', 'client_id'):
+            for i in range(self.activities):
+                send_date = None
+                if self.random.random() < self.sent_ratio:
+                    send_date = self.now - datetime.timedelta(seconds=self.random.randint(0, 365 * 24 * 60 * 60))
+                    self.result.sent += 1
+                activities.append(Activity(title=self.words(3)[:30], text=self.words(40), client_id=client_id,
+                                           contact_id=contact_id, send_date=send_date, owner=owner))
+        Activity.objects.bulk_create(activities)
+
+        for model, objects in ((Client, clients), (Contact, contacts), (Activity, activities)):
+            if objects:
+                search.index_queryset(importer.created(model, owner, objects))
+        stats.recompute(client_ids)
+
+        self.result.clients += len(clients)
+        self.result.contacts += len(contacts)
+        self.result.activities += len(activities)
+
+
+def seed(users, clients, contacts, activities, sent_ratio=0.5, batch_size=BATCH_SIZE, prefix='seed',
+         password='seed', seed=0):
+    """
+    Создает данные users пользователей (см. Seeder), возвращает Result
+    """
+    owners, created_users = get_users(users, prefix, password)
+    seeder = Seeder(clients, contacts, activities, sent_ratio, batch_size, seed)
+    for owner in owners:
+        seeder.run(owner)
+    seeder.result.users = created_users
+    return seeder.result
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Обработчики сигналов моделей crm
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+
+from .models import Client, Contact, Activity
+from . import search, stats, cache
+
+
+@receiver(post_save, sender=Client)
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Activity)
+def update_search_index(sender, instance, raw=False, **kwargs):
+    if not raw:
+        search.index_object(instance)
+
+
+@receiver(post_delete, sender=Client)
+@receiver(post_delete, sender=Contact)
+@receiver(post_delete, sender=Activity)
+def remove_from_search_index(sender, instance, **kwargs):
+    search.remove_object(instance)
+
+
+@receiver(post_save, sender=Contact)
+def update_contact_stats(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        stats.contact_saved(instance, created)
+
+
+@receiver(post_delete, sender=Contact)
+def update_deleted_contact_stats(sender, instance, **kwargs):
+    stats.contact_deleted(instance)
+
+
+@receiver(post_save, sender=Activity)
+def update_activity_stats(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        stats.activity_saved(instance, created)
+
+
+@receiver(post_delete, sender=Activity)
+def update_deleted_activity_stats(sender, instance, **kwargs):
+    stats.activity_deleted(instance)
+
+
+@receiver(post_save, sender=Client)
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Activity)
+@receiver(post_delete, sender=Client)
+@receiver(post_delete, sender=Contact)
+@receiver(post_delete, sender=Activity)
+def invalidate_owner_cache(sender, instance, **kwargs):
+    # При смене владельца устаревают страницы и прежнего владельца
+    cache.bump(instance.owner_id, instance.loaded_value('owner_id'))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    cache.bump(instance.pk)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Настройка соединений SQLite и обслуживание файла базы.
+
+configure подключается к сигналу connection_created (см. apps.py) и
+выполняет PRAGMA из PRAGMAS (или settings.CRM_SQLITE_PRAGMAS, если задан)
+для каждого нового соединения: журнал WAL (чтение не блокируется записью),
+ожидание блокировки вместо немедленной ошибки "database is locked",
+synchronous=NORMAL (в режиме WAL fsync только при checkpoint), размер
+кэша страниц и mmap. Соединения переиспользуются между запросами
+(CONN_MAX_AGE), поэтому PRAGMA выполняются редко.
+
+maintenance (команда sqlite_maintenance) собирает статистику для
+планировщика запросов (ANALYZE), возвращает свободные страницы файлу
+(incremental_vacuum, требует auto_vacuum=INCREMENTAL - см.
+enable_incremental_vacuum) и переносит WAL в базу (wal_checkpoint).
+"""
+from django.conf import settings
+from django.db import connections
+
+PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('busy_timeout', 5000),
+    ('synchronous', 'NORMAL'),
+    # Отрицательное значение - размер в килобайтах
+    ('cache_size', -20000),
+    ('mmap_size', 256 * 1024 * 1024),
+    ('temp_store', 'MEMORY'),
+)
+INCREMENTAL = 2
+
+
+def pragmas():
+    return getattr(settings, 'CRM_SQLITE_PRAGMAS', PRAGMAS)
+
+
+def configure(sender, connection, **kwargs):
+    """
+    Обработчик connection_created: PRAGMA нового соединения SQLite
+    """
+    if connection.vendor != 'sqlite':
+        return
+    # Курсор самого sqlite3, соединение Django еще не готово к запросам
+    cursor = connection.connection.cursor()
+    try:
+        for name, value in pragmas():
+            cursor.execute('PRAGMA {} = {}'.format(name, value))
+    finally:
+        cursor.close()
+
+
+def pragma(cursor, name):
+    cursor.execute('PRAGMA {}'.format(name))
+    return cursor.fetchone()[0]
+
+
+def enable_incremental_vacuum(using='default'):
+    """
+    Включает auto_vacuum=INCREMENTAL, для существующей базы режим
+    применяется полным VACUUM (файл перезаписывается целиком, запись
+    в базу на это время заблокирована)
+    """
+    with connections[using].cursor() as cursor:
+        if pragma(cursor, 'auto_vacuum') == INCREMENTAL:
+            return False
+        cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        cursor.execute('VACUUM')
+    return True
+
+
+def maintenance(analyze=True, vacuum_pages=0, checkpoint='TRUNCATE', using='default'):
+    """
+    ANALYZE, incremental_vacuum (vacuum_pages страниц, 0 - все свободные,
+    None - не выполнять) и wal_checkpoint(checkpoint, только вне транзакции),
+    возвращает словарь с результатами
+    """
+    result = {}
+    with connections[using].cursor() as cursor:
+        if analyze:
+            cursor.execute('ANALYZE')
+            result['analyzed'] = True
+
+        if vacuum_pages is not None:
+            if pragma(cursor, 'auto_vacuum') == INCREMENTAL:
+                free = pragma(cursor, 'freelist_count')
+                cursor.execute('PRAGMA incremental_vacuum({:d})'.format(vacuum_pages))
+                # Каждый шаг PRAGMA освобождает одну страницу, поэтому результат читается целиком
+                cursor.fetchall()
+                result['freed_pages'] = free - pragma(cursor, 'freelist_count')
+            else:
+                result['freed_pages'] = None
+
+        if checkpoint:
+            if connections[using].in_atomic_block:
+                # Внутри транзакции SQLite не выполняет checkpoint ("database table is locked")
+                result['checkpoint'] = None
+            else:
+                cursor.execute('PRAGMA wal_checkpoint({})'.format(checkpoint))
+                busy, log, checkpointed = cursor.fetchone()
+                result['checkpoint'] = {'busy': bool(busy), 'wal_pages': log, 'checkpointed_pages': checkpointed}
+    return result
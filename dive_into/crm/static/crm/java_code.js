@@ -1,3 +1,91 @@
     $(document).ready(function() {
-    $('#contacts_table').DataTable();
+    $('#contacts_table').each(function() {
+        var table = $(this);
+        if (table.data('source')) {
+            // Первая страница уже отрисована сервером, остальные страницы,
+            // сортировку и поиск DataTables запрашивает по адресу data-source
+            table.DataTable({
+                serverSide: true,
+                ajax: table.data('source'),
+                deferLoading: table.data('total'),
+                order: []
+            });
+        } else {
+            table.DataTable();
+        }
+    });
+
+    // Поля LookupSelect (см. forms.py): сервер выводит только выбранный
+    // вариант, остальные загружаются по адресу data-lookup
+    function fillOptions(select, data, append) {
+        var selected = select.val();
+        if (!append) {
+            select.find('option').filter(function() {
+                return this.value && this.value !== selected;
+            }).remove();
+        }
+        select.find('option.lookup-more').remove();
+        $.each(data.results, function(i, item) {
+            if (String(item.id) !== selected) {
+                select.append($('<option>').val(item.id).text(item.text));
+            }
+        });
+        if (data.more) {
+            select.append($('<option class="lookup-more" value="">').text('...'));
+        }
+    }
+
+    $('select[data-lookup]').each(function() {
+        var select = $(this);
+        var form = select.closest('form');
+        var dependsOn = select.data('depends-on');
+
+        if (dependsOn) {
+            // Варианты зависят от другого поля формы (контакты выбранного клиента)
+            var parent = form.find('[name="' + dependsOn + '"]');
+            var load = function() {
+                var params = {};
+                params[dependsOn] = parent.val();
+                if (!parent.val()) {
+                    fillOptions(select, {results: [], more: false});
+                    return;
+                }
+                $.getJSON(select.data('lookup'), params, function(data) {
+                    if (!data.results.some(function(item) { return String(item.id) === select.val(); })) {
+                        select.val('');
+                    }
+                    fillOptions(select, data);
+                });
+            };
+            parent.on('change', load);
+            select.one('focus', load);
+            return;
+        }
+
+        // Поиск по началу имени с подгрузкой следующих страниц
+        var search = $('<input type="text" class="form-control lookup-search" placeholder="Search...">');
+        var page = 1, timer = null;
+        var load = function(append) {
+            $.getJSON(select.data('lookup'), {q: search.val(), page: page}, function(data) {
+                fillOptions(select, data, append);
+            });
+        };
+        search.insertBefore(select).on('input', function() {
+            clearTimeout(timer);
+            timer = setTimeout(function() { page = 1; load(false); }, 300);
+        });
+        select.one('focus', function() { load(false); });
+
+        // Последний вариант "..." загружает следующую страницу
+        var previous = select.val();
+        select.on('change', function() {
+            if (select.find('option:selected').hasClass('lookup-more')) {
+                select.val(previous);
+                page += 1;
+                load(true);
+            } else {
+                previous = select.val();
+            }
+        });
+    });
 } );
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Раздача статических файлов из STATIC_ROOT самим WSGI приложением для
+развертываний без отдельного веб-сервера (settings.CRM_SERVE_STATIC,
+см. wsgi.py).
+
+Файлы с хэшем содержимого в имени (их выдает {% static %} при
+CompressedManifestStaticFilesStorage) отдаются с Cache-Control на год
+и immutable, остальные - с коротким сроком. Если клиент принимает br
+или gzip и рядом лежит сжатая копия (<имя>.br, <имя>.gz), отдается она.
+"""
+import mimetypes
+import os
+import posixpath
+import re
+
+from django.conf import settings
+from django.utils.http import http_date, quote_etag
+
+FOREVER = 'public, max-age=31536000, immutable'
+SHORT = 'public, max-age={}'.format(getattr(settings, 'CRM_STATIC_MAX_AGE', 60))
+# Хэш, который ManifestStaticFilesStorage добавляет к имени: name.<12 hex>.ext
+HASHED_RE = re.compile(r'\.[0-9a-f]{12}\.[^./]+$')
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def _accepts(environ, encoding):
+    accepted = [part.split(';')[0].strip() for part in environ.get('HTTP_ACCEPT_ENCODING', '').split(',')]
+    return encoding in accepted
+
+
+def _path(root, url_path):
+    """
+    Путь к файлу в root по пути url_path, None для выхода за пределы root
+    """
+    normalized = posixpath.normpath(url_path).lstrip('/')
+    if normalized.startswith('..') or '\x00' in normalized:
+        return None
+    path = os.path.join(root, *normalized.split('/'))
+    return path if os.path.isfile(path) else None
+
+
+class StaticFilesApplication(object):
+    """
+    WSGI обертка над application: запросы к STATIC_URL обслуживаются
+    из STATIC_ROOT, остальные передаются application
+    """
+    def __init__(self, application, root=None, prefix=None):
+        self.application = application
+        self.root = root or settings.STATIC_ROOT
+        self.prefix = prefix or settings.STATIC_URL
+
+    def __call__(self, environ, start_response):
+        url_path = environ.get('PATH_INFO', '')
+        if environ.get('REQUEST_METHOD') not in ('GET', 'HEAD') or not url_path.startswith(self.prefix):
+            return self.application(environ, start_response)
+        path = _path(self.root, url_path[len(self.prefix):])
+        if path is None:
+            return self.application(environ, start_response)
+        return self.serve(environ, start_response, path)
+
+    def serve(self, environ, start_response, path):
+        content_type, encoding = mimetypes.guess_type(path)
+        headers = [('Content-Type', content_type or 'application/octet-stream'),
+                   ('Cache-Control', FOREVER if HASHED_RE.search(path) else SHORT),
+                   ('Vary', 'Accept-Encoding')]
+        for name, suffix in ENCODINGS:
+            if encoding is None and os.path.isfile(path + suffix) and _accepts(environ, name):
+                path = path + suffix
+                headers.append(('Content-Encoding', name))
+                break
+
+        stat = os.stat(path)
+        etag = quote_etag('{:x}-{:x}'.format(int(stat.st_mtime), stat.st_size))
+        headers += [('ETag', etag), ('Last-Modified', http_date(stat.st_mtime))]
+        if environ.get('HTTP_IF_NONE_MATCH') == etag:
+            start_response('304 Not Modified', headers)
+            return []
+
+        headers.append(('Content-Length', str(stat.st_size)))
+        start_response('200 OK', headers)
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            return []
+        source = open(path, 'rb')
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if file_wrapper:
+            return file_wrapper(source, 8192)
+        return iter(lambda: source.read(8192), b'')
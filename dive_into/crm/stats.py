@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Денормализованная статистика клиента: activity_count, contact_count,
+sent_count и last_sent_at.
+
+При создании, удалении, переносе к другому клиенту и отправке
+контактов/активностей счетчики меняются инкрементально (обработчики
+в signals.py), полный пересчет выполняет recompute (команда
+recompute_client_stats).
+"""
+from django.db import connection
+from django.utils import timezone
+from django.db.models import Case, DateTimeField, F, Max, Q, Value, When
+
+from .models import Client, Activity
+
+RECOMPUTE_SQL = '''
+    UPDATE crm_client SET
+        version = version + 1,
+        updated_at = %s,
+        activity_count = (SELECT COUNT(*) FROM crm_activity
+                          WHERE crm_activity.client_id = crm_client.id),
+        sent_count = (SELECT COUNT(*) FROM crm_activity
+                      WHERE crm_activity.client_id = crm_client.id AND crm_activity.send_date IS NOT NULL),
+        last_sent_at = (SELECT MAX(crm_activity.send_date) FROM crm_activity
+                        WHERE crm_activity.client_id = crm_client.id),
+        contact_count = (SELECT COUNT(*) FROM crm_contact
+                         WHERE crm_contact.client_id = crm_client.id)
+'''
+
+
+def recompute(client_ids=None):
+    """
+    Пересчитывает статистику одним UPDATE для всех клиентов
+    или только для client_ids, возвращает количество обновленных клиентов
+    """
+    sql, params = RECOMPUTE_SQL, [connection.ops.adapt_datetimefield_value(timezone.now())]
+    if client_ids is not None:
+        client_ids = [i for i in set(client_ids) if i is not None]
+        if not client_ids:
+            return 0
+        sql += 'WHERE id IN ({})'.format(', '.join(['%s'] * len(client_ids)))
+        params += client_ids
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def adjust(client_id, activities=0, contacts=0, sent=0, sent_at=None):
+    """
+    Изменяет счетчики клиента на указанные величины, sent_at - дата
+    отправки, которая становится last_sent_at, если она позже текущей
+    """
+    if client_id is None:
+        return
+    values = {}
+    if activities:
+        values['activity_count'] = F('activity_count') + activities
+    if contacts:
+        values['contact_count'] = F('contact_count') + contacts
+    if sent:
+        values['sent_count'] = F('sent_count') + sent
+    if sent_at is not None:
+        values['last_sent_at'] = Case(When(Q(last_sent_at__isnull=True) | Q(last_sent_at__lt=sent_at),
+                                           then=Value(sent_at, output_field=DateTimeField())),
+                                      default=F('last_sent_at'),
+                                      output_field=DateTimeField())
+    if values:
+        Client.objects.filter(pk=client_id).update(version=F('version') + 1, updated_at=timezone.now(), **values)
+
+
+def refresh_last_sent(client_id):
+    """
+    Пересчитывает last_sent_at, когда отправленная активность
+    удалена или перенесена к другому клиенту
+    """
+    if client_id is None:
+        return
+    last = Activity.objects.filter(client_id=client_id).aggregate(last=Max('send_date'))['last']
+    Client.objects.filter(pk=client_id).update(last_sent_at=last, version=F('version') + 1,
+                                               updated_at=timezone.now())
+
+
+def activities_sent(activities, send_date):
+    """
+    Учитывает активности queryset activities, отправленные одним массовым
+    UPDATE с датой send_date (см. ActivityQuerySet.send): один запрос
+    вне зависимости от количества активностей и клиентов
+    """
+    clients_sql, clients_params = activities.filter(send_date=send_date).values('client_id').query.sql_with_params()
+    send_date = connection.ops.adapt_datetimefield_value(send_date)
+    with connection.cursor() as cursor:
+        cursor.execute('''
+            UPDATE crm_client SET
+                version = version + 1,
+                updated_at = %s,
+                sent_count = sent_count + (SELECT COUNT(*) FROM crm_activity
+                                           WHERE crm_activity.client_id = crm_client.id
+                                           AND crm_activity.send_date = %s),
+                last_sent_at = %s
+            WHERE id IN ({})
+        '''.format(clients_sql), [send_date, send_date, send_date] + list(clients_params))
+
+
+def contact_saved(contact, created):
+    old_client_id = None if created else contact.loaded_value('client_id', contact.client_id)
+    if old_client_id != contact.client_id:
+        adjust(old_client_id, contacts=-1)
+        adjust(contact.client_id, contacts=1)
+
+
+def contact_deleted(contact):
+    adjust(contact.client_id, contacts=-1)
+
+
+def activity_saved(activity, created):
+    if created:
+        old_client_id, old_send_date = None, None
+    else:
+        old_client_id = activity.loaded_value('client_id', activity.client_id)
+        old_send_date = activity.loaded_value('send_date', activity.send_date)
+
+    if old_client_id != activity.client_id:
+        adjust(old_client_id, activities=-1, sent=-1 if old_send_date else 0)
+        if old_send_date:
+            refresh_last_sent(old_client_id)
+        adjust(activity.client_id, activities=1, sent=1 if activity.send_date else 0,
+               sent_at=activity.send_date)
+    elif activity.send_date != old_send_date:
+        if not old_send_date:
+            adjust(activity.client_id, sent=1, sent_at=activity.send_date)
+        elif not activity.send_date:
+            adjust(activity.client_id, sent=-1)
+            refresh_last_sent(activity.client_id)
+        else:
+            refresh_last_sent(activity.client_id)
+
+
+def activity_deleted(activity):
+    adjust(activity.client_id, activities=-1, sent=-1 if activity.send_date else 0)
+    if activity.send_date:
+        refresh_last_sent(activity.client_id)
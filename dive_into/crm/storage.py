@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Хранилище статических файлов для production (settings.STATICFILES_STORAGE):
+имена с хэшем содержимого через манифест, как у ManifestStaticFilesStorage,
+и сжатые копии <имя>.gz и <имя>.br (если установлен brotli) рядом с
+каждым текстовым файлом, чтобы при раздаче не сжимать их на лету
+(см. staticserve.py)
+"""
+import gzip
+import io
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = ('.css', '.js', '.svg', '.eot', '.ttf', '.map', '.txt', '.html', '.json', '.ico')
+# Сжатая копия, выигрывающая меньше этой доли, не сохраняется
+MIN_RATIO = 0.95
+
+
+def gzip_compress(content):
+    buffer = io.BytesIO()
+    # mtime=0 - одинаковое содержимое дает одинаковый файл при каждой сборке
+    with gzip.GzipFile(filename='', mode='wb', fileobj=buffer, compresslevel=9, mtime=0) as output:
+        output.write(content)
+    return buffer.getvalue()
+
+
+def compressors():
+    result = [('.gz', gzip_compress)]
+    if brotli is not None:
+        result.append(('.br', lambda content: brotli.compress(content, quality=11)))
+    return result
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def post_process(self, paths, dry_run=False, **options):
+        hashed = []
+        for name, hashed_name, processed in super(CompressedManifestStaticFilesStorage, self).post_process(
+                paths, dry_run, **options):
+            if hashed_name and not isinstance(processed, Exception):
+                hashed.append(hashed_name)
+            yield name, hashed_name, processed
+        if dry_run:
+            return
+
+        for name in hashed:
+            if not name.endswith(COMPRESSIBLE):
+                continue
+            with self.open(name) as source:
+                content = source.read()
+            for suffix, compress in compressors():
+                compressed = compress(content)
+                if len(compressed) < len(content) * MIN_RATIO:
+                    if self.exists(name + suffix):
+                        self.delete(name + suffix)
+                    self._save(name + suffix, ContentFile(compressed))
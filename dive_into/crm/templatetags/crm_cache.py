@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Кэширование фрагментов шаблонов (строк таблиц) в кэше crm
+"""
+from django import template
+from django.conf import settings
+from django.templatetags.cache import CacheNode
+
+from crm import cache
+
+register = template.Library()
+
+ROW_TIMEOUT = getattr(settings, 'CRM_ROW_CACHE_TIMEOUT', 24 * 60 * 60)
+
+
+@register.tag('row_cache')
+def do_row_cache(parser, token):
+    """
+    {% row_cache fragment_name var1 var2 ... %} ... {% endrow_cache %}
+
+    То же, что {% cache %} с таймаутом CRM_ROW_CACHE_TIMEOUT в кэше
+    CRM_CACHE. В var передаются id объекта и поля version объекта и
+    связанных объектов, которые выводятся в строке: при изменении любого
+    из них строка строится заново. version клиента меняется и при пересчете
+    статистики (stats.py), поэтому для строк, где выводится только имя
+    клиента, передается имя
+    """
+    nodelist = parser.parse(('endrow_cache',))
+    parser.delete_first_token()
+    tokens = token.split_contents()
+    if len(tokens) < 3:
+        raise template.TemplateSyntaxError("'%r' tag requires a fragment name and the object id." % tokens[0])
+    return CacheNode(nodelist,
+                     parser.compile_filter(str(ROW_TIMEOUT)),
+                     tokens[1],
+                     [parser.compile_filter(t) for t in tokens[2:]],
+                     parser.compile_filter('"{}"'.format(cache.ALIAS)))
@@ -1,13 +1,45 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from django.test import TestCase
+import json
+import os
+import tempfile
+
+from django.test import TestCase, TransactionTestCase
 from django.contrib.auth.models import User
 from django.core.urlresolvers import reverse
 from django.test.client import Client
-from django.db import IntegrityError
+from django.test.utils import CaptureQueriesContext
+from django.db import connection, transaction
+from django.db import IntegrityError, OperationalError
+from django.core.signals import got_request_exception
 from django.db.models import ProtectedError
+from django.core.management import call_command
+from django.core import mail
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.conf import settings
+from django.template import engines
+from django.utils.six import StringIO
+from django.contrib.staticfiles.storage import staticfiles_storage
 import models
+import search
+import queryplan
+import ownership
+import outbox
+import importer
+import exporter
+import cache
+import warmup
+import forms
+import assets
+import staticserve
+import querycount
+import seed
+import benchmark
+import loadtest
+import sqlite
+import stats
 # Create your tests here.
 
 
@@ -761,3 +793,1450 @@ class MainPageTest(TestCase):
 
 
 
+
+
+class ClientsListQueriesTest(TestCase):
+    """
+    Страница со списком клиентов должна выполнять одинаковое
+    количество запросов вне зависимости от количества клиентов
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.client.login(username='testuser', password='testpass')
+
+    def create_client(self, name, sent=True):
+        client = models.Client(name=name, loyal=True, owner=self.user)
+        client.save()
+        for i in range(2):
+            contact = models.Contact(first_name=name, last_name='test',
+                                     email='test@test.com', phone='123',
+                                     client=client, owner=self.user)
+            contact.save()
+            activity = models.Activity(title=name, text='test', contact=contact,
+                                       client=client, owner=self.user)
+            if sent:
+                activity.send()
+            activity.save()
+        return client
+
+    def test_constant_queries(self):
+        self.create_client('test1')
+        with CaptureQueriesContext(connection) as one_client:
+            self.client.get(reverse('crm:clients'))
+
+        for i in range(2, 6):
+            self.create_client('test{}'.format(i), sent=i % 2 == 0)
+        with CaptureQueriesContext(connection) as many_clients:
+            response = self.client.get(reverse('crm:clients'))
+
+        self.assertEqual(len(one_client), len(many_clients))
+        self.assertEqual(len(response.context['clients_list']), 5)
+
+    def test_stats(self):
+        self.create_client('test1')
+        self.create_client('test2', sent=False)
+        response = self.client.get(reverse('crm:clients'))
+        clients = dict((i.name, i) for i in response.context['clients_list'])
+
+        self.assertEqual(clients['test1'].activity_count, 2)
+        self.assertEqual(clients['test1'].contact_count, 2)
+        self.assertIsNotNone(clients['test1'].last_activity())
+        self.assertIsNone(clients['test2'].last_activity())
+
+
+class DataTableTest(TestCase):
+    """
+    Тест json-источников данных для DataTables
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.client.login(username='testuser', password='testpass')
+
+        for i in range(15):
+            client = models.Client(name='client{:02d}'.format(i), loyal=True, owner=self.user)
+            client.save()
+            contact = models.Contact(first_name='<b>test{}</b>'.format(i), last_name='test',
+                                     email='test@test.com', phone='123',
+                                     client=client, owner=self.user)
+            contact.save()
+            models.Activity(title='test{}'.format(i), text='test', contact=contact,
+                            client=client, owner=self.user).save()
+        models.Client(name='other', loyal=True, owner=self.user1).save()
+
+    def test_html_first_page(self):
+        #В html отдается только первая страница, остальное - через data-source
+        response = self.client.get(reverse('crm:clients'))
+        self.assertEqual(len(response.context['clients_list']), 10)
+        self.assertIn(str(reverse('crm:clients_data')), response.content)
+        self.assertIn('data-total="15"', response.content)
+
+    def test_paging(self):
+        response = self.client.get(reverse('crm:clients_data'), {'draw': 3, 'start': 10, 'length': 10})
+        data = json.loads(response.content)
+        self.assertEqual(data['draw'], 3)
+        self.assertEqual(data['recordsTotal'], 15)
+        self.assertEqual(data['recordsFiltered'], 15)
+        self.assertEqual(len(data['data']), 5)
+
+        #Размер страницы ограничен сверху
+        response = self.client.get(reverse('crm:clients_data'), {'length': -1})
+        self.assertEqual(len(json.loads(response.content)['data']), 15)
+
+    def test_order_and_search(self):
+        response = self.client.get(reverse('crm:clients_data'), {'order[0][column]': 0,
+                                                                 'order[0][dir]': 'desc',
+                                                                 'length': 3})
+        data = json.loads(response.content)
+        self.assertIn('client14', data['data'][0][0])
+        self.assertIn('client12', data['data'][2][0])
+
+        response = self.client.get(reverse('crm:clients_data'), {'search[value]': 'client1'})
+        data = json.loads(response.content)
+        self.assertEqual(data['recordsTotal'], 15)
+        self.assertEqual(data['recordsFiltered'], 5)
+
+        response = self.client.get(reverse('crm:activities_data'), {'columns[1][search][value]': 'test3'})
+        data = json.loads(response.content)
+        self.assertEqual(data['recordsFiltered'], 1)
+        self.assertIn(reverse('crm:activity', kwargs={'pk': 4}), data['data'][0][4])
+
+    def test_escaping_and_owner(self):
+        response = self.client.get(reverse('crm:contacts_data'), {'length': 1})
+        data = json.loads(response.content)
+        self.assertIn('&lt;b&gt;test0&lt;/b&gt;', data['data'][0][0])
+
+        response = self.client.get(reverse('crm:clients_data'), {'search[value]': 'other'})
+        self.assertEqual(json.loads(response.content)['recordsFiltered'], 0)
+
+        self.client.logout()
+        response = self.client.get(reverse('crm:activities_data'))
+        data = json.loads(response.content)
+        self.assertEqual(data['recordsTotal'], 0)
+        self.assertEqual(data['data'], [])
+
+
+class ListQueriesTest(TestCase):
+    """
+    Фиксируем количество запросов для страниц со списками контактов и активностей
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.client.login(username='testuser', password='testpass')
+
+        for i in range(5):
+            client = models.Client(name='test{}'.format(i), loyal=True, owner=self.user)
+            client.save()
+            contact = models.Contact(first_name='test{}'.format(i), last_name='test',
+                                     email='test@test.com', phone='123',
+                                     client=client, owner=self.user)
+            contact.save()
+            models.Activity(title='test{}'.format(i), text='test' * 1000, contact=contact,
+                            client=client, owner=self.user).save()
+
+    def test_contacts(self):
+        #Сессия, пользователь, состояние контактов и клиентов (ETag), количество контактов и сама страница
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse('crm:contacts'))
+        self.assertIn('test4', response.content)
+
+        with self.assertNumQueries(4):
+            self.client.get(reverse('crm:contacts_data'), {'order[0][column]': 5})
+
+    def test_activities(self):
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse('crm:activities'))
+        self.assertIn('test4', response.content)
+        self.assertNotIn('text', response.context['activities_list'][0].__dict__)
+
+        with self.assertNumQueries(4):
+            self.client.get(reverse('crm:activities_data'), {'order[0][column]': 0})
+
+
+class ClientDetailQueriesTest(TestCase):
+    """
+    Страница клиента выполняет фиксированное количество запросов
+    вне зависимости от количества контактов и активностей
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+
+    def add_activities(self, count):
+        for i in range(count):
+            contact = models.Contact(first_name='test{}'.format(i), last_name='test',
+                                     email='test{}@test.com'.format(i), phone='123',
+                                     client=self.object_client, owner=self.user)
+            contact.save()
+            models.Activity(title='title{}'.format(i), text='test', contact=contact,
+                            client=self.object_client, owner=self.user).save()
+
+    def test_constant_queries(self):
+        url = reverse('crm:client', kwargs={'pk': self.object_client.id})
+        self.add_activities(1)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        self.add_activities(5)
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(len(response.context['contacts']), 6)
+        self.assertEqual(len(response.context['activities']), 6)
+        self.assertIn('title4', response.content)
+
+    def test_activities_order(self):
+        self.add_activities(3)
+        activity = models.Activity.objects.get(title='title0')
+        activity.send()
+        activity.save()
+
+        response = self.client.get(reverse('crm:client', kwargs={'pk': self.object_client.id}))
+        titles = [i.title for i in response.context['activities']]
+        self.assertEqual(titles, ['title1', 'title2', 'title0'])
+
+
+class SearchTest(TestCase):
+    """
+    Тест полнотекстового поиска
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='Horns and hooves', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='Ostap', last_name='Bender',
+                                             email='ostap@hooves.com', phone='1234567',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        self.object = models.Activity(title='Offer', text='Horns delivery offer', contact=self.object_contact,
+                                      client=self.object_client, owner=self.user)
+        self.object.save()
+        models.Client(name='Hornet', loyal=True, owner=self.user1).save()
+
+    def test_search(self):
+        #Поиск по префиксу, результаты по релевантности - сначала совпадения в названии
+        results = search.search(self.user, 'horn')
+        self.assertEqual(results, [self.object_client, self.object])
+
+        results = search.search(self.user, 'hoov')
+        self.assertEqual(set(results), set([self.object_client, self.object_contact]))
+
+        self.assertEqual(search.search(self.user, '12345'), [self.object_contact])
+        self.assertEqual(search.search(self.user, 'ostap bend'), [self.object_contact])
+        self.assertEqual(search.search(self.user, 'ostap offer'), [])
+        self.assertEqual(search.search(self.user, '"*)'), [])
+
+        #Чужие объекты не находятся
+        self.assertEqual(search.search(self.user1, 'horn'), [models.Client.objects.get(name='Hornet')])
+
+    def test_index_updates(self):
+        self.object_contact.last_name = 'Kisa'
+        self.object_contact.save()
+        self.assertEqual(search.search(self.user, 'bender'), [])
+        self.assertEqual(search.search(self.user, 'kisa'), [self.object_contact])
+
+        self.object.delete()
+        self.assertEqual(search.search(self.user, 'offer'), [])
+
+        #Индекс перестраивается из данных таблиц
+        search.rebuild()
+        self.assertEqual(search.search(self.user, 'kisa'), [self.object_contact])
+        self.assertEqual(search.search(self.user, 'offer'), [])
+
+    def test_pagination(self):
+        for i in range(25):
+            models.Client(name='Horns {}'.format(i), owner=self.user).save()
+        response = self.client.get(reverse('crm:main'), {'search': 'horns'})
+        self.assertEqual(len(response.context['search_clients']), 20)
+        self.assertTrue(response.context['search_has_next'])
+
+        response = self.client.get(reverse('crm:main'), {'search': 'horns', 'page': 2})
+        self.assertEqual(len(response.context['search_clients']), 6)
+        self.assertEqual(len(response.context['search_activities']), 1)
+        self.assertFalse(response.context['search_has_next'])
+
+
+class ClientStatsTest(TestCase):
+    """
+    Тест денормализованной статистики клиента
+    """
+    def setUp(self):
+        self.object_client = models.Client(name='test', loyal=False)
+        self.object_client.save()
+        self.object_client1 = models.Client(name='test1', loyal=False)
+        self.object_client1.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='test@test.com', phone='123',
+                                             client=self.object_client)
+        self.object_contact.save()
+
+    def assertStats(self, client, activity_count, contact_count, sent_count, last_sent_at):
+        client = models.Client.objects.get(pk=client.pk)
+        self.assertEqual((client.activity_count, client.contact_count, client.sent_count, client.last_sent_at),
+                         (activity_count, contact_count, sent_count, last_sent_at))
+
+    def test_incremental_updates(self):
+        activity = models.Activity(title='test', text='test', contact=self.object_contact,
+                                   client=self.object_client)
+        activity.save()
+        self.assertStats(self.object_client, 1, 1, 0, None)
+
+        activity = models.Activity.objects.get(pk=activity.pk)
+        activity.send()
+        activity.save()
+        self.assertStats(self.object_client, 1, 1, 1, activity.send_date)
+
+        #Перенос активности и контакта к другому клиенту
+        activity = models.Activity.objects.get(pk=activity.pk)
+        activity.client = self.object_client1
+        activity.save()
+        self.assertStats(self.object_client, 0, 1, 0, None)
+        self.assertStats(self.object_client1, 1, 0, 1, activity.send_date)
+
+        contact = models.Contact.objects.get(pk=self.object_contact.pk)
+        contact.client = self.object_client1
+        contact.save()
+        self.assertStats(self.object_client, 0, 0, 0, None)
+        self.assertStats(self.object_client1, 1, 1, 1, activity.send_date)
+
+        activity.delete()
+        self.assertStats(self.object_client1, 0, 1, 0, None)
+        contact.delete()
+        self.assertStats(self.object_client1, 0, 0, 0, None)
+
+    def test_recompute(self):
+        activity = models.Activity(title='test', text='test', contact=self.object_contact,
+                                   client=self.object_client)
+        activity.send()
+        activity.save()
+        models.Client.objects.update(activity_count=10, contact_count=10, sent_count=10, last_sent_at=None)
+
+        call_command('recompute_client_stats', stdout=StringIO())
+        self.assertStats(self.object_client, 1, 1, 1, activity.send_date)
+        self.assertStats(self.object_client1, 0, 0, 0, None)
+
+    def test_save_keeps_stats(self):
+        #Клиент загружен до создания активности, сохранение не возвращает старые счетчики
+        client = models.Client.objects.get(pk=self.object_client.pk)
+        activity = models.Activity(title='test', text='test', contact=self.object_contact,
+                                   client=self.object_client)
+        activity.send()
+        activity.save()
+        self.assertStats(self.object_client, 1, 1, 1, activity.send_date)
+
+        client.name = 'renamed'
+        client.save()
+        self.assertStats(self.object_client, 1, 1, 1, activity.send_date)
+        self.assertEqual(models.Client.objects.get(pk=client.pk).name, 'renamed')
+
+
+class QueryPlanTest(TestCase):
+    """
+    Запросы основных представлений должны использовать индексы
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+
+    def test_no_full_scans(self):
+        self.assertEqual(queryplan.check(self.user), [])
+        call_command('check_query_plans', stdout=StringIO())
+
+    def test_full_scan_detection(self):
+        self.assertTrue(queryplan.full_scans(models.Client.objects.filter(loyal=True)))
+        self.assertFalse(queryplan.full_scans(models.Client.objects.filter(owner=self.user, name='test')))
+
+
+class ReassignOwnerTest(TestCase):
+    """
+    Тест передачи клиентов другому менеджеру
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.admin = User.objects.create_superuser('admin', 'admin@test.com', 'adminpass')
+
+    def create_client(self, name, owner, activities=1):
+        client = models.Client(name=name, loyal=True, owner=owner)
+        client.save()
+        contact = models.Contact(first_name=name, last_name='test', email='test@test.com',
+                                 phone='123', client=client, owner=owner)
+        contact.save()
+        for i in range(activities):
+            models.Activity(title=name, text='test', contact=contact, client=client, owner=owner).save()
+        return client
+
+    def assertOwner(self, client, owner):
+        self.assertEqual(models.Client.objects.get(pk=client.pk).owner, owner)
+        self.assertEqual(set(models.Contact.objects.filter(client=client).values_list('owner', flat=True)),
+                         set([owner.pk]))
+        self.assertEqual(set(models.Activity.objects.filter(client=client).values_list('owner', flat=True)),
+                         set([owner.pk]))
+
+    def test_reassign_clients(self):
+        client = self.create_client('alpha', self.user, activities=1)
+        client1 = self.create_client('beta', self.user, activities=20)
+        client2 = self.create_client('gamma', self.user)
+
+        with CaptureQueriesContext(connection) as few:
+            ownership.reassign_clients(models.Client.objects.filter(pk=client.pk), self.user1)
+        with CaptureQueriesContext(connection) as many:
+            count = ownership.reassign_clients(models.Client.objects.filter(pk=client1.pk), self.user1)
+
+        self.assertEqual(count, 1)
+        self.assertEqual(len(few), len(many))
+        self.assertOwner(client1, self.user1)
+        self.assertOwner(client2, self.user)
+        self.assertEqual(len(search.search(self.user1, 'beta', limit=100)), 22)
+        self.assertEqual(search.search(self.user, 'beta'), [])
+
+    def test_admin_action(self):
+        client = self.create_client('alpha', self.user)
+        client1 = self.create_client('beta', self.user)
+        client2 = self.create_client('gamma', self.user1)
+        self.client.login(username='admin', password='adminpass')
+        url = reverse('admin:crm_client_changelist')
+
+        #Страница подтверждения
+        response = self.client.post(url, {'action': 'reassign_owner', '_selected_action': [client.pk]})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('New owner', response.content)
+
+        response = self.client.post(url, {'action': 'reassign_owner', '_selected_action': [client.pk],
+                                          'apply': 'yes', 'owner': self.user1.pk, 'scope': 'selected'})
+        self.assertEqual(response.status_code, 302)
+        self.assertOwner(client, self.user1)
+        self.assertOwner(client1, self.user)
+
+        #Передача всего, чем владеет менеджер выбранного клиента
+        response = self.client.post(url, {'action': 'reassign_owner', '_selected_action': [client2.pk],
+                                          'apply': 'yes', 'owner': self.user.pk, 'scope': 'managers'})
+        self.assertEqual(response.status_code, 302)
+        for i in (client, client1, client2):
+            self.assertOwner(i, self.user)
+
+
+class BulkSendTest(TestCase):
+    """
+    Тест массовой отправки активностей
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='test@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        for i in range(5):
+            models.Activity(title='test{}'.format(i), text='test', contact=self.object_contact,
+                            client=self.object_client, owner=self.user).save()
+        self.object = models.Activity.objects.get(title='test0')
+        self.object.send()
+        self.object.save()
+
+    def test_queryset_send(self):
+        #UPDATE активностей, UPDATE статистики клиентов, владельцы для сброса кэша
+        #и INSERT в очередь писем внутри savepoint
+        with self.assertNumQueries(6):
+            count = models.Activity.objects.filter(owner=self.user).send()
+        self.assertEqual(count, 4)
+        self.assertFalse(models.Activity.objects.filter(send_date__isnull=True).exists())
+        #Дата отправки уже отправленной активности не меняется
+        self.assertEqual(models.Activity.objects.get(pk=self.object.pk).send_date, self.object.send_date)
+
+        client = models.Client.objects.get(pk=self.object_client.pk)
+        self.assertEqual(client.sent_count, 5)
+        self.assertEqual(client.last_sent_at, models.Activity.objects.get(title='test4').send_date)
+        self.assertEqual(models.Activity.objects.send(), 0)
+
+    def test_send_selected(self):
+        ids = list(models.Activity.objects.filter(title__in=['test1', 'test2']).values_list('pk', flat=True))
+        response = self.client.post(reverse('crm:send_activities'), {'activity': ids + [self.object.pk]},
+                                    follow=True)
+        self.assertRedirects(response, reverse('crm:activities'))
+        self.assertIn('Sent 2 activities', response.content)
+        self.assertEqual(models.Activity.objects.filter(send_date__isnull=True).count(), 2)
+
+        #Чужие активности не отправляются
+        self.client.login(username='testuser1', password='testpass1')
+        self.client.post(reverse('crm:send_activities'), {'all': '1'})
+        self.assertEqual(models.Activity.objects.filter(send_date__isnull=True).count(), 2)
+
+        self.client.login(username='testuser', password='testpass')
+        self.client.post(reverse('crm:send_activities'), {'all': '1'})
+        self.assertEqual(models.Activity.objects.filter(send_date__isnull=True).count(), 0)
+
+    def test_send_selected_chunks(self):
+        #Количество id больше ограничения SQLite на параметры запроса
+        ids = list(models.Activity.objects.filter(title__in=['test1', 'test2']).values_list('pk', flat=True))
+        ids += range(100000, 100000 + 2 * models.SEND_CHUNK_SIZE)
+        with CaptureQueriesContext(connection) as queries:
+            count = models.Activity.objects.for_user(self.user).send_selected(ids)
+        self.assertEqual(count, 2)
+        self.assertTrue(all(len(query['sql'].split(',')) < 999 for query in queries.captured_queries))
+        self.assertEqual(models.Activity.objects.filter(send_date__isnull=True).count(), 2)
+
+    def test_admin_action(self):
+        User.objects.create_superuser('admin', 'admin@test.com', 'adminpass')
+        self.client.login(username='admin', password='adminpass')
+        ids = models.Activity.objects.values_list('pk', flat=True)
+        response = self.client.post(reverse('admin:crm_activity_changelist'),
+                                    {'action': 'send_selected', '_selected_action': list(ids)})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(models.Activity.objects.filter(send_date__isnull=True).count(), 0)
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class OutboxTest(TestCase):
+    """
+    Тест доставки отправленных активностей через очередь писем
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='contact@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        for i in range(3):
+            models.Activity(title='test{}'.format(i), text='text{}'.format(i), contact=self.object_contact,
+                            client=self.object_client, owner=self.user).save()
+
+    def test_send_enqueues(self):
+        models.Activity.objects.filter(title='test0').send()
+        self.assertEqual(models.OutboxMessage.objects.count(), 1)
+        #Повторная отправка не добавляет записей в очередь
+        models.Activity.objects.send()
+        self.assertEqual(models.OutboxMessage.objects.count(), 3)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_distinct_send_enqueues(self):
+        activity = models.Activity.objects.get(title='test1')
+        self.client.post(reverse('crm:activity', kwargs={'pk': activity.pk}), {'action': 'Send'})
+        message = models.OutboxMessage.objects.get()
+        self.assertEqual(message.activity_id, activity.pk)
+        self.assertEqual(message.status, models.OutboxMessage.PENDING)
+
+    def test_process_batch(self):
+        models.Activity.objects.send()
+        #Все письма пачки уходят через одно соединение
+        self.assertEqual(outbox.process_batch(batch_size=2), (2, 2))
+        self.assertEqual(outbox.process_batch(batch_size=2), (1, 1))
+        self.assertEqual(outbox.process_batch(batch_size=2), (0, 0))
+
+        self.assertEqual(len(mail.outbox), 3)
+        email = mail.outbox[0]
+        self.assertEqual(email.to, ['contact@test.com'])
+        self.assertEqual(email.from_email, 'test@test.com')
+        self.assertEqual(email.subject, 'test0')
+        self.assertEqual(email.body, 'text0')
+        self.assertEqual(email.alternatives[0][1], 'text/html')
+        self.assertFalse(models.OutboxMessage.objects.exclude(status=models.OutboxMessage.SENT).exists())
+
+    @override_settings(EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend', EMAIL_PORT=1)
+    def test_retry(self):
+        models.Activity.objects.filter(title='test0').send()
+        self.assertEqual(outbox.process_batch(), (1, 0))
+        message = models.OutboxMessage.objects.get()
+        self.assertEqual(message.status, models.OutboxMessage.PENDING)
+        self.assertEqual(message.attempts, 1)
+        self.assertTrue(message.last_error)
+        #До следующей попытки запись не берется в работу
+        self.assertEqual(outbox.process_batch(), (0, 0))
+
+        models.OutboxMessage.objects.update(attempts=outbox.MAX_ATTEMPTS - 1, next_attempt_at=message.created_at)
+        outbox.process_batch()
+        self.assertEqual(models.OutboxMessage.objects.get().status, models.OutboxMessage.FAILED)
+
+    def test_command(self):
+        models.Activity.objects.send()
+        out = StringIO()
+        call_command('run_outbox_worker', once=True, stdout=out)
+        self.assertIn('Sent 3 of 3 messages', out.getvalue())
+        self.assertEqual(len(mail.outbox), 3)
+
+
+class ImportTest(TestCase):
+    """
+    Тест импорта клиентов и контактов из CSV
+    """
+    csv_data = (u'client,loyal,first_name,last_name,email,phone,active\n'
+                u'Рога и копыта,yes,Остап,Бендер,ostap@test.com,123,\n'
+                u'Рога и копыта,,Михаил,Паниковский,misha@test.com,456,no\n'
+                u'other,0,,,,,\n'
+                u'broken,,Шура,,not email,abc,\n'
+                u'foreign,,Шура,Балаганов,shura@test.com,789,\n'
+                u',,,,,,\n').encode('utf-8')
+
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.client.login(username='testuser', password='testpass')
+        models.Client(name='foreign', owner=self.user1).save()
+
+    def test_import(self):
+        result = importer.import_csv(StringIO(self.csv_data), self.user, batch_size=2)
+        self.assertEqual((result.rows, result.clients, result.contacts), (5, 2, 2))
+        self.assertEqual([line for line, message in result.errors], [5, 6])
+        self.assertIn('email', result.errors[0][1])
+        self.assertIn('belongs to another user', result.errors[1][1])
+
+        client = models.Client.objects.get(name=u'Рога и копыта')
+        self.assertTrue(client.loyal)
+        self.assertEqual(client.owner, self.user)
+        self.assertEqual(client.contact_count, 2)
+        self.assertFalse(models.Client.objects.get(name='other').loyal)
+        self.assertFalse(models.Client.objects.filter(name='broken').exists())
+        self.assertEqual(list(client.contact_set.order_by('pk').values_list('last_name', 'active', 'owner')),
+                         [(u'Бендер', True, self.user.pk), (u'Паниковский', False, self.user.pk)])
+        if search.is_available():
+            self.assertEqual(len(search.search(self.user, u'Паниковский')), 1)
+            self.assertEqual(len(search.search(self.user, u'копыта')), 1)
+
+        #Повторный импорт находит существующих клиентов
+        result = importer.import_csv(StringIO(self.csv_data), self.user)
+        self.assertEqual((result.clients, result.contacts), (0, 2))
+        self.assertEqual(models.Client.objects.get(pk=client.pk).contact_count, 4)
+
+    def test_integrity_error(self):
+        #Клиента с тем же именем создал параллельный запрос после загрузки имен
+        class RacingImporter(importer.Importer):
+            def load_clients(self):
+                super(RacingImporter, self).load_clients()
+                if not models.Client.objects.filter(name='other').exists():
+                    models.Client(name='other', owner=self.owner).save()
+
+        #Пачка со строками 3 и 4 отменяется целиком
+        result = RacingImporter(self.user, batch_size=2).run(StringIO(self.csv_data))
+        self.assertEqual((result.clients, result.contacts), (1, 1))
+        self.assertEqual(sorted(line for line, message in result.errors), [3, 4, 5, 6])
+        self.assertIn('Row was not imported', dict(result.errors)[3])
+        self.assertEqual(models.Client.objects.get(name=u'Рога и копыта').contact_count, 1)
+
+    def test_bad_header(self):
+        with self.assertRaises(importer.CsvImportError):
+            importer.import_csv(StringIO('name,email\n'), self.user)
+        with self.assertRaises(importer.CsvImportError):
+            importer.import_csv(StringIO(''), self.user)
+
+    def test_view(self):
+        upload = SimpleUploadedFile('clients.csv', self.csv_data, content_type='text/csv')
+        response = self.client.post(reverse('crm:import'), {'file': upload})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Imported 2 clients and 2 contacts from 5 rows', response.content)
+        self.assertEqual(models.Contact.objects.filter(owner=self.user).count(), 2)
+
+        upload = SimpleUploadedFile('clients.csv', b'name\n', content_type='text/csv')
+        response = self.client.post(reverse('crm:import'), {'file': upload})
+        self.assertIn('Header must contain', response.content)
+
+    def test_command(self):
+        path = os.path.join(tempfile.mkdtemp(), 'clients.csv')
+        with open(path, 'wb') as csv_file:
+            csv_file.write(self.csv_data)
+        out, err = StringIO(), StringIO()
+        call_command('import_csv', path, '--owner', 'testuser', stdout=out, stderr=err)
+        self.assertIn('Imported 2 clients and 2 contacts from 5 rows, 2 rows skipped', out.getvalue())
+        self.assertIn('Line 6', err.getvalue())
+        os.remove(path)
+
+
+class ExportTest(TestCase):
+    """
+    Тест потоковой выгрузки данных
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name=u'Рога и копыта', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='contact@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        for i in range(5):
+            models.Activity(title='test{}'.format(i), text='text, "{}"'.format(i), contact=self.object_contact,
+                            client=self.object_client, owner=self.user).save()
+        models.Activity.objects.filter(title__in=['test1', 'test2']).send()
+        models.Client(name='foreign', owner=self.user1).save()
+
+    def test_chunks(self):
+        #Каждая пачка - один запрос с join клиента и контакта, последняя неполная пачка завершает выгрузку
+        with self.assertNumQueries(3):
+            lines = list(exporter.export('activities', self.user, chunk_size=2))
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(lines[0], b'id,title,text,send_date,client,contact\r\n')
+        self.assertIn(u'test0,"text, ""0""",,Рога и копыта,contact@test.com'.encode('utf-8'), lines[1])
+
+    def test_view(self):
+        response = self.client.get(reverse('crm:export', kwargs={'kind': 'clients'}))
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode('utf-8')
+        self.assertIn(u'Рога и копыта', content)
+        self.assertNotIn('foreign', content)
+
+        today = models.Activity.objects.get(title='test1').send_date.date()
+        response = self.client.get(reverse('crm:export', kwargs={'kind': 'activities'}),
+                                   {'format': 'jsonl', 'date_from': today, 'date_to': today})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(sorted(row['title'] for row in rows), ['test1', 'test2'])
+        self.assertEqual(rows[0]['contact'], 'contact@test.com')
+
+        response = self.client.get(reverse('crm:export', kwargs={'kind': 'activities'}),
+                                   {'date_from': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_command(self):
+        out = StringIO()
+        call_command('export_data', 'contacts', '--owner', 'testuser', '--format', 'jsonl', stdout=out)
+        self.assertEqual(json.loads(out.getvalue())['client'], u'Рога и копыта')
+
+
+class PageCacheTest(TestCase):
+    """
+    Тест кэша страниц по владельцу
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='contact@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        self.object = models.Activity(title='test', text='test', contact=self.object_contact,
+                                      client=self.object_client, owner=self.user)
+        self.object.save()
+        cache.reset_counters()
+
+    def test_hit_and_invalidation(self):
+        url = reverse('crm:clients')
+        self.client.get(url)
+        #Повторный запрос не обращается к базе (кроме сессии, пользователя и состояния для ETag)
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertIn('test', response.content)
+        self.assertEqual(cache.counters(), {'hits': 1, 'misses': 1})
+
+        models.Client(name='new client', owner=self.user).save()
+        self.assertIn('new client', self.client.get(url).content)
+        self.assertEqual(cache.counters(), {'hits': 1, 'misses': 2})
+
+        #Изменения другого владельца кэш не сбрасывают
+        models.Client(name='foreign', owner=self.user1).save()
+        self.client.get(url)
+        self.assertEqual(cache.counters(), {'hits': 2, 'misses': 2})
+
+    def test_bulk_invalidation(self):
+        #Страница с формами кэшируется только для запросов с CSRF cookie
+        url = reverse('crm:activity', kwargs={'pk': self.object.pk})
+        for i in range(3):
+            self.assertIn('value="Send"', self.client.get(url).content)
+        self.assertEqual(cache.counters(), {'hits': 1, 'misses': 2})
+        models.Activity.objects.filter(owner=self.user).send()
+        self.assertNotIn('value="Send"', self.client.get(url).content)
+
+        url = reverse('crm:clients')
+        self.client.get(url)
+        ownership.reassign_clients(models.Client.objects.filter(pk=self.object_client.pk), self.user1)
+        self.assertNotIn('/crm/clients/{}/'.format(self.object_client.pk), self.client.get(url).content)
+        self.client.login(username='testuser1', password='testpass1')
+        self.assertIn('/crm/clients/{}/'.format(self.object_client.pk), self.client.get(url).content)
+
+    def test_disabled(self):
+        #Без общего бэкенда (locmem в production) страницы не кэшируются
+        self.assertFalse(cache.is_shared())
+        with self.settings(CRM_PAGE_CACHE=False):
+            for i in range(2):
+                self.client.get(reverse('crm:clients'))
+        self.assertEqual(cache.counters(), {'hits': 0, 'misses': 0})
+
+    def test_flash_message_not_cached(self):
+        self.client.get(reverse('crm:activities'))
+        response = self.client.post(reverse('crm:send_activities'), {'all': '1'}, follow=True)
+        self.assertIn('Sent 1 activities', response.content)
+        self.assertNotIn('Sent 1 activities', self.client.get(reverse('crm:activities')).content)
+
+
+class CacheCommitTest(TransactionTestCase):
+    """
+    Тест повторного сброса кэша после фиксации транзакции
+    """
+    def setUp(self):
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+
+    def test_bump_on_commit(self):
+        with transaction.atomic():
+            models.Client(name='test', owner=self.user).save()
+            #Страница, построенная до фиксации, получает это поколение
+            generation = cache.generation(self.user.pk)
+        self.assertNotEqual(cache.generation(self.user.pk), generation)
+
+    def test_bump_queryset_on_commit(self):
+        client = models.Client.objects.create(name='test', owner=self.user)
+        contact = models.Contact.objects.create(first_name='test', last_name='test', phone='123', client=client,
+                                                 owner=self.user)
+        models.Activity(title='test', text='test', client=client, contact=contact, owner=self.user).save()
+        with transaction.atomic():
+            models.Activity.objects.filter(owner=self.user).send()
+            generation = cache.generation(self.user.pk)
+        self.assertNotEqual(cache.generation(self.user.pk), generation)
+
+    def test_rollback(self):
+        generation = cache.generation(self.user.pk)
+        try:
+            with transaction.atomic():
+                cache.bump(self.user.pk)
+                generation = cache.generation(self.user.pk)
+                raise ValueError
+        except ValueError:
+            pass
+        self.assertEqual(cache.generation(self.user.pk), generation)
+
+
+class RowCacheTest(TestCase):
+    """
+    Тест кэширования строк таблиц
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='contact@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        self.object = models.Activity(title='first title', text='test', contact=self.object_contact,
+                                      client=self.object_client, owner=self.user)
+        self.object.save()
+
+    def test_version(self):
+        version = models.Activity.objects.get(pk=self.object.pk).version
+        self.object.title = 'changed'
+        self.object.save(update_fields=['title'])
+        self.assertEqual(models.Activity.objects.get(pk=self.object.pk).version, version + 1)
+        models.Activity.objects.send()
+        self.assertEqual(models.Activity.objects.get(pk=self.object.pk).version, version + 2)
+
+    def test_rows(self):
+        url = reverse('crm:activities')
+        self.assertIn('first title', self.client.get(url).content)
+
+        #Изменение в обход version: страница построена заново, строка взята из кэша
+        models.Activity.objects.filter(pk=self.object.pk).update(title='second title')
+        cache.bump(self.user.pk)
+        self.assertIn('first title', self.client.get(url).content)
+
+        #Отправка меняет version, строка строится заново
+        models.Activity.objects.filter(pk=self.object.pk).send()
+        response = self.client.get(url)
+        self.assertIn('second title', response.content)
+        self.assertNotIn('name="activity"', response.content)
+
+        #Переименование клиента меняет строки его активностей
+        client = models.Client.objects.get(pk=self.object_client.pk)
+        client.name = 'renamed'
+        client.save()
+        self.assertIn('renamed', self.client.get(reverse('crm:client', kwargs={'pk': client.pk})).content)
+        self.assertIn('renamed', self.client.get(url).content)
+
+        #Пересчет статистики клиента строки его активностей не сбрасывает
+        models.Activity.objects.filter(pk=self.object.pk).update(title='third title')
+        stats.adjust(client.pk, activities=1)
+        self.assertNotIn('third title', self.client.get(url).content)
+
+
+class WarmupTest(TestCase):
+    """
+    Тест прогрева процесса при загрузке WSGI приложения
+    """
+    def test_run(self):
+        templates = [dict(options, APP_DIRS=False, OPTIONS=dict(options['OPTIONS'], loaders=[
+            ('django.template.loaders.cached.Loader', ['django.template.loaders.filesystem.Loader',
+                                                       'django.template.loaders.app_directories.Loader'])]))
+                     for options in settings.TEMPLATES]
+        with self.settings(TEMPLATES=templates):
+            result = warmup.run()
+            self.assertIn('crm/clients.html', list(warmup.template_names()))
+            self.assertIn('registration/login.html', list(warmup.template_names()))
+            self.assertEqual(result['templates'][0], len(list(warmup.template_names())))
+            self.assertGreater(result['urls'][0], 0)
+
+            #Шаблоны уже скомпилированы и берутся из cached loader
+            loader = engines['django'].engine.template_loaders[0]
+            self.assertEqual(len(loader.get_template_cache), result['templates'][0])
+            self.client.login(username='nobody', password='nobody')
+            self.client.get(reverse('crm:main'))
+            self.assertEqual(len(loader.get_template_cache), result['templates'][0])
+
+
+class OwnedQuerySetTest(TestCase):
+    """
+    Тест выборки объектов владельца и получения объекта в Distinct
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_client1 = models.Client(name='foreign', loyal=True, owner=self.user1)
+        self.object_client1.save()
+
+    def test_for_user(self):
+        self.assertEqual(list(models.Client.objects.for_user(self.user)), [self.object_client])
+        self.assertEqual(list(models.Client.objects.for_user(None)), [])
+        self.assertEqual(list(models.Activity.objects.for_user(self.user1)), [])
+
+    def test_single_fetch(self):
+        self.client.login(username='testuser', password='testpass')
+        url = reverse('crm:client', kwargs={'pk': self.object_client.pk})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, {'name': 'changed', 'loyal': True})
+        self.assertEqual(response.status_code, 302)
+        #Объект получается один раз, вместе с проверкой владельца
+        fetches = [query['sql'] for query in queries
+                   if query['sql'].startswith('SELECT') and 'FROM "crm_client"' in query['sql']
+                   and '"crm_client"."owner_id" =' in query['sql']]
+        self.assertEqual(len(fetches), 1)
+        self.assertEqual(models.Client.objects.get(pk=self.object_client.pk).name, 'changed')
+
+        #Чужой объект не изменяется, несуществующий - 404
+        url = reverse('crm:client', kwargs={'pk': self.object_client1.pk})
+        self.client.post(url, {'name': 'changed1', 'loyal': True})
+        self.assertEqual(models.Client.objects.get(pk=self.object_client1.pk).name, 'foreign')
+        response = self.client.post(reverse('crm:client', kwargs={'pk': 100}), {'name': 'changed1'})
+        self.assertEqual(response.status_code, 404)
+
+
+class ConcurrencyTest(TestCase):
+    """
+    Тест отправки активности одним UPDATE и проверки ревизии при изменении
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='contact@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        self.object = models.Activity(title='test', text='test', contact=self.object_contact,
+                                      client=self.object_client, owner=self.user)
+        self.object.save()
+
+    def test_stale_save(self):
+        first = models.Client.objects.get(pk=self.object_client.pk)
+        second = models.Client.objects.get(pk=self.object_client.pk)
+        first.name = 'first'
+        first.save()
+        second.name = 'second'
+        with self.assertRaises(models.StaleObjectError):
+            second.save()
+        self.assertEqual(models.Client.objects.get(pk=self.object_client.pk).name, 'first')
+
+        #Изменение статистики клиента ревизию не меняет
+        models.Activity(title='test1', text='test', contact=self.object_contact,
+                        client=first, owner=self.user).save()
+        first.loyal = False
+        first.save()
+
+    def test_send(self):
+        url = reverse('crm:activity', kwargs={'pk': self.object.pk})
+        revision = models.Activity.objects.get(pk=self.object.pk).revision
+        response = self.client.post(url, {'action': 'Send'})
+        self.assertRedirects(response, url)
+        activity = models.Activity.objects.get(pk=self.object.pk)
+        self.assertIsNotNone(activity.send_date)
+        self.assertEqual(activity.revision, revision + 1)
+        self.assertEqual(models.OutboxMessage.objects.count(), 1)
+
+        #Повторная отправка ничего не меняет
+        self.client.post(url, {'action': 'Send'})
+        self.assertEqual(models.Activity.objects.get(pk=self.object.pk).send_date, activity.send_date)
+        self.assertEqual(models.OutboxMessage.objects.count(), 1)
+
+        #Изменение по форме, загруженной до отправки
+        data = {'title': 'changed', 'text': 'test', 'client': self.object_client.pk,
+                'contact': self.object_contact.pk, 'revision': revision}
+        response = self.client.post(url, data)
+        self.assertFormError(response, 'form', None, forms.STALE_MESSAGE)
+        self.assertEqual(models.Activity.objects.get(pk=self.object.pk).title, 'test')
+
+    def test_stale_form(self):
+        url = reverse('crm:client', kwargs={'pk': self.object_client.pk})
+        revision = models.Client.objects.get(pk=self.object_client.pk).revision
+        response = self.client.post(url, {'name': 'first', 'loyal': True, 'revision': revision})
+        self.assertEqual(response.status_code, 302)
+        response = self.client.post(url, {'name': 'second', 'loyal': True, 'revision': revision})
+        self.assertFormError(response, 'form', None, forms.STALE_MESSAGE)
+        self.assertEqual(models.Client.objects.get(pk=self.object_client.pk).name, 'first')
+
+
+class LookupTest(TestCase):
+    """
+    Тест загрузки вариантов клиентов и контактов для форм
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.client.login(username='testuser', password='testpass')
+
+        for i in range(25):
+            models.Client(name='client{:02d}'.format(i), owner=self.user).save()
+        self.object_client = models.Client.objects.get(name='client00')
+        self.object_contact = models.Contact(first_name='active', last_name='test',
+                                             email='active@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        models.Contact(first_name='inactive', last_name='test', email='inactive@test.com', phone='123',
+                       client=self.object_client, active=False, owner=self.user).save()
+        models.Client(name='client foreign', owner=self.user1).save()
+
+    def test_clients(self):
+        data = json.loads(self.client.get(reverse('crm:lookup_clients')).content)
+        self.assertEqual(len(data['results']), 20)
+        self.assertTrue(data['more'])
+        self.assertEqual(data['results'][0], {'id': self.object_client.pk, 'text': str(self.object_client)})
+
+        data = json.loads(self.client.get(reverse('crm:lookup_clients'), {'page': 2}).content)
+        self.assertEqual(len(data['results']), 5)
+        self.assertFalse(data['more'])
+
+        data = json.loads(self.client.get(reverse('crm:lookup_clients'), {'q': 'CLIENT1'}).content)
+        self.assertEqual([item['text'] for item in data['results']],
+                         [str(client) for client in models.Client.objects.filter(name__startswith='client1')])
+
+    def test_contacts(self):
+        url = reverse('crm:lookup_contacts')
+        data = json.loads(self.client.get(url, {'client': self.object_client.pk}).content)
+        self.assertEqual([item['id'] for item in data['results']], [self.object_contact.pk])
+        self.assertEqual(json.loads(self.client.get(url).content)['results'], [])
+
+        self.client.login(username='testuser1', password='testpass1')
+        data = json.loads(self.client.get(url, {'client': self.object_client.pk}).content)
+        self.assertEqual(data['results'], [])
+
+    def test_form(self):
+        #На странице создания нет списка клиентов
+        response = self.client.get(reverse('crm:new_activity'))
+        self.assertNotIn('client01', response.content)
+        self.assertIn('data-depends-on="client"', response.content)
+
+        activity = models.Activity(title='test', text='test', contact=self.object_contact,
+                                   client=self.object_client, owner=self.user)
+        activity.save()
+        response = self.client.get(reverse('crm:activity', kwargs={'pk': activity.pk}))
+        self.assertIn('selected="selected">{}</option>'.format(self.object_client), response.content)
+        self.assertNotIn('client01', response.content)
+
+
+class ApiTest(TestCase):
+    """
+    Тест JSON API
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.user1 = User.objects.create_user('testuser1', 'test@test.com', 'testpass1')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='contact@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+        models.Client(name='foreign', owner=self.user1).save()
+
+    def request(self, method, url, data=None):
+        if method == 'get':
+            response = self.client.get(url)
+        else:
+            response = getattr(self.client, method)(url, json.dumps(data), content_type='application/json')
+        return response.status_code, json.loads(response.content)
+
+    def test_crud(self):
+        url = reverse('crm:api_list', kwargs={'kind': 'contacts'})
+        status, data = self.request('post', url, {'first_name': 'new', 'last_name': 'contact',
+                                                  'email': 'new@test.com', 'phone': 456,
+                                                  'client': self.object_client.pk})
+        self.assertEqual(status, 201)
+        self.assertTrue(data['active'])
+        self.assertEqual(models.Client.objects.get(pk=self.object_client.pk).contact_count, 2)
+
+        detail = reverse('crm:api_detail', kwargs={'kind': 'contacts', 'pk': data['id']})
+        status, data = self.request('patch', detail, {'last_name': 'changed'})
+        self.assertEqual((status, data['last_name'], data['email']), (200, 'changed', 'new@test.com'))
+        status, data = self.request('patch', detail, {'email': 'wrong'})
+        self.assertEqual(status, 400)
+        self.assertIn('email', data['errors'])
+        status, data = self.request('patch', detail, {'last_name': 'stale', 'revision': 0})
+        self.assertEqual(status, 400)
+
+        status, data = self.request('delete', detail)
+        self.assertEqual(status, 200)
+        self.assertEqual(self.request('get', detail)[0], 404)
+
+        #Чужие объекты недоступны
+        foreign = models.Client.objects.get(name='foreign')
+        detail = reverse('crm:api_detail', kwargs={'kind': 'clients', 'pk': foreign.pk})
+        self.assertEqual(self.request('get', detail)[0], 404)
+
+        self.client.logout()
+        self.assertEqual(self.request('get', url)[0], 401)
+
+    def test_list(self):
+        for i in range(5):
+            models.Client(name='client{}'.format(i), owner=self.user).save()
+        url = reverse('crm:api_list', kwargs={'kind': 'clients'})
+        names = []
+        cursor = 0
+        while cursor is not None:
+            response = self.client.get(url, {'limit': 2, 'cursor': cursor})
+            data = json.loads(response.content)
+            names.extend(item['name'] for item in data['results'])
+            cursor = data['next']
+        self.assertEqual(names, ['test'] + ['client{}'.format(i) for i in range(5)])
+
+    def test_batch(self):
+        url = reverse('crm:api_batch', kwargs={'kind': 'activities'})
+        create = [{'title': 'title{}'.format(i), 'text': 'text', 'client': self.object_client.pk,
+                   'contact': self.object_contact.pk} for i in range(50)]
+        with CaptureQueriesContext(connection) as queries:
+            status, data = self.request('post', url, {'create': create})
+        self.assertEqual(status, 200)
+        #Все активности создаются одним INSERT
+        self.assertEqual(len([query for query in queries
+                              if query['sql'].startswith('INSERT INTO "crm_activity"')]), 1)
+        self.assertEqual([item['title'] for item in data['created']], ['title{}'.format(i) for i in range(50)])
+        self.assertEqual(models.Client.objects.get(pk=self.object_client.pk).activity_count, 50)
+        self.assertEqual(search.search(self.user, 'title7'), [models.Activity.objects.get(title='title7')])
+
+        #Ошибка в одном объекте - ничего не записывается
+        ids = [item['id'] for item in data['created']]
+        status, data = self.request('post', url, {'update': [{'id': ids[0], 'title': 'changed'},
+                                                             {'id': ids[1], 'contact': 100}],
+                                                  'delete': ids[2:]})
+        self.assertEqual(status, 400)
+        self.assertEqual(list(data['errors']['update']), ['1'])
+        self.assertEqual(models.Activity.objects.count(), 50)
+
+        status, data = self.request('post', url, {'update': [{'id': ids[0], 'title': 'changed'}],
+                                                  'delete': ids[2:]})
+        self.assertEqual((status, data['deleted']), (200, 48))
+        self.assertEqual(models.Activity.objects.get(pk=ids[0]).title, 'changed')
+
+        status, data = self.request('post', reverse('crm:api_send_activities'), {'ids': ids})
+        self.assertEqual(data, {'sent': 2})
+        status, data = self.request('post', reverse('crm:api_send_activity', kwargs={'pk': ids[0]}))
+        self.assertIsNotNone(data['send_date'])
+
+
+class ConditionalGetTest(TestCase):
+    """
+    Тест ответов 304 на условные GET запросы
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.client.login(username='testuser', password='testpass')
+
+        self.object_client = models.Client(name='test', loyal=True, owner=self.user)
+        self.object_client.save()
+        self.object_contact = models.Contact(first_name='test1', last_name='test',
+                                             email='contact@test.com', phone='123',
+                                             client=self.object_client, owner=self.user)
+        self.object_contact.save()
+
+    def test_not_modified(self):
+        url = reverse('crm:contacts')
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        #Сессия, пользователь и состояние контактов и клиентов
+        with self.assertNumQueries(4):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        #Изменение клиента меняет страницу контактов
+        client = models.Client.objects.get(pk=self.object_client.pk)
+        client.name = 'renamed'
+        client.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('renamed', response.content)
+        etag = response['ETag']
+
+        #Удаление тоже меняет ETag
+        models.Contact.objects.get(pk=self.object_contact.pk).delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_release(self):
+        #Новая версия шаблонов и статических файлов - новый ETag
+        url = reverse('crm:contacts')
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.settings(CRM_RELEASE='next'):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_updated_at(self):
+        activity = models.Activity(title='test', text='test', contact=self.object_contact,
+                                   client=self.object_client, owner=self.user)
+        activity.save()
+        updated_at = models.Client.objects.get(pk=self.object_client.pk).updated_at
+        models.Activity.objects.filter(pk=activity.pk).send()
+        self.assertGreater(models.Activity.objects.get(pk=activity.pk).updated_at, activity.updated_at)
+        self.assertGreater(models.Client.objects.get(pk=self.object_client.pk).updated_at, updated_at)
+
+
+class StaticAssetsTest(TestCase):
+    def test_bundles_up_to_date(self):
+        self.assertEqual(assets.build(check=True), [])
+        page = self.client.get(reverse('login')).content
+        self.assertIn('crm/dist/crm.css', page)
+        self.assertNotIn('bootstrapcdn', page)
+        self.assertNotIn('bootstrapcdn', self.client.get(reverse('register')).content)
+
+    def test_rebase_urls(self):
+        content = assets._rebase_urls(u'a{background:url("../images/a.png")} b{src:url(data:x)}',
+                                      'crm/vendor/datatables/css/x.css', 'crm/dist/crm.css')
+        self.assertIn(u'url("../vendor/datatables/images/a.png")', content)
+        self.assertIn(u'url(data:x)', content)
+
+    def test_collect_and_serve(self):
+        root = tempfile.mkdtemp()
+        with self.settings(STATIC_ROOT=root,
+                           STATICFILES_STORAGE='crm.storage.CompressedManifestStaticFilesStorage'):
+            call_command('collectstatic', interactive=False, verbosity=0)
+            name = staticfiles_storage.stored_name('crm/dist/crm.css')
+        self.assertTrue(os.path.exists(os.path.join(root, name + '.gz')))
+
+        application = staticserve.StaticFilesApplication(lambda environ, start_response: [], root, '/static/')
+        responses = []
+        environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': '/static/' + name, 'HTTP_ACCEPT_ENCODING': 'gzip'}
+        application(environ, lambda status, headers: responses.append((status, dict(headers))))
+        status, headers = responses[0]
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(headers['Cache-Control'], staticserve.FOREVER)
+        #Выход за пределы STATIC_ROOT передается приложению
+        self.assertEqual(application({'REQUEST_METHOD': 'GET', 'PATH_INFO': '/static/../settings.py'}, None), [])
+
+
+class QueryBudgetTest(TestCase):
+    """
+    Страницы crm укладываются в бюджет запросов (settings.CRM_QUERY_BUDGETS)
+    и не выполняют один и тот же запрос для каждого объекта (N+1)
+    """
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('testuser', 'test@test.com', 'testpass')
+        self.client.login(username='testuser', password='testpass')
+
+        for i in range(5):
+            client = models.Client(name='test{}'.format(i), loyal=True, owner=self.user)
+            client.save()
+            for j in range(2):
+                contact = models.Contact(first_name='test{}'.format(j), last_name='test',
+                                         email='test@test.com', phone='123',
+                                         client=client, owner=self.user)
+                contact.save()
+                activity = models.Activity(title='test{}'.format(j), text='test', contact=contact,
+                                           client=client, owner=self.user)
+                if j:
+                    activity.send()
+                activity.save()
+        self.object_client, self.object_contact, self.object_activity = client, contact, activity
+
+    def assertQueryBudget(self, name, kwargs=None, data=None):
+        with querycount.report() as report:
+            response = self.client.get(reverse(name, kwargs=kwargs), data or {})
+        self.assertEqual(response.status_code, 200, name)
+        #Как минимум запросы сессии и пользователя
+        self.assertGreaterEqual(report.count, 2, name)
+        self.assertLessEqual(report.count, querycount.budget(name), name)
+        self.assertEqual(report.repeated(), [], name)
+
+    def test_pages(self):
+        self.assertQueryBudget('crm:main')
+        self.assertQueryBudget('crm:main', data={'search': 'test'})
+        for name in ('clients', 'contacts', 'activities', 'clients_data', 'contacts_data', 'activities_data',
+                     'new_client', 'new_contact', 'new_activity', 'lookup_clients'):
+            self.assertQueryBudget('crm:' + name)
+        self.assertQueryBudget('crm:lookup_contacts', data={'client': self.object_client.pk})
+        self.assertQueryBudget('crm:client', {'pk': self.object_client.pk})
+        self.assertQueryBudget('crm:contact', {'pk': self.object_contact.pk})
+        self.assertQueryBudget('crm:activity', {'pk': self.object_activity.pk})
+        for kind in ('clients', 'contacts', 'activities'):
+            self.assertQueryBudget('crm:api_list', {'kind': kind})
+
+    def test_repeated(self):
+        with querycount.report() as report:
+            for client in models.Client.objects.all():
+                client.contact_set.count()
+        self.assertEqual(report.count, 6)
+        self.assertEqual(len(report.repeated()), 1)
+        self.assertEqual(report.repeated()[0][1], 5)
+        self.assertEqual(querycount.fingerprint("SELECT 1 WHERE a = 'x' AND b IN (1, 2, 3)"),
+                         'SELECT ? WHERE a = ? AND b IN (...)')
+
+    def test_full_queries_log(self):
+        #queries_log ограничен по длине, отчет не должен зависеть от его заполнения
+        connection.queries_log.extend({'sql': 'SELECT 1', 'time': '0.000'}
+                                      for i in range(connection.queries_log.maxlen))
+        with querycount.report() as outer:
+            with querycount.report() as report:
+                self.client.get(reverse('crm:clients'))
+        self.assertGreaterEqual(report.count, 2)
+        self.assertEqual(outer.count, report.count)
+        self.assertEqual(len(connection.queries_log), connection.queries_log.maxlen)
+
+    def test_middleware(self):
+        with self.settings(CRM_QUERY_COUNT=True, CRM_QUERY_HEADERS=True):
+            client = Client()
+            client.login(username='testuser', password='testpass')
+            response = client.get(reverse('crm:clients'))
+        self.assertGreater(int(response['X-CRM-Queries']), 0)
+        self.assertEqual(response['X-CRM-Repeated-Queries'], '0')
+        self.assertFalse(self.client.get(reverse('crm:clients')).has_header('X-CRM-Queries'))
+
+
+class SeedTest(TestCase):
+    def test_seed(self):
+        result = seed.seed(2, 3, 2, 2, sent_ratio=0.5, batch_size=2)
+        self.assertEqual(result.as_dict()['users'], 2)
+        self.assertEqual(models.Client.objects.count(), 6)
+        self.assertEqual(models.Contact.objects.count(), 12)
+        self.assertEqual(models.Activity.objects.count(), 24)
+        self.assertEqual(models.Activity.objects.filter(send_date__isnull=False).count(), result.sent)
+
+        user = User.objects.get(username='seed1')
+        client = models.Client.objects.for_user(user).first()
+        self.assertEqual(client.activity_count, 4)
+        self.assertEqual(client.contact_count, 2)
+        self.assertEqual(models.Activity.objects.for_user(user).count(), 12)
+        self.assertIn(client, search.search(user, client.name))
+
+        #Повторный запуск добавляет клиентов тем же пользователям
+        result = seed.seed(2, 1, 1, 1)
+        self.assertEqual(result.users, 0)
+        self.assertEqual(models.Client.objects.for_user(user).count(), 4)
+
+    def test_benchmark(self):
+        self.assertEqual(benchmark.percentile([3, 1, 2, 4], 50), 2)
+        self.assertEqual(benchmark.percentile([3, 1, 2, 4], 99), 4)
+
+        result = benchmark.run_scale(3, 2, 1, repeat=2)
+        self.assertEqual(result['objects']['clients'], 3)
+        self.assertEqual(len(result['endpoints']), len(benchmark.ENDPOINTS))
+        for endpoint in result['endpoints']:
+            self.assertEqual(endpoint['status'], [200], endpoint['name'])
+            self.assertGreater(endpoint['queries'], 0)
+            #Сессия и пользователь учитываются в каждом запросе
+            self.assertGreaterEqual(endpoint['queries'], 2, endpoint['name'])
+            self.assertLessEqual(endpoint['queries'], endpoint['query_budget'], endpoint['name'])
+        json.dumps(result)
+
+        #Страница входа без сессии не обращается к базе: такой результат не записывается
+        with self.assertRaises(benchmark.MeasurementError):
+            benchmark.measure(Client(), 'login', reverse('login'), {}, 1)
+        self.assertEqual(benchmark.measure(Client(), 'login', reverse('login'), {}, 1, cold=False)['queries'], 0)
+
+
+class LoadTestTest(TestCase):
+    def test_summarize(self):
+        samples = [('clients', 10.0, 200, False), ('clients', 30.0, 200, False),
+                   ('send activity', 20.0, 500, True), ('search', 40.0, 0, False)]
+        result = loadtest.summarize(samples, 2.0)
+        self.assertEqual(result['total']['requests'], 4)
+        self.assertEqual(result['total']['rps'], 2.0)
+        self.assertEqual(result['total']['p50_ms'], 20.0)
+        self.assertEqual(result['total']['errors'], 2)
+        self.assertEqual(result['total']['locked_rate'], 0.25)
+        self.assertEqual(result['actions']['clients']['requests'], 2)
+        self.assertEqual(result['actions']['send activity']['locked'], 1)
+
+    def test_locked_header(self):
+        def locked(environ, start_response):
+            try:
+                raise OperationalError('database is locked')
+            except OperationalError:
+                got_request_exception.send(sender=None, request=None)
+            start_response('500 Internal Server Error', [])
+            return []
+
+        def ok(environ, start_response):
+            start_response('200 OK', [])
+            return []
+
+        for app, expected in ((locked, True), (ok, False)):
+            responses = []
+            loadtest.LockReportingApplication(app)({}, lambda status, headers, exc_info=None:
+                                                   responses.append(dict(headers)))
+            self.assertEqual(loadtest.LOCKED_HEADER in responses[0], expected)
+
+
+class SqliteTest(TestCase):
+    def test_pragmas(self):
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            self.assertEqual(sqlite.pragma(cursor, 'busy_timeout'), 5000)
+            #NORMAL
+            self.assertEqual(sqlite.pragma(cursor, 'synchronous'), 1)
+            self.assertEqual(sqlite.pragma(cursor, 'cache_size'), -20000)
+
+    def test_maintenance(self):
+        if connection.vendor != 'sqlite':
+            return
+        models.Client(name='test', loyal=True).save()
+        result = sqlite.maintenance(vacuum_pages=10)
+        self.assertTrue(result['analyzed'])
+        self.assertIn('freed_pages', result)
+        self.assertIn('checkpoint', result)
+
+        out = StringIO()
+        call_command('sqlite_maintenance', '--no-vacuum', stdout=out)
+        self.assertIn('analyzed', out.getvalue())
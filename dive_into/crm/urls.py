@@ -1,21 +1,40 @@
 from django.conf.urls import url
 
-from . import views
+from . import views, api
 from django.contrib.auth.decorators import login_required
 app_name = 'crm'
 
 urlpatterns = [
     url(r'^$', views.MainPage.as_view(), name='main'),
 
-    url(r'clients/$', views.Clients.as_view(), name='clients'),
+    url(r'^api/v1/activities/send/$', api.SendActivities.as_view(), name='api_send_activities'),
+    url(r'^api/v1/activities/(?P<pk>[0-9]+)/send/$', api.SendActivity.as_view(), name='api_send_activity'),
+    url(r'^api/v1/(?P<kind>clients|contacts|activities)/$', api.ObjectList.as_view(), name='api_list'),
+    url(r'^api/v1/(?P<kind>clients|contacts|activities)/batch/$', api.Batch.as_view(), name='api_batch'),
+    url(r'^api/v1/(?P<kind>clients|contacts|activities)/(?P<pk>[0-9]+)/$', api.ObjectDetail.as_view(),
+        name='api_detail'),
+
+    url(r'^export/(?P<kind>clients|contacts|activities)/$', login_required(views.ExportData.as_view()),
+        name='export'),
+
+    url(r'^clients/$', views.Clients.as_view(), name='clients'),
+    url(r'^clients/data/$', views.ClientsData.as_view(), name='clients_data'),
     url(r'^clients/(?P<pk>[0-9]+)/$', views.DistinctClient.as_view(), name='client'),
     url(r'^clients/create', login_required(views.CreateClient.as_view()), name='new_client'),
 
+    url(r'^lookup/clients/$', login_required(views.ClientLookup.as_view()), name='lookup_clients'),
+    url(r'^lookup/contacts/$', login_required(views.ContactLookup.as_view()), name='lookup_contacts'),
+
+    url(r'^import/$', login_required(views.ImportData.as_view()), name='import'),
+
     url(r'^contacts/$', views.Contacts.as_view(), name='contacts'),
+    url(r'^contacts/data/$', views.ContactsData.as_view(), name='contacts_data'),
     url(r'^contacts/(?P<pk>[0-9]+)/$', views.DistinctContact.as_view(), name='contact'),
-    url(r'contacts/create', login_required(views.CreateContact.as_view()), name='new_contact'),
+    url(r'^contacts/create', login_required(views.CreateContact.as_view()), name='new_contact'),
 
     url(r'^activities/$', views.Activities.as_view(), name='activities'),
+    url(r'^activities/data/$', views.ActivitiesData.as_view(), name='activities_data'),
+    url(r'^activities/send/$', login_required(views.SendActivities.as_view()), name='send_activities'),
     url(r'^activities/(?P<pk>[0-9]+)/$', views.DistinctActivity.as_view(), name='activity'),
-    url(r'activities/create', login_required(views.CreateActivity.as_view()), name='new_activity')
+    url(r'^activities/create', login_required(views.CreateActivity.as_view()), name='new_activity')
 ]
\ No newline at end of file
@@ -4,35 +4,57 @@
 from django.shortcuts import render, redirect
 from django.views import generic
 from django.core.urlresolvers import reverse
-from django.http import Http404
-from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.core.exceptions import PermissionDenied
+from django.db.models import Prefetch, Q, prefetch_related_objects
+from django.template.defaultfilters import date as date_filter
+from django.utils.html import conditional_escape, format_html
 
-from .models import Client, Contact, Activity
-from .forms import ContactCreation, ClientCreation, ActivityCreation
+from .models import Client, Contact, Activity, StaleObjectError
+from .forms import STALE_MESSAGE, ContactCreation, ClientCreation, ActivityCreation, ImportForm, ExportForm
+from . import search, importer, exporter
+from .cache import CachedPage, ConditionalPage
 
 
 class NoOwnerError(Exception):
     pass
 
 
-class MainPage(generic.View):
+def get_int(data, key, default):
+    try:
+        return int(data.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class MainPage(CachedPage, generic.View):
     """
     Отвечает за отображение главной страницы системы,
-    поддверживает получение get запросов с указанным именем клиента для поиска
-    и отображения
+    поддверживает получение get запросов со строкой поиска по клиентам,
+    контактам и активностям пользователя (см. search.py)
     """
     template = 'crm/main.html'
     model = Client
+    paginate_by = 20
+    cache_session_keys = ('deleted_data',)
 
     def get(self, request):
         context = {}
         if request.GET.get('search', None):
             if self.request.user.is_authenticated():
-                clients = self.model.objects.filter(name__icontains=request.GET.get('search', ''),
-                                                    owner=request.user)
-
-                if clients:
-                    context['search_clients'] = clients
+                page = max(get_int(request.GET, 'page', 1), 1)
+                # Запрашиваем на один объект больше, чтобы понять, есть ли следующая страница
+                results = search.search(request.user, request.GET['search'],
+                                        offset=(page - 1) * self.paginate_by, limit=self.paginate_by + 1)
+                context['search_has_next'] = len(results) > self.paginate_by
+                results = results[:self.paginate_by]
+
+                if results:
+                    context['search_clients'] = [i for i in results if isinstance(i, Client)]
+                    context['search_contacts'] = [i for i in results if isinstance(i, Contact)]
+                    context['search_activities'] = [i for i in results if isinstance(i, Activity)]
+                    context['search_page'] = page
+                    context['search_query'] = request.GET['search']
                 else:
                     context['search_clients'] = 'no result'
             else:
@@ -58,14 +80,23 @@ class Distinct(generic.UpdateView):
             return redirect(reverse('crm:{}'.format(self.distinct_template), kwargs={'pk': self.kwargs['pk']}))
 
     def get_object(self, queryset=None):
-        try:
-            object_get = self.model.objects.get(pk=self.kwargs['pk'])
-        except ObjectDoesNotExist:
-            raise Http404("No object found matching this query")
-
-        if self.request.user.is_authenticated():
-            if object_get.owner == self.request.user:
-                return object_get
+        """
+        Объект текущего пользователя по pk одним запросом, запоминается на время
+        запроса. None - объект есть, но принадлежит другому пользователю
+        (post в этом случае выбрасывает NoOwnerError, dispatch перенаправляет
+        на страницу объекта).
+
+        Условие владельца входит в запрос объекта: сравнение object.owner
+        с пользователем загружало бы еще и строку auth_user. Запоминание
+        нужно потому, что post вызывает get_object и сам, и через UpdateView.
+        Второй запрос (существует ли объект вообще) выполняется только для
+        чужого или несуществующего pk, чтобы отличить 404 от перенаправления
+        """
+        if not hasattr(self, '_object'):
+            self._object = self.model.objects.for_user(self.request.user).filter(pk=self.kwargs['pk']).first()
+            if self._object is None and not self.model.objects.filter(pk=self.kwargs['pk']).exists():
+                raise Http404("No object found matching this query")
+        return self._object
 
     def get_form_kwargs(self):
         """
@@ -94,6 +125,16 @@ class Distinct(generic.UpdateView):
         else:
             return super(Distinct, self).post(request, *args, **kwargs)
 
+    def form_valid(self, form):
+        """
+        Объект успели изменить другим запросом - показываем форму с ошибкой
+        """
+        try:
+            return super(Distinct, self).form_valid(form)
+        except StaleObjectError:
+            form.add_error(None, STALE_MESSAGE)
+            return self.form_invalid(form)
+
     def get_success_url(self):
         return reverse('crm:{}'.format(self.distinct_template), kwargs={'pk': self.kwargs['pk']})
 
@@ -123,27 +164,121 @@ class Creation(generic.CreateView):
 
 
 class List(generic.ListView):
+    """
+    Класс для наследования ListView, отображает только объекты текущего
+    пользователя. В html отдается только первая страница таблицы,
+    остальные страницы DataTables запрашивает у соответствующего DataTable
+    представления
+    """
+    paginate_by = 10
+
     def get_queryset(self):
-        if self.request.user.is_authenticated():
-            return self.model.objects.filter(owner=self.request.user)
+        return self.model.objects.for_user(self.request.user).order_by('pk')
+
 
+class DataTable(object):
+    """
+    Примесь к наследникам List: отдает json для DataTables в режиме serverSide.
+    Поиск, сортировка и выборка страницы выполняются в базе, поэтому размер
+    ответа не зависит от количества объектов пользователя.
+
+    columns - по одному кортежу (поле для сортировки, поле для поиска)
+    на каждый столбец таблицы, None - если столбец не сортируется/не ищется.
 
-class Clients(List):
+    Наследник определяет get_row(obj) - список ячеек строки таблицы,
+    DataTables вставляет их как html, поэтому все, что не размечено через
+    format_html, экранируется
+    """
+    columns = ()
+    max_length = 100
+    # параметры draw и _ у каждого запроса DataTables свои, кэш бесполезен
+    cache_enabled = False
+    conditional_enabled = False
+
+    def search_queryset(self, queryset, params):
+        search_fields = [searchable for order, searchable in self.columns if searchable]
+        value = params.get('search[value]', '').strip()
+        if value and search_fields:
+            condition = Q()
+            for field in search_fields:
+                condition |= Q(**{'{}__icontains'.format(field): value})
+            queryset = queryset.filter(condition)
+
+        for i, (order, searchable) in enumerate(self.columns):
+            value = params.get('columns[{}][search][value]'.format(i), '').strip()
+            if value and searchable:
+                queryset = queryset.filter(**{'{}__icontains'.format(searchable): value})
+        return queryset
+
+    def order_queryset(self, queryset, params):
+        ordering = []
+        i = 0
+        while 'order[{}][column]'.format(i) in params:
+            column = get_int(params, 'order[{}][column]'.format(i), -1)
+            if 0 <= column < len(self.columns) and self.columns[column][0]:
+                prefix = '-' if params.get('order[{}][dir]'.format(i)) == 'desc' else ''
+                ordering.append(prefix + self.columns[column][0])
+            i += 1
+        # pk в конце сортировки - чтобы страницы не пересекались при равных значениях
+        return queryset.order_by(*(ordering + ['pk']))
+
+    def get(self, request, *args, **kwargs):
+        params = request.GET
+        queryset = self.get_queryset()
+        total = queryset.count()
+
+        filtered_queryset = self.search_queryset(queryset, params)
+        filtered = total if filtered_queryset is queryset else filtered_queryset.count()
+
+        start = max(get_int(params, 'start', 0), 0)
+        length = get_int(params, 'length', self.paginate_by)
+        if not 0 < length <= self.max_length:
+            length = self.max_length
+        page = self.order_queryset(filtered_queryset, params)[start:start + length]
+
+        return JsonResponse({'draw': get_int(params, 'draw', 0),
+                             'recordsTotal': total,
+                             'recordsFiltered': filtered,
+                             'data': [[conditional_escape(cell) for cell in self.get_row(obj)]
+                                      for obj in page]})
+
+
+class Clients(ConditionalPage, CachedPage, List):
     """
     Отображает список всех клиентов в системе
     """
     model = Client
+    conditional_models = (Client,)
     template_name = 'crm/clients.html'
     context_object_name = 'clients_list'
 
 
-class DistinctClient(Distinct):
+class ClientsData(DataTable, Clients):
+    """
+    Данные для таблицы клиентов
+    """
+    columns = (('name', 'name'),
+               ('loyal', None),
+               ('activity_count', None),
+               ('last_sent_at', None),
+               ('contact_count', None))
+
+    def get_row(self, client):
+        return [format_html(u'<a href="{}">{}</a>', reverse('crm:client', args=(client.id,)), client.name),
+                u'{}'.format(client.loyal),
+                client.activity_count,
+                client.last_activity() or u'',
+                client.contact_count]
+
+
+class DistinctClient(ConditionalPage, CachedPage, Distinct):
     """
     Отображает информацию по клиенту, позволяет редактировать
     информацию клиента, а так же удалять его
     """
     form_class = ClientCreation
     model = Client
+    conditional_models = (Client, Contact, Activity)
     template_name = 'crm/client_detail.html'
     all_template = 'clients'
     distinct_template = 'client'
@@ -156,6 +291,23 @@ class DistinctClient(Distinct):
         """
         return generic.UpdateView.get_form_kwargs(self)
 
+    def get_context_data(self, **kwargs):
+        """
+        Контакты и активности клиента (вместе с контактами активностей)
+        загружаем заранее и передаем в шаблон списками, чтобы шаблон
+        не обращался к базе при каждом выводе
+        """
+        context = super(DistinctClient, self).get_context_data(**kwargs)
+        if self.object:
+            activities = Activity.objects.select_related('contact').only(
+                'title', 'send_date', 'client', 'version', 'contact__email', 'contact__version').order_by(
+                'send_date', 'pk')
+            prefetch_related_objects([self.object], 'contact_set',
+                                     Prefetch('activity_set', queryset=activities))
+            context['contacts'] = list(self.object.contact_set.all())
+            context['activities'] = list(self.object.activity_set.all())
+        return context
+
 
 class CreateClient(Creation):
     """
@@ -175,22 +327,91 @@ class CreateClient(Creation):
         return generic.CreateView.get_form_kwargs(self)
 
 
-class Contacts(List):
+class ImportData(generic.FormView):
+    """
+    Импорт клиентов и контактов текущего пользователя из загруженного
+    CSV файла (формат описан в importer.py), на странице показывается
+    итог импорта и ошибки по строкам
+    """
+    form_class = ImportForm
+    template_name = 'crm/import.html'
+
+    def form_valid(self, form):
+        try:
+            result = importer.import_csv(form.cleaned_data['file'], self.request.user)
+        except importer.CsvImportError as error:
+            form.add_error('file', str(error))
+            return self.form_invalid(form)
+        return self.render_to_response(self.get_context_data(form=ImportForm(), result=result))
+
+
+class ExportData(generic.View):
+    """
+    Потоковая выгрузка клиентов, контактов или активностей текущего
+    пользователя (см. exporter.py), параметры: format (csv/jsonl),
+    date_from и date_to (YYYY-MM-DD)
+    """
+    def get(self, request, kind):
+        form = ExportForm(request.GET)
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=400)
+        fmt = form.cleaned_data['format'] or 'csv'
+        lines = exporter.export(kind, request.user, fmt,
+                                form.cleaned_data['date_from'], form.cleaned_data['date_to'])
+        response = StreamingHttpResponse(lines, content_type=exporter.FORMATS[fmt])
+        response['Content-Disposition'] = 'attachment; filename="{}.{}"'.format(kind, fmt)
+        return response
+
+
+class Contacts(ConditionalPage, CachedPage, List):
     """
     Отображает список всех контактов в системе
     """
     model = Contact
+    conditional_models = (Contact, Client)
     template_name = 'crm/contacts.html'
     context_object_name = 'contacts_list'
 
+    def get_queryset(self):
+        """
+        Клиента получаем тем же запросом, выбираем только отображаемые в таблице поля
+        """
+        return super(Contacts, self).get_queryset().select_related('client').only(
+            'first_name', 'last_name', 'email', 'phone', 'active', 'version', 'client__name', 'client__version')
 
-class DistinctContact(Distinct):
+
+class ContactsData(DataTable, Contacts):
+    """
+    Данные для таблицы контактов
+    """
+    columns = (('first_name', 'first_name'),
+               ('last_name', 'last_name'),
+               ('email', 'email'),
+               ('phone', None),
+               ('active', None),
+               ('client__name', 'client__name'))
+
+    def get_row(self, contact):
+        client = u''
+        if contact.client:
+            client = format_html(u'<a href="{}">{}</a>',
+                                 reverse('crm:client', args=(contact.client.id,)), contact.client.name)
+        return [format_html(u'<a href="{}">{}</a>', reverse('crm:contact', args=(contact.id,)), contact.first_name),
+                contact.last_name,
+                contact.email,
+                contact.phone,
+                u'{}'.format(contact.active),
+                client]
+
+
+class DistinctContact(ConditionalPage, CachedPage, Distinct):
     """
     Отображает информацию по контакту, позволяет редактировать
     информацию контакта, а так же удалять его
     """
     form_class = ContactCreation
     model = Contact
+    conditional_models = (Contact, Client)
     template_name = 'crm/contact_detail.html'
     all_template = 'contacts'
     distinct_template = 'contact'
@@ -206,16 +427,116 @@ class CreateContact(Creation):
     url = 'contact'
 
 
-class Activities(List):
+class Activities(ConditionalPage, CachedPage, List):
     """
     Отображает список всех активностей в системе
     """
     model = Activity
+    conditional_models = (Activity, Client, Contact)
     template_name = 'crm/activities.html'
     context_object_name = 'activities_list'
+    cache_session_keys = ('sent_activities',)
+
+    def get_queryset(self):
+        """
+        Клиента и контакт получаем тем же запросом, текст активности
+        и прочие неотображаемые поля не загружаем
+        """
+        return super(Activities, self).get_queryset().select_related('client', 'contact').only(
+            'title', 'send_date', 'version', 'client__name', 'client__version', 'contact__email', 'contact__version')
+
+    def get_context_data(self, **kwargs):
+        context = super(Activities, self).get_context_data(**kwargs)
+        if self.request.session.get('sent_activities', None) is not None:
+            context['sent_activities'] = self.request.session['sent_activities']
+            self.request.session['sent_activities'] = None
+        return context
+
+
+class ActivitiesData(DataTable, Activities):
+    """
+    Данные для таблицы активностей
+    """
+    columns = (('client__name', 'client__name'),
+               ('title', 'title'),
+               ('contact__email', 'contact__email'),
+               ('send_date', None),
+               (None, None),
+               (None, None))
+
+    def get_row(self, activity):
+        select = u''
+        if not activity.is_send():
+            select = format_html(u'<input type="checkbox" name="activity" value="{}" form="send_activities">', activity.id)
+        return [format_html(u'<a href="{}">{}</a>',
+                            reverse('crm:client', args=(activity.client.id,)), activity.client.name),
+                activity.title,
+                format_html(u'<a href="{}">{}</a>',
+                            reverse('crm:contact', args=(activity.contact.id,)), activity.contact.email),
+                date_filter(activity.send_date, "Y.m.d H:i"),
+                format_html(u'<a href="{}">Show</a>', reverse('crm:activity', args=(activity.id,))),
+                select]
+
+
+class SendActivities(generic.View):
+    """
+    Массовая отправка активностей со страницы списка: выбранные или все
+    неотправленные активности пользователя отправляются одним запросом,
+    количество отправленных показывается на странице списка
+    """
+    def post(self, request):
+        activities = Activity.objects.for_user(request.user)
+        if request.POST.get('all', ''):
+            sent = activities.send()
+        else:
+            sent = activities.send_selected(i for i in request.POST.getlist('activity') if i.isdigit())
+        request.session['sent_activities'] = sent
+        return redirect(reverse('crm:activities'))
+
+
+class Lookup(generic.View):
+    """
+    Варианты для полей форм с LookupSelect (см. forms.py): объекты текущего
+    пользователя постранично в json {'results': [{'id', 'text'}], 'more'}.
+    Наследник определяет get_queryset() - упорядоченные варианты
+    """
+    paginate_by = 20
+
+    def get(self, request):
+        page = max(get_int(request.GET, 'page', 1), 1)
+        start = (page - 1) * self.paginate_by
+        # На один объект больше, чтобы понять, есть ли следующая страница
+        objects = list(self.get_queryset()[start:start + self.paginate_by + 1])
+        return JsonResponse({'results': [{'id': obj.pk, 'text': u'{}'.format(obj)}
+                                         for obj in objects[:self.paginate_by]],
+                             'more': len(objects) > self.paginate_by})
+
+
+class ClientLookup(Lookup):
+    """
+    Клиенты пользователя по началу имени (параметр q)
+    """
+    def get_queryset(self):
+        clients = Client.objects.for_user(self.request.user).only('name')
+        text = self.request.GET.get('q', '').strip()
+        if text:
+            clients = clients.filter(name__istartswith=text)
+        return clients.order_by('name', 'pk')
+
+
+class ContactLookup(Lookup):
+    """
+    Активные контакты клиента пользователя (параметр client)
+    """
+    def get_queryset(self):
+        client_id = get_int(self.request.GET, 'client', None)
+        if client_id is None:
+            return Contact.objects.none()
+        return Contact.objects.for_user(self.request.user).filter(
+            client_id=client_id, active=True).only('first_name', 'email', 'client').order_by('pk')
 
 
-class DistinctActivity(Distinct):
+class DistinctActivity(ConditionalPage, CachedPage, Distinct):
     """
     Отображает информацию по активности, позволяет редактировать
     информацию о активности, а так же удалять ее, при этом удаление и
@@ -224,16 +545,18 @@ class DistinctActivity(Distinct):
     """
     form_class = ActivityCreation
     model = Activity
+    conditional_models = (Activity, Client, Contact)
     template_name = 'crm/activity_detail.html'
     all_template = 'activities'
     distinct_template = 'activity'
 
     def post(self, request, *args, **kwargs):
         if request.POST.get('action', '') == 'Send':
-            activity = self.get_object()
-            activity.send()
-            activity.save()
-            return redirect(reverse('crm:activity', kwargs={'pk': activity.id}))
+            # Один UPDATE ... WHERE send_date IS NULL, без загрузки активности
+            sent = Activity.objects.for_user(request.user).filter(pk=self.kwargs['pk']).send()
+            if not sent and self.get_object() is None:
+                raise NoOwnerError
+            return redirect(reverse('crm:activity', kwargs={'pk': self.kwargs['pk']}))
         else:
             return super(DistinctActivity, self).post(request, *args, **kwargs)
 
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Прогрев процесса при загрузке WSGI приложения (settings.CRM_WARMUP):
+компиляция всех шаблонов crm и шаблонов проекта, построение URL resolver
+и проверка соединений с базой, чтобы первый запрос к новому процессу
+выполнялся так же быстро, как последующие.
+
+Шаблоны остаются в памяти только с cached loader (settings_production).
+Соединения после проверки закрываются: сервер может загрузить приложение
+до fork (gunicorn --preload, uwsgi без lazy-apps), и соединение SQLite
+унаследовали бы все рабочие процессы
+"""
+import logging
+import os
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.template import engines, TemplateDoesNotExist, TemplateSyntaxError
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+
+def template_names():
+    """
+    Имена всех шаблонов из templates приложения crm и каталогов DIRS
+    """
+    directories = [os.path.join(apps.get_app_config('crm').path, 'templates')]
+    for options in settings.TEMPLATES:
+        directories.extend(options.get('DIRS', []))
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            for name in sorted(files):
+                if name.endswith('.html'):
+                    yield os.path.relpath(os.path.join(root, name), directory).replace(os.sep, '/')
+
+
+def compile_templates():
+    count = 0
+    for engine in engines.all():
+        for name in template_names():
+            try:
+                engine.get_template(name)
+                count += 1
+            except (TemplateDoesNotExist, TemplateSyntaxError) as error:
+                logger.warning('Template %s was not compiled: %s', name, error)
+    return count
+
+
+def build_urls():
+    """
+    Строит обратные словари корневого resolver и всех пространств имен
+    """
+    resolvers = [get_resolver()]
+    count = 0
+    while resolvers:
+        resolver = resolvers.pop()
+        count += len(resolver.reverse_dict)
+        resolvers.extend(namespace_resolver for prefix, namespace_resolver in resolver.namespace_dict.values())
+    return count
+
+
+def connect():
+    """
+    Открывает соединение с каждой базой (ошибки настройки видны при запуске,
+    а не в первом запросе) и закрывает его, каждый процесс откроет свое
+    """
+    for connection in connections.all():
+        connection.ensure_connection()
+        # Соединение внутри транзакции (тесты) закрывать нельзя
+        if not connection.in_atomic_block:
+            connection.close()
+    return len(connections.all())
+
+
+def run():
+    """
+    Выполняет прогрев, возвращает словарь: этап -> (количество, секунды)
+    """
+    result = {}
+    for name, step in (('templates', compile_templates), ('urls', build_urls), ('databases', connect)):
+        started = time.time()
+        result[name] = (step(), time.time() - started)
+    logger.info('Warm-up: %s', ', '.join('{} {} in {:.3f}s'.format(count, name, seconds)
+                                         for name, (count, seconds) in sorted(result.items())))
+    return result
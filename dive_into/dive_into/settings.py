@@ -42,6 +42,7 @@ INSTALLED_APPS = (
 )
 
 MIDDLEWARE_CLASSES = (
+    'crm.querycount.QueryCountMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -80,9 +81,17 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        # Persistent connections: PRAGMAs (crm/sqlite.py) run once per connection
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', 60)),
     }
 }
 
+# Every new SQLite connection runs the PRAGMAs from crm/sqlite.py PRAGMAS
+# (WAL, busy_timeout, synchronous=NORMAL, cache and mmap sizes). To change
+# them, set CRM_SQLITE_PRAGMAS to a full tuple of (name, value) pairs.
+# Maintenance: `manage.py sqlite_maintenance` (ANALYZE, incremental VACUUM,
+# WAL checkpoint), e.g. hourly from cron
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/1.8/topics/i18n/
@@ -105,3 +114,79 @@ STATIC_URL = '/static/'
 LOGIN_REDIRECT_URL = '/crm/'
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
+
+# Email: activities are delivered by `manage.py run_outbox_worker`.
+# For local development run `python -m smtpd -n -c DebuggingServer localhost:1025`
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 1025))
+DEFAULT_FROM_EMAIL = 'crm@localhost'
+CRM_OUTBOX_BATCH_SIZE = 100
+CRM_OUTBOX_MAX_ATTEMPTS = 5
+CRM_OUTBOX_RETRY_DELAY = 60
+
+# CSV import (`manage.py import_csv`, crm:import)
+CRM_IMPORT_BATCH_SIZE = 500
+
+# Streaming export (`manage.py export_data`, crm:export): rows fetched per query
+CRM_EXPORT_CHUNK_SIZE = 2000
+
+# Page cache of crm (see crm/cache.py). CRM_CACHE_BACKEND selects the storage:
+# locmem (per process, only for a single process server), file (shared by
+# processes on one host, default of settings_production) or memcached
+# (requires python-memcached and a memcached on CRM_CACHE_LOCATION)
+CRM_CACHE = 'crm'
+CRM_CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'crm'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', os.path.join(BASE_DIR, '.crm_cache')),
+    'memcached': ('django.core.cache.backends.memcached.MemcachedCache', '127.0.0.1:11211'),
+}
+_crm_cache_backend, _crm_cache_location = CRM_CACHE_BACKENDS[os.environ.get('CRM_CACHE_BACKEND', 'locmem')]
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    CRM_CACHE: {
+        'BACKEND': _crm_cache_backend,
+        'LOCATION': os.environ.get('CRM_CACHE_LOCATION', _crm_cache_location),
+        'TIMEOUT': 3600,
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+# Release version (e.g. the deployed revision): part of page cache keys and
+# ETags, so a deploy that changes templates invalidates both
+CRM_RELEASE = os.environ.get('CRM_RELEASE', '')
+# Whole pages are cached only if CRM_PAGE_CACHE (off in production with locmem)
+CRM_PAGE_CACHE = True
+
+# Lifetime of cached table rows ({% row_cache %}), rows are keyed by version
+CRM_ROW_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Warm-up of WSGI workers on import (crm/warmup.py), enabled in settings_production
+CRM_WARMUP = os.environ.get('CRM_WARMUP', '0') == '1'
+
+# SQL queries per request (crm/querycount.py): warnings in the log for
+# views over their query budget or repeating a query (N+1),
+# X-CRM-Queries/X-CRM-Query-Time/X-CRM-Repeated-Queries response headers
+CRM_QUERY_COUNT = os.environ.get('CRM_QUERY_COUNT', '0') == '1'
+CRM_QUERY_HEADERS = CRM_QUERY_COUNT
+CRM_QUERY_BUDGET = 12
+# Per url name; QueryBudgetTest fails when a page goes over its budget
+CRM_QUERY_BUDGETS = {
+    'crm:main': 6,
+    'crm:clients': 5,
+    'crm:contacts': 6,
+    'crm:activities': 7,
+    'crm:clients_data': 5,
+    'crm:contacts_data': 5,
+    'crm:activities_data': 5,
+    'crm:client': 8,
+    'crm:contact': 7,
+    'crm:activity': 8,
+    'crm:new_client': 2,
+    'crm:new_contact': 2,
+    'crm:new_activity': 2,
+    'crm:lookup_clients': 3,
+    'crm:lookup_contacts': 3,
+    'crm:api_list': 3,
+}
+CRM_QUERY_REPEAT_LIMIT = 3
@@ -0,0 +1,48 @@
+"""
+Production settings for dive_into project.
+
+Usage: DJANGO_SETTINGS_MODULE=dive_into.settings_production
+Templates are compiled once per process (cached loader), database connections
+are reused between requests and every WSGI worker warms up on import
+(see crm/warmup.py). The page cache is kept in files shared by the workers
+(CRM_CACHE_BACKEND=memcached for several hosts).
+Static files are collected with hashed names and precompressed copies
+(crm/storage.py); set CRM_SERVE_STATIC=1 to serve them from the WSGI
+application (crm/staticserve.py).
+"""
+from .settings import *  # noqa
+
+DEBUG = False
+
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY', SECRET_KEY)
+
+ALLOWED_HOSTS = [host for host in os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost').split(',') if host]
+
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+
+DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DJANGO_CONN_MAX_AGE', 600))
+
+CRM_WARMUP = os.environ.get('CRM_WARMUP', '1') == '1'
+
+STATICFILES_STORAGE = 'crm.storage.CompressedManifestStaticFilesStorage'
+
+CRM_SERVE_STATIC = os.environ.get('CRM_SERVE_STATIC', '0') == '1'
+
+CRM_QUERY_HEADERS = False
+
+# Generation counters of the page cache (crm/cache.py) must be shared by all
+# worker processes: with the per-process locmem backend a write invalidates
+# only the worker that handled it. Pages are not cached if locmem is chosen
+_crm_cache_name = os.environ.get('CRM_CACHE_BACKEND', 'file')
+_crm_cache_backend, _crm_cache_location = CRM_CACHE_BACKENDS[_crm_cache_name]
+CACHES[CRM_CACHE].update({
+    'BACKEND': _crm_cache_backend,
+    'LOCATION': os.environ.get('CRM_CACHE_LOCATION', _crm_cache_location),
+})
+CRM_PAGE_CACHE = _crm_cache_name != 'locmem'
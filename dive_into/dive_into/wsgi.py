@@ -15,4 +15,14 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "dive_into.settings")
 
 application = get_wsgi_application()
 
+# Warm-up (templates, URL resolver, database check) before the first request
+from django.conf import settings
 
+if getattr(settings, 'CRM_WARMUP', False):
+    from crm import warmup
+    warmup.run()
+
+# Static files from STATIC_ROOT without a separate web server (see crm/staticserve.py)
+if getattr(settings, 'CRM_SERVE_STATIC', False):
+    from crm.staticserve import StaticFilesApplication
+    application = StaticFilesApplication(application)